@@ -119,45 +119,32 @@ def create_gmask_node(selection, gmask_type):
         selected_node_sockets = flame.batch.current_node.get_value().sockets
 
         # Find node connected to front socket
-        connected_node_pos_x = ''
+        connected_node = None
         for n in selected_node_sockets.values():
             if isinstance(n, dict):
                 for k, v in n.items():
-                    if 'Front' in k:
-                        try:
-                            connected_node_name = str(v)[2:-2]
-                            # Match socket value to node in batch
-                            for node in flame.batch.nodes:
-                                if str(node.name)[1:-1] == connected_node_name:
-                                    connected_node = node
-                                    connected_node_pos_x = int(str(connected_node.pos_x))
-                                    break
-                        except:
-                            pass
-
-        # Create gmask tracer node
-        gmask_node = flame.batch.create_node(gmask_type)
+                    if 'Front' in k and v:
+                        connected_node = flame.batch.get_node(str(v)[2:-2])
 
-        if connected_node_pos_x != '':
-            gmask_node.pos_x = int((connected_node_pos_x - selected_node.pos_x)/2 + selected_node.pos_x)
+        # Position gmask node between selected node and node connected to its front socket
+        selected_node_pos_x = int(str(selected_node.pos_x))
+        if connected_node:
+            offset_x = int((int(str(connected_node.pos_x)) - selected_node_pos_x) / 2)
         else:
-            gmask_node.pos_x = int(selected_node.pos_x - 250)
-
-        gmask_node.pos_y = int(selected_node.pos_y - 100)
+            offset_x = -250
 
         # Get selected node matte input socket name
         for socket in selected_node.input_sockets:
             if 'Matte' in socket:
                 selected_node_socket = socket
 
-        # Connect gmask tracer node
-        flame.batch.connect_nodes(gmask_node, 'Default', selected_node, selected_node_socket)
-
-        # Connect gmask tracer front if node connected to selected node
-        try:
-            flame.batch.connect_nodes(connected_node, 'Default', gmask_node, 'Default')
-        except:
-            pass
+        # Create and connect gmask node
+        graph = PyFlameBatchGraph()
+        graph.add_node('gmask', gmask_type, relative_to=selected_node, offset=(offset_x, -100))
+        graph.connect('gmask', 'Default', selected_node, selected_node_socket)
+        if connected_node:
+            graph.connect(connected_node, 'Default', 'gmask', 'Default')
+        graph.build()
 
     def add_at_cursor_position():
         """
@@ -131,26 +131,14 @@ def add_mux_freeze(selection):
 
     pyflame.print('MUX Node Added to Batch Frozen at Current Frame', text_color=TextColor.GREEN)
 
-def name_node(node_type, node_num=0):
+def name_node(node_type):
 
-    existing_node_list = []
+    # MUX nodes are always numbered from 0 (mux0, mux1...)
+    # Freeze frame nodes are numbered from 1 after the first (freeze_frame, freeze_frame1...)
+    if node_type == 'mux':
+        return PyFlameNameAllocator.from_batch(start=0).allocate(node_type, numbered=True)
 
-    for item in flame.batch.nodes:
-        existing_node = item.name
-        existing_node_list.append(existing_node)
-
-    node_name = 'freeze_frame' + str(node_num)
-    node_name = node_type + str(node_num)
-
-    if node_name.endswith('e0'):
-        node_name = node_name[:-1]
-
-    if node_name not in existing_node_list:
-        node_name = node_name
-        return node_name
-    else:
-        node_num = node_num + 1
-        return name_node(node_type, node_num)
+    return PyFlameNameAllocator.from_batch().allocate(node_type)
 
 def position_mux(mux_node, selection):
 
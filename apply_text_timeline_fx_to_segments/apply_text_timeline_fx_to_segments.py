@@ -38,6 +38,7 @@ To Install:
 import datetime as dt
 import os
 import re
+import time
 import xml.etree.ElementTree as et
 from functools import partial
 
@@ -53,6 +54,7 @@ MESSAGE_PREFIX = '[PYTHON]'
 DEFAULT_PATH = '/opt/Autodesk/project'
 DEFAULT_PATTERN = '<project>/text/flame/<name>.ttg'
 PRESET_FOLDER = '~/.config/apply-text-timelinefx-to-segments'
+PROGRESS_INTERVAL = 0.1  # seconds between progress window updates
 XML = 'apply_text_timeline_fx_to_segments.xml'
 
 
@@ -876,37 +878,40 @@ class FlameTokenPushButton(QtWidgets.QPushButton):
         token_action_menu()
 
 
-class FlameTableWidget(QtWidgets.QTableWidget):
-    """Custom Qt Widget Flame Table Widget v1.0.0
+class FlameTableView(QtWidgets.QTableView):
+    """Custom Qt Widget Flame Table View v1.0.0
+
+    Styled like the Flame table widget, but displays any item model.  Sorting is
+    enabled, so the model should normally be a QSortFilterProxyModel.
 
     Attributes:
-        column_headers: list of headers for the table
+        model: model to display in the table
 
     Usage:
-        flame_table = FlameTableWidget(['header1', 'header2'])
+        flame_table = FlameTableView(proxy_model)
     """
 
-    def __init__(self, column_headers):
+    def __init__(self, model):
         super().__init__()
 
+        self.setModel(model)
         self.setMinimumSize(500, 250)
-        self.setColumnCount(len(column_headers))
-        self.setRowCount(1)
         self.setAlternatingRowColors(True)
         self.setSortingEnabled(True)
+        self.sortByColumn(0, QtCore.Qt.AscendingOrder)
         self.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
-        self.setHorizontalHeaderLabels(column_headers)
+        self.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
         self.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 background-color: rgb(33, 33, 33);
                 alternate-background-color: rgb(36, 36, 36);
                 color: rgb(190, 190, 190);
                 font: 14px 'Discreet';
                 gridline-color: rgb(33, 33, 33)}
-            QTableWidget::item {
+            QTableView::item {
                 border: 0px 10px 0px 0px;
                 padding: 0px 15px 0px 5px}
-            QTableWidget::item:selected {
+            QTableView::item:selected {
                 color: #d9d9d9;
                 background-color: #474747}
             QHeaderView::section {
@@ -930,44 +935,109 @@ class FlameTableWidget(QtWidgets.QTableWidget):
                     border: 0px;
                     padding 0px}""")
 
-    def add_item(self, row, column, item):
-        """Add row if necessary, then add item to column."""
-        if row + 1 > self.rowCount():
-            self.insertRow(row)
+    def get_selected_source_rows(self):
+        """Convenience method to get the source model rows that are selected.
 
-        self.setItem(row, column, QtWidgets.QTableWidgetItem(item))
-
-    def get_data_by_row_number(self, row_num):
-        """Convenience method to get data from specific row number.
+        Rows hidden by the proxy filter are never part of the selection.
 
         Returns:
-            A list of the data per column.
+            A list of row numbers in the source model, in the order displayed.
         """
-        data = []
+        proxy = self.model()
+        # selectedRows() is in selection order, so sort by proxy row for display order.
+        indexes = sorted(self.selectionModel().selectedRows(), key=lambda index: index.row())
+        rows = [proxy.mapToSource(index).row() for index in indexes]
+        return rows
 
-        for column in range(self.columnCount()):
-            data.append(self.model().data(self.model().index(row_num, column)))
 
-        return data
+class SegmentTableModel(QtCore.QAbstractTableModel):
+    """Table model holding one row per segment.
 
-    def get_selected_row_data(self):
-        """Convenience method to get data from selected rows.
+    Each row is keyed by the index of its segment in the list passed in, so the
+    segment for a row never has to be searched for.  The filename column is the
+    only column that changes after the model is built, and updating it only emits
+    dataChanged for that column.
 
-        Returns:
-            A list containing a list for each selected row.
+    Attributes:
+        column_headers: list of headers for the table
+        rows: list of lists, one per segment, with the text for each column
+    """
+
+    FILENAME_COLUMN = 5
+    MISSING_COLOR = QtGui.QColor(190, 34, 34)
+
+    def __init__(self, column_headers, rows):
+        super().__init__()
+
+        self.column_headers = column_headers
+        self.rows = rows
+        self.exists = [True] * len(rows)
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        """Number of segments, or 0 for child indexes since the table is flat."""
+        if parent.isValid():
+            return 0
+        return len(self.rows)
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        """Number of columns, or 0 for child indexes since the table is flat."""
+        if parent.isValid():
+            return 0
+        return len(self.column_headers)
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        """Return text for the cell, or red text if the setup file is missing."""
+        if role == QtCore.Qt.DisplayRole:
+            return self.rows[index.row()][index.column()]
+        if role == QtCore.Qt.ForegroundRole:
+            if (index.column() == self.FILENAME_COLUMN and
+                    not self.exists[index.row()]):
+                return self.MISSING_COLOR
+        return None
+
+    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
+        """Return the column headers."""
+        if role == QtCore.Qt.DisplayRole and orientation == QtCore.Qt.Horizontal:
+            return self.column_headers[section]
+        return None
+
+    def filename(self, row):
+        """Return the filename for the segment in row."""
+        return self.rows[row][self.FILENAME_COLUMN]
+
+    def set_filenames(self, filenames):
+        """Update the filename column and whether each file exists.
+
+        os.path.isfile is only called once per distinct filename, and dataChanged is
+        only emitted for the span of rows that actually changed.
+
+        Args:
+            filenames: list of filenames, one per row
         """
-        data = []
+        exists_cache = {}
+        first = last = None
 
-        for row in self.selectionModel().selectedRows():  # row is QModelIndex object
-            row_data = []
+        for row, filename in enumerate(filenames):
+            if filename not in exists_cache:
+                exists_cache[filename] = os.path.isfile(filename)
+            exists = exists_cache[filename]
 
-            if not self.isRowHidden(row.row()):
-                for column in range(self.columnCount()):
-                    row_data.append(
-                            self.model().data(self.model().index(row.row(), column)))
-                data.append(row_data)
+            if (self.rows[row][self.FILENAME_COLUMN] == filename and
+                    self.exists[row] == exists):
+                continue
 
-        return data
+            self.rows[row][self.FILENAME_COLUMN] = filename
+            self.exists[row] = exists
+
+            if first is None:
+                first = row
+            last = row
+
+        if first is not None:
+            self.dataChanged.emit(
+                    self.index(first, self.FILENAME_COLUMN),
+                    self.index(last, self.FILENAME_COLUMN),
+                    [QtCore.Qt.DisplayRole, QtCore.Qt.ForegroundRole])
 
 
 class FindSegmentApplyText:
@@ -1101,8 +1171,12 @@ class FindSegmentApplyText:
 
         self.message(f'Found {len(self.segments)} segments')
 
-    def generate_segment_tokens(self, segment):
-        """Populate the token list."""
+    def generate_segment_tokens(self, segment_name, sequence_name):
+        """Populate the token list.
+
+        The segment and sequence names are passed in rather than read from the
+        segment, so the table can rebuild filenames without calling the Flame API.
+        """
         self.segment_tokens['am/pm'] = [
                 '<pp>', self.now.strftime('%p').lower()]
         self.segment_tokens['AM/PM'] = [
@@ -1120,9 +1194,9 @@ class FindSegmentApplyText:
         self.segment_tokens['Project'] = [
                 '<project>', flame.project.current_project.name]
         self.segment_tokens['Segment Name'] = [
-                '<segment name>', segment.name.get_value()]
+                '<segment name>', segment_name]
         self.segment_tokens['Sequence Name'] = [
-                '<name>', self.get_parent_sequence(segment).name.get_value()]
+                '<name>', sequence_name]
         self.segment_tokens['User'] = [
                 '<user>', flame.users.current_user.name]
         self.segment_tokens['Year'] = [
@@ -1147,26 +1221,58 @@ class FindSegmentApplyText:
         """
         return os.path.join(self.path, *self.resolve_tokens().split(os.sep))
 
+    @staticmethod
+    def group_rows_by_setup(rows, filenames):
+        """Group table rows by the text setup they resolve to.
+
+        Args:
+            rows: list of row numbers in the table model
+            filenames: callable returning the setup filename for a row number
+
+        Returns:
+            Dict of {setup filename: [row numbers]} in order of first appearance.
+        """
+        groups = {}
+
+        for row in rows:
+            groups.setdefault(filenames(row), []).append(row)
+
+        return groups
+
+    @staticmethod
+    def read_text_setup(text_setup):
+        """Read a text setup once to confirm it exists and is readable.
+
+        Returns:
+            Empty string if readable, otherwise the reason it could not be read.
+        """
+        if not os.path.isfile(text_setup):
+            return 'File does not exist'
+
+        try:
+            with open(text_setup, 'rb') as setup_file:
+                setup_file.read()
+        except OSError as error:
+            return error.strerror or 'Could not read file'
+
+        return ''
+
     def apply_text_fx_to_segment(self, segment, text_setup):
-        """Apply Text TimelineFX to segment, then load setup."""
+        """Apply Text TimelineFX to segment, then load setup.
+
+        text_setup should already be verified with read_text_setup and encoded to
+        ascii, since load_setup will not take utf-8.
+        """
         for effect in segment.effects:
             if effect.type == 'Text':
                 flame.delete(effect)
 
         segment_text_fx = segment.create_effect('Text')
 
-        self.message(f'Loading {text_setup}')
-
-        if os.path.isfile(text_setup):
-            try:
-                # load_setup will not take utf-8, only ascii
-                segment_text_fx.load_setup(text_setup.encode('ascii', 'ignore'))
-            except RuntimeError:
-                self.message('Error loading setup!')
-            else:
-                self.message('Successfully loaded!')
-        else:
-            self.message('File does not exist!')
+        try:
+            segment_text_fx.load_setup(text_setup)
+        except RuntimeError:
+            self.message('Error loading setup!')
 
     def save_preset_window(self):
         """Smaller window with save dialog."""
@@ -1390,27 +1496,77 @@ class FindSegmentApplyText:
             self.save_preset_window()
 
         def okay_button():
-            """Close window and process the artist's selected selection."""
+            """Close window and process the artist's selected selection.
+
+            Selected segments are grouped by text setup.  Each setup is read once
+            before any segment is touched, so unreadable setups are reported up
+            front, then the segments are processed one setup at a time.
+            """
+            selected_rows = self.segments_table.get_selected_source_rows()
+            setups = self.group_rows_by_setup(
+                    selected_rows, self.segments_model.filename)
+
+            unreadable = {}
+
+            for text_setup in setups:
+                error = self.read_text_setup(text_setup)
+                if error:
+                    unreadable[text_setup] = error
+                    self.message(f'{error}: {text_setup}')
+
+            if unreadable:
+                skipped = sum(len(setups[text_setup]) for text_setup in unreadable)
+                if not FlameMessageWindow(
+                        'Unreadable Setups', 'warning',
+                        f'{len(unreadable)} of {len(setups)} text setups could not '
+                        f'be read.  {skipped} segments using them will be '
+                        'skipped.<br/><br/>'
+                        + '<br/>'.join(
+                            f'{error}: {text_setup}'
+                            for text_setup, error in unreadable.items())
+                        + '<br/><br/>Continue with the remaining segments?',
+                        self.window):
+                    return
+                for text_setup in unreadable:
+                    del setups[text_setup]
+
             self.window.close()
 
-            row_data = self.segments_table.get_selected_row_data()
+            total = sum(len(rows) for rows in setups.values())
+            self.progress_window = FlameProgressWindow('Progress', total)
 
-            self.progress_window = FlameProgressWindow(
-                    'Progress', len(row_data))
+            count = 0
+            last_update = 0
 
-            for row in row_data:
+            for text_setup, rows in setups.items():
                 if self.progress_window.cancelled:
                     break
 
-                self.message(f'Proceeding with {row[2]} in {row[1]} at {row[3]}')
+                self.message(f'Loading {text_setup} to {len(rows)} segments')
+
+                # load_setup will not take utf-8, only ascii
+                text_setup_ascii = text_setup.encode('ascii', 'ignore')
+
+                for row_num in rows:
+                    if self.progress_window.cancelled:
+                        break
 
-                self.progress_window.set_text(
-                        f'Apply Text TimlineFX to {row[2]} in {row[1]} at {row[3]}')
+                    row = self.segments_model.rows[row_num]
 
-                self.apply_text_fx_to_segment(self.segments[int(row[0]) - 1], row[5])
+                    self.message(f'Proceeding with {row[2]} in {row[1]} at {row[3]}')
 
-                self.progress_window.set_progress_value(
-                        row_data.index(row) + 1)
+                    self.apply_text_fx_to_segment(
+                            self.segments[row_num], text_setup_ascii)
+
+                    count += 1
+                    now = time.monotonic()
+
+                    if now - last_update >= PROGRESS_INTERVAL or count == total:
+                        last_update = now
+                        self.progress_window.set_text(
+                                f'Apply Text TimlineFX to {row[2]} in {row[1]} at '
+                                f'{row[3]}')
+                        self.progress_window.set_progress_value(count)
 
             self.progress_window.close()
 
@@ -1426,25 +1582,21 @@ class FindSegmentApplyText:
 
         def filter_table():
             """Updates the table when anything is typed in the Find bar."""
-            for num in range(self.segments_table.rowCount()):
-                if self.find in self.segments_table.get_data_by_row_number(num)[2]:
-                    self.segments_table.showRow(num)
-                else:
-                    self.segments_table.hideRow(num)
+            self.segments_proxy.setFilterFixedString(self.find)
 
         def update_filename_column():
-            """Update the filename column when the filename line edit is changed."""
-            for count, segment in enumerate(self.segments):
-                self.generate_segment_tokens(segment)
-                self.segments_table.add_item(count, 5, self.assemble_filename())
+            """Update the filename column when the filename line edit is changed.
 
-        def verify_filename_column_exists():
-            """Check if filename for text setup exists, if not, color cell text red."""
-            for row in range(self.segments_table.rowCount()):
-                if not os.path.isfile(
-                        self.segments_table.get_data_by_row_number(row)[5]):
-                    self.segments_table.item(row, 5).setData(
-                            QtCore.Qt.ForegroundRole, QtGui.QColor(190, 34, 34))
+            Uses the names already stored in the model, so no Flame API calls.  The
+            model also colors the filename red if the setup does not exist.
+            """
+            filenames = []
+
+            for row in self.segments_model.rows:
+                self.generate_segment_tokens(row[2], row[1])
+                filenames.append(self.assemble_filename())
+
+            self.segments_model.set_filenames(filenames)
 
         def find_changed():
             """Everything to refresh when the find line edit is changed."""
@@ -1455,15 +1607,13 @@ class FindSegmentApplyText:
             """Everything to refresh when the path line edit is changed."""
             self.path = self.path_line_edit.text()
             update_filename_column()
-            self.segments_table.resizeColumnsToContents()
-            verify_filename_column_exists()
+            self.segments_table.resizeColumnToContents(5)
 
         def pattern_changed():
             """Everything to refresh when the pattern line edit is changed."""
             self.pattern = self.pattern_line_edit.text()
             update_filename_column()
-            self.segments_table.resizeColumnsToContents()
-            verify_filename_column_exists()
+            self.segments_table.resizeColumnToContents(5)
 
         def find_toggle():
             """Toggle UI elements based on find."""
@@ -1485,24 +1635,32 @@ class FindSegmentApplyText:
             filter_table()
 
         def populate_table():
-            """Fill in the table."""
+            """Build the table model.
+
+            Each segment is read from the Flame API once here.  Row number in the
+            model is the index of the segment in self.segments.
+            """
+            rows = []
+
             for count, segment in enumerate(self.segments):
-                self.generate_segment_tokens(segment)
-                self.segments_table.add_item(
-                        count, 0, str(count + 1).zfill(4))
-                self.segments_table.add_item(
-                        count, 1, self.get_parent_sequence(segment).name.get_value())
-                self.segments_table.add_item(
-                        count, 2, segment.name.get_value())
-                self.segments_table.add_item(
-                        count, 3, segment.record_in.timecode)
-                self.segments_table.add_item(
-                        count, 4, segment.record_out.timecode)
-                self.segments_table.add_item(
-                        count, 5, self.assemble_filename())
-
-            verify_filename_column_exists()
-            self.segments_table.resizeColumnsToContents()
+                sequence_name = self.get_parent_sequence(segment).name.get_value()
+                segment_name = segment.name.get_value()
+                self.generate_segment_tokens(segment_name, sequence_name)
+                rows.append([
+                        str(count + 1).zfill(4),
+                        sequence_name,
+                        segment_name,
+                        segment.record_in.timecode,
+                        segment.record_out.timecode,
+                        ''])
+
+            self.segments_model = SegmentTableModel(self.table_columns, rows)
+            update_filename_column()
+
+            self.segments_proxy = QtCore.QSortFilterProxyModel()
+            self.segments_proxy.setSourceModel(self.segments_model)
+            self.segments_proxy.setFilterKeyColumn(2)
+            self.segments_proxy.setFilterCaseSensitivity(QtCore.Qt.CaseSensitive)
 
         self.window = QtWidgets.QWidget()
 
@@ -1539,10 +1697,10 @@ class FindSegmentApplyText:
         self.find_line_edit.textChanged.connect(find_changed)
 
         # Table
-        self.segments_table = FlameTableWidget(self.table_columns)
-        self.segments_table.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
         populate_table()
         filter_table()
+        self.segments_table = FlameTableView(self.segments_proxy)
+        self.segments_table.resizeColumnsToContents()
 
         # Buttons
         self.btn_preset = FlamePushButtonMenu(
@@ -87,10 +87,8 @@ class AutoScaleXMLs():
         if self.simple_flame_version <= '2026':
             full_project_path = flame.projects.current_project.project_folder
             self.project_tmp_path = re.sub(r"^/hosts/[^/]+", "", full_project_path) + '/tmp'
-            self.action_path = f"{self.project_tmp_path}/auto_xml_temp.action"
             self.res_file_location = Path(f"{self.project_tmp_path}/auto_scale_resolution_list.json")
         else:
-            self.action_path = f"/opt/Autodesk/project/{self.project_name}/tmp/auto_xml_temp.action"
             self.res_file_location = Path(f"/opt/Autodesk/project/{self.project_name}/tmp/auto_scale_resolution_list.json")
 
         # Create/Load config file settings.
@@ -313,57 +311,58 @@ class AutoScaleXMLs():
                 return
         print ("\n","Passed Track and Segment Check.","\n")
 
-        if not os.path.split(self.action_path):
-            self.action_path = '/var/tmp/auto_xml_temp.action'      
+        # Action setups are round tripped through a unique temp folder, in RAM when possible
+        with PyFlameTempFiles(prefix='auto_scale_xmls') as temp_files:
 
-        # Only copy actions for the primary version
-        if primary_version:
+            # Only copy actions for the primary version
+            if primary_version:
 
-            track_count = -1                
+                track_count = -1                
             
-            for track in primary_version.tracks:
-                track_list.append(str(track))
-                track_count = track_count + 1
-                segment_count = -1                       
+                for track in primary_version.tracks:
+                    track_list.append(str(track))
+                    track_count = track_count + 1
+                    segment_count = -1                       
 
-                for segment in track.segments:
-                    segment_count = segment_count + 1
+                    for segment in track.segments:
+                        segment_count = segment_count + 1
 
-                    for tlfx in segment.effects:
-                        if tlfx.type == 'Action':
-                            resolution = f"{segment.source_width}x{segment.source_height}"
+                        for tlfx in segment.effects:
+                            if tlfx.type == 'Action':
+                                resolution = f"{segment.source_width}x{segment.source_height}"
             
-                            for seq in self.selection:
-                                if resolution in str(seq.name):
-                                    target_sequence = seq
-
-                            if target_sequence:
-                                target_segment = target_sequence.versions[0].tracks[int(track_count)].segments[int(segment_count)]
-                                for tlfx in target_segment.effects:
-                                    if tlfx.type == 'Action':
-                                        tlfx.save_setup(self.action_path)
-                                        for tlfx in segment.effects:
-                                            if tlfx.type == 'Action':
-                                                flame.delete(tlfx)
-                                                action_fx = segment.create_effect('Action')
-                                                action_fx.load_setup(self.action_path)
-                                                # tlfx.load_setup(self.action_path)
-                                                segment.colour = (50,50,50)
-                                target_sequence = None
-
-                            else:
-                                print("Didn't find a matching sequence.")
-                                if resolution not in skip_list:
-                                    skip_list.append(resolution)
-                                    PyFlameMessageWindow(title='Missing Conform', message=f'Cannot find a sequence with "{resolution}" in the name.', type=MessageType.ERROR )
+                                for seq in self.selection:
+                                    if resolution in str(seq.name):
+                                        target_sequence = seq
+
+                                if target_sequence:
+                                    target_segment = target_sequence.versions[0].tracks[int(track_count)].segments[int(segment_count)]
+                                    for tlfx in target_segment.effects:
+                                        if tlfx.type == 'Action':
+                                            action_path = temp_files.path('auto_xml_temp', '.action')
+                                            tlfx.save_setup(action_path)
+                                            for tlfx in segment.effects:
+                                                if tlfx.type == 'Action':
+                                                    flame.delete(tlfx)
+                                                    action_fx = segment.create_effect('Action')
+                                                    action_fx.load_setup(action_path)
+                                                    # tlfx.load_setup(action_path)
+                                                    segment.colour = (50,50,50)
+                                    target_sequence = None
+
+                                else:
+                                    print("Didn't find a matching sequence.")
+                                    if resolution not in skip_list:
+                                        skip_list.append(resolution)
+                                        PyFlameMessageWindow(title='Missing Conform', message=f'Cannot find a sequence with "{resolution}" in the name.', type=MessageType.ERROR )
                     
-            # Delete everything except for the first item in the selection
-            for item in self.selection[1:]:
-                flame.delete(item)
+                # Delete everything except for the first item in the selection
+                for item in self.selection[1:]:
+                    flame.delete(item)
     
-        else:
-            print("Can't find a Version with the Primary Track.")
-            return
+            else:
+                print("Can't find a Version with the Primary Track.")
+                return
 
 
         print('[=========', f'{SCRIPT_NAME} {SCRIPT_VERSION} - Auto Scale Complete', '=========]\n')
@@ -45,6 +45,7 @@ Custom QT Windows:
 Utility Functions:
 
     PyFlameConfig - Class for reading/writing config files.
+    PyFlameTempFiles - Unique, automatically cleaned up temp paths for setup save/load round trips.
 
     pyflame.message_print - Print messages to terminal and Flame message area.
     pyflame.generate_unique_node_names - Generate unique node names based on a list of existing node names.
@@ -290,6 +291,7 @@ import platform
 import re
 import shutil
 import subprocess
+import tempfile
 import xml.etree.ElementTree as ET
 from enum import Enum
 from functools import partial
@@ -2223,6 +2225,143 @@ class PyFlameConfig:
         with open(config_path, 'r') as f:
             return json.load(f)
 
+class PyFlameTempFiles:
+    """
+    PyFlameTempFiles
+    ================
+
+    Hands out unique scratch paths for setup save/load round trips.
+
+    Each instance gets its own folder, so two Flame sessions, or two operations in the same
+    session, never write to the same file. The folder is created in RAM backed `/dev/shm` when it
+    is available, otherwise in the system temp folder. The folder and everything in it is deleted
+    on cleanup unless `keep` is True.
+
+    Args
+    ----
+        `prefix` (str, optional):
+            Prefix of the temp folder name. The process id is added to the prefix.
+            (Default: `SCRIPT_NAME`)
+
+        `keep` (bool, optional):
+            Keep the temp folder and its files after cleanup for debugging. Path is printed.
+            (Default: `False`)
+
+    Properties
+    ----------
+        `folder` (str):
+            Path to the temp folder. Created on first use.
+
+    Methods
+    -------
+        `path(name: str='setup', extension: str='')` -> str:
+            Return a new unique path inside the temp folder.
+
+        `cleanup()`:
+            Delete the temp folder unless `keep` is True.
+
+    Examples
+    --------
+        Save and reload a Timeline FX setup:
+        ```
+        with PyFlameTempFiles() as temp_files:
+            for segment in segments:
+                setup_path = temp_files.path('action', '.action')
+                action_fx.save_setup(setup_path)
+                ...
+                action_fx.load_setup(setup_path)
+        ```
+    """
+
+    def __init__(self, prefix: str=SCRIPT_NAME, keep: bool=False) -> None:
+
+        # Validate Arguments
+        if not isinstance(prefix, str):
+            raise TypeError(f"PyFlameTempFiles: Expected 'prefix' to be a string, got {type(prefix).__name__} instead.")
+        if not isinstance(keep, bool):
+            raise TypeError(f"PyFlameTempFiles: Expected 'keep' to be a bool, got {type(keep).__name__} instead.")
+
+        self.prefix = re.sub(r'[^\w.-]', '_', prefix.strip().lower())
+        self.keep = keep
+        self._folder = None
+        self._count = 0
+
+    def __enter__(self) -> 'PyFlameTempFiles':
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback) -> bool:
+
+        self.cleanup()
+
+        # Don't suppress exceptions
+        return False
+
+    @staticmethod
+    def temp_root() -> str:
+        """
+        Temp Root
+        =========
+
+        Return `/dev/shm` if it is a writable folder, otherwise the system temp folder.
+        """
+
+        if os.path.isdir('/dev/shm') and os.access('/dev/shm', os.W_OK | os.X_OK):
+            return '/dev/shm'
+        return tempfile.gettempdir()
+
+    @property
+    def folder(self) -> str:
+
+        if self._folder is None:
+            self._folder = tempfile.mkdtemp(prefix=f'{self.prefix}_{os.getpid()}_', dir=self.temp_root())
+        return self._folder
+
+    def path(self, name: str='setup', extension: str='') -> str:
+        """
+        Path
+        ====
+
+        Return a new unique path inside the temp folder. The file is not created.
+
+        Args
+        ----
+            `name` (str):
+                Base name of the file.
+                (Default: `setup`)
+
+            `extension` (str):
+                Extension added to the file name, including the dot.
+                (Default: `''`)
+
+        Returns
+        -------
+            str:
+                Unique path in the temp folder.
+        """
+
+        self._count += 1
+        return os.path.join(self.folder, f'{name}_{self._count:04d}{extension}')
+
+    def cleanup(self) -> None:
+        """
+        Cleanup
+        =======
+
+        Delete the temp folder unless `keep` is True. Paths handed out after cleanup go in a new
+        temp folder.
+        """
+
+        if self._folder is None:
+            return
+
+        if self.keep:
+            print(f'PyFlameTempFiles: Temp files kept: {self._folder}')
+        else:
+            shutil.rmtree(self._folder, ignore_errors=True)
+
+        self._folder = None
+
 # -------------------------------- PyFlame Widget Classes -------------------------------- #
 
 class PyFlameButton(QtWidgets.QPushButton):
@@ -131,9 +131,11 @@ Updates:
 # [Imports]
 #-------------------------------------
 
+import json
 import os
 import re
 import shutil
+import threading
 from functools import partial
 
 import flame
@@ -146,6 +148,313 @@ from lib.pyflame_lib_batch_nodes import *
 SCRIPT_NAME = 'Batch Nodes'
 SCRIPT_VERSION = 'v3.11.0'
 SCRIPT_PATH = os.path.abspath(os.path.dirname(__file__))
+CATALOGUE_PATH = os.path.join(SCRIPT_PATH, 'config', 'node_catalogue.json')
+MENUS_DIR = '/opt/Autodesk/shared/python/batch_nodes/menus'
+MENU_REGISTRY_PATH = os.path.join(MENUS_DIR, 'menus.json')
+
+#-------------------------------------
+# [Menu Registry]
+#-------------------------------------
+
+def load_menu_registry() -> dict:
+    """
+    Load Menu Registry
+    ==================
+
+    Load batch node menus from MENU_REGISTRY_PATH.
+
+    Each menu is stored by menu name as a dict with:
+        node_type: Batch node type to create.
+        shader: Matchbox shader path for Matchbox nodes, otherwise empty.
+        setup: Saved node setup path for menus created from a selected node, otherwise empty.
+
+    Returns:
+    --------
+        dict: Menus by menu name. Empty if registry does not exist or can't be read.
+    """
+
+    try:
+        with open(MENU_REGISTRY_PATH, 'r') as registry_file:
+            return json.load(registry_file)
+    except (OSError, ValueError):
+        return {}
+
+def save_menu_registry(menus: dict) -> None:
+    """
+    Save Menu Registry
+    ==================
+
+    Save batch node menus to MENU_REGISTRY_PATH sorted by menu name.
+    """
+
+    os.makedirs(MENUS_DIR, exist_ok=True)
+
+    with open(MENU_REGISTRY_PATH, 'w') as registry_file:
+        json.dump(dict(sorted(menus.items())), registry_file, indent=4)
+
+def migrate_menu_scripts(menus: dict) -> bool:
+    """
+    Migrate Menu Scripts
+    ====================
+
+    Move menus from generated python menu files made by older versions of Batch Nodes into the menu registry and delete
+    the menu files.
+
+    Returns:
+    --------
+        bool: True if any menu files were migrated.
+    """
+
+    migrated = False
+
+    for file_name in sorted(os.listdir(MENUS_DIR)):
+        if not file_name.endswith('.py'):
+            continue
+
+        menu_script_path = os.path.join(MENUS_DIR, file_name)
+
+        with open(menu_script_path, 'r') as menu_script:
+            script = menu_script.read()
+
+        create_node = re.search(r"flame\.batch\.create_node\('([^']*)'(?:, '([^']*)')?\)", script)
+        menu_name = re.search(r"'name': '([^']*)',\s*'execute': scope_node", script)
+        if not create_node or not menu_name:
+            continue
+
+        setup = re.search(r"load_node_setup\('([^']*)'\)", script)
+
+        menus[menu_name.group(1)] = {
+            'node_type': create_node.group(1),
+            'shader': create_node.group(2) or '',
+            'setup': setup.group(1) if setup else '',
+            }
+
+        os.remove(menu_script_path)
+        if os.path.isfile(menu_script_path + 'c'):
+            os.remove(menu_script_path + 'c')
+
+        pyflame.print(f'Menu Migrated: {menu_name.group(1)}')
+        migrated = True
+
+    return migrated
+
+def create_menu_node(menu_name: str, menu: dict, selection) -> None:
+    """
+    Create Menu Node
+    ================
+
+    Create node for batch node menu. Node is connected to each selected node, or created at the cursor position if
+    nothing is selected.
+    """
+
+    pyflame.print_title(f'{SCRIPT_NAME} - {menu_name} {SCRIPT_VERSION}')
+
+    names = PyFlameNameAllocator.from_batch()
+
+    def create_node():
+        if menu['shader']:
+            new_node = flame.batch.create_node(menu['node_type'], menu['shader'])
+        else:
+            new_node = flame.batch.create_node(menu['node_type'])
+        if menu['setup']:
+            new_node.load_node_setup(menu['setup'])
+            new_node.name = names.allocate(menu_name)
+        return new_node
+
+    if selection == ():
+        new_node = create_node()
+        cursor_pos = flame.batch.cursor_position
+        new_node.pos_x = cursor_pos[0]
+        new_node.pos_y = cursor_pos[1]
+    else:
+        for selected_node in selection:
+            if isinstance(selected_node, flame.PyNode):
+                new_node = create_node()
+                new_node.pos_x = selected_node.pos_x + 300
+                new_node.pos_y = selected_node.pos_y
+                flame.batch.connect_nodes(selected_node, 'Default', new_node, 'Default')
+
+    pyflame.print(f'Node Created: {menu_name}', text_color=TextColor.GREEN)
+
+#-------------------------------------
+# [Node Catalogue]
+#-------------------------------------
+
+class NodeCatalogue(QtCore.QObject):
+    """
+    Node Catalogue
+    ==============
+
+    Cache of Batch node types and Matchbox/LOGIK shader directory listings, saved to CATALOGUE_PATH between sessions.
+
+    Node types are cached per Flame version. Directory listings are cached with the directory mtime. Cached listings
+    are returned right away and the directory is checked in a background thread. It is only listed again if its mtime
+    changed, and the callback is called with the new listing.
+    """
+
+    directory_scanned = QtCore.Signal(str, str, float, list)
+
+    def __init__(self, flame_version: str) -> None:
+
+        super().__init__()
+
+        self.flame_version = flame_version
+        self.callbacks = {}
+
+        self.cache = self.load()
+
+        self.directory_scanned.connect(self.update_directory)
+
+    def load(self) -> dict:
+        """
+        Load
+        ====
+
+        Load cache file. Cache is discarded if it is unreadable or was saved by a different Flame version.
+        """
+
+        try:
+            with open(CATALOGUE_PATH, 'r') as cache_file:
+                cache = json.load(cache_file)
+        except (OSError, ValueError):
+            cache = {}
+
+        if cache.get('flame_version') != self.flame_version:
+            cache = {'flame_version': self.flame_version}
+
+        cache.setdefault('directories', {})
+
+        return cache
+
+    def save(self) -> None:
+        """
+        Save
+        ====
+
+        Save cache file.
+        """
+
+        try:
+            os.makedirs(os.path.dirname(CATALOGUE_PATH), exist_ok=True)
+            with open(CATALOGUE_PATH, 'w') as cache_file:
+                json.dump(self.cache, cache_file)
+        except OSError as e:
+            pyflame.print(f'Could Not Save Node Catalogue: {e}', text_color=TextColor.YELLOW)
+
+    def node_types(self) -> list:
+        """
+        Node Types
+        ==========
+
+        Get Batch node types. Flame is only asked once per Flame version.
+        """
+
+        if 'node_types' not in self.cache:
+            self.cache['node_types'] = list(flame.batch.node_types)
+            self.save()
+
+        return self.cache['node_types']
+
+    @staticmethod
+    def scan(directory: str, extension: str) -> tuple:
+        """
+        Scan
+        ====
+
+        List shader names in directory.
+
+        Returns:
+        --------
+            tuple: Directory mtime and sorted list of file names with extension, without extension.
+        """
+
+        try:
+            mtime = os.stat(directory).st_mtime
+            files = os.listdir(directory)
+        except OSError:
+            return 0.0, []
+
+        return mtime, sorted(f[:-len(extension)] for f in files if f.endswith(extension) and not f.startswith('.'))
+
+    def files(self, directory: str, extension: str, callback) -> list:
+        """
+        Files
+        =====
+
+        Get shader names in directory.
+
+        If the directory is cached, the cached listing is returned and the directory is checked in the background.
+        callback is called with the new listing if the directory changed. If the directory is not cached, it is
+        listed now.
+
+        Args:
+        -----
+            directory (str): Directory to list.
+            extension (str): Shader file extension, i.e. '.mx'.
+            callback (callable): Called with updated list of names if the directory changed.
+
+        Returns:
+        --------
+            list: Shader names without extension.
+        """
+
+        key = f'{directory}|{extension}'
+        cached = self.cache['directories'].get(key)
+
+        if cached is None:
+            mtime, names = self.scan(directory, extension)
+            self.cache['directories'][key] = {'mtime': mtime, 'files': names}
+            self.save()
+            return names
+
+        self.callbacks[key] = callback
+
+        thread = threading.Thread(target=self.refresh, args=(directory, extension, cached['mtime']), daemon=True)
+        thread.start()
+
+        return cached['files']
+
+    def refresh(self, directory: str, extension: str, cached_mtime: float) -> None:
+        """
+        Refresh
+        =======
+
+        Runs in background thread. List directory again if its mtime changed.
+        """
+
+        try:
+            mtime = os.stat(directory).st_mtime
+        except OSError:
+            mtime = 0.0
+
+        if mtime == cached_mtime:
+            return
+
+        mtime, names = self.scan(directory, extension)
+
+        self.directory_scanned.emit(directory, extension, mtime, names)
+
+    def update_directory(self, directory: str, extension: str, mtime: float, names: list) -> None:
+        """
+        Update Directory
+        ================
+
+        Runs in main thread. Store new listing and pass it to the callback.
+        """
+
+        key = f'{directory}|{extension}'
+
+        self.cache['directories'][key] = {'mtime': mtime, 'files': names}
+        self.save()
+
+        pyflame.print(f'Node Catalogue Updated: {directory}')
+
+        callback = self.callbacks.pop(key, None)
+        if callback:
+            try:
+                callback(names)
+            except RuntimeError:
+                pass # List widget was closed
 
 #-------------------------------------
 # [Main Script]
@@ -162,13 +471,10 @@ class BatchNodes:
             return
 
         #  Init variables
-        self.create_node_line = ''
+        self.node_type = ''
+        self.shader = ''
         self.selection = selection
 
-        # Set paths
-        self.save_selected_template = os.path.join(SCRIPT_PATH, 'assets/templates', 'save_selected')
-        self.create_node_template = os.path.join(SCRIPT_PATH, 'assets/templates', 'create_node')
-
         # Create/Load config file settings.
         self.settings = self.load_config()
 
@@ -177,12 +483,21 @@ class BatchNodes:
         self.current_user = flame.users.current_user.name
         self.matchbox_path = f'/opt/Autodesk/presets/{self.flame_version}/matchbox/shaders'
 
-        # Check/create folder to store node scripts in user python folder
-        self.node_dir = os.path.join('/opt/Autodesk/shared/python/batch_nodes/menus')
+        # Cached node types and shader lists
+        self.catalogue = NodeCatalogue(self.flame_version)
+
+        # Check/create folder to store menu registry and saved node setups in user python folder
+        self.node_dir = MENUS_DIR
         if not os.path.isdir(self.node_dir):
             os.makedirs(self.node_dir)
             pyflame.print(f'Created User Node Folder: {self.node_dir}', text_color=TextColor.GREEN)
 
+        # Load menus, moving any menu files from older versions into the registry
+        self.menus = load_menu_registry()
+        if migrate_menu_scripts(self.menus):
+            save_menu_registry(self.menus)
+            pyflame.refresh_hooks()
+
         if not os.path.isdir(self.settings.logik_path):
             pyflame.print('Logik Matchbox Path No Longer Exists. Set New Path In Setup.', text_color=TextColor.YELLOW)
             self.settings.logik_path = '/'
@@ -257,7 +572,8 @@ class BatchNodes:
             # Create scripts for nodes in selected list
             for node in self.batch_node_list.selected_items:
                 self.node_name = node.text()
-                self.create_node_line = f"new_node = flame.batch.create_node('{self.node_name}')"
+                self.node_type = self.node_name
+                self.shader = ''
                 self.create_node()
 
             # Refresh node menu lists
@@ -330,7 +646,8 @@ class BatchNodes:
 
                 matchbox_node_path = os.path.join(self.matchbox_path, node.text())
 
-                self.create_node_line = f"new_node = flame.batch.create_node('Matchbox', '{matchbox_node_path}.mx')"
+                self.node_type = 'Matchbox'
+                self.shader = f'{matchbox_node_path}.mx'
 
                 self.create_node()
 
@@ -406,7 +723,8 @@ class BatchNodes:
                 logik_node_path = os.path.join(self.settings.logik_path, node.text())
                 print ('Logik Node Path:', logik_node_path)
 
-                self.create_node_line = f"new_node = flame.batch.create_node('Matchbox', '{logik_node_path}.glsl')"
+                self.node_type = 'Matchbox'
+                self.shader = f'{logik_node_path}.glsl'
 
                 self.create_node()
 
@@ -499,7 +817,7 @@ class BatchNodes:
         Get list of batch nodes from Flame.
         """
 
-        for node in flame.batch.node_types:
+        for node in self.catalogue.node_types():
             bad_nodes = 'Colour Blend', 'Matte Blend' # bad_nodes crash flame when connecting
             if node not in bad_nodes:
                 self.batch_node_list.addItem(node)
@@ -512,14 +830,8 @@ class BatchNodes:
         Get list of matchboxes from matchbox path.
         """
 
-        matchboxes = os.listdir(self.matchbox_path)
-        matchboxes.sort()
-
-        for m in matchboxes:
-            if not m.startswith('.'):
-                if m.endswith('.mx'):
-                    m = m[:-3]
-                    self.matchbox_node_list.addItem(m)
+        matchboxes = self.catalogue.files(self.matchbox_path, '.mx', self.matchbox_node_list.replace_items)
+        self.matchbox_node_list.replace_items(matchboxes)
 
     def get_logik_list(self):
         """
@@ -529,10 +841,7 @@ class BatchNodes:
         Get list of logik matchboxes from logik matchbox path and add to list widget.
         """
 
-        logik_matchboxes = os.listdir(self.settings.logik_path)
-        logik_matchboxes.sort()
-
-        glsl_files = [f[:-5] for f in logik_matchboxes if f.endswith('.glsl')]
+        glsl_files = self.catalogue.files(self.settings.logik_path, '.glsl', self.logik_node_list.replace_items)
         self.logik_node_list.replace_items(glsl_files)
 
     def done_button(self):
@@ -550,39 +859,19 @@ class BatchNodes:
 
     def get_node_scripts_lists(self, listbox, folder):
 
-        #  Get list of scripts for nodes
-        listbox.clear()
-
-        item_list = os.listdir(folder)
-        item_list.sort()
-
-        for item in item_list:
-            if item.endswith('.py'):
-                item = item[:-3]
-
-                listbox.addItem(item)
+        #  Get list of node menus
+        listbox.replace_items(sorted(self.menus))
 
     def remove_scripts(self, listbox):
 
-        # Delete script files
-        selected_nodes = listbox.selected_items
+        # Remove menus from registry and delete saved node setups
+        for node in listbox.selected_items:
+            menu = self.menus.pop(node.text(), None)
+            if menu and menu['setup']:
+                shutil.rmtree(os.path.dirname(menu['setup']), ignore_errors=True)
+            pyflame.print(f'{node.text()}: Deleted', text_color=TextColor.RED)
 
-        selected_node_text = []
-
-        for node in selected_nodes:
-            node = node.text()
-            selected_node_text.append(node)
-
-        file_list = os.listdir(self.node_dir)
-
-        for node in selected_node_text:
-            for f in file_list:
-                if node in f:
-                    try:
-                        os.remove(os.path.join(self.node_dir, f))
-                    except:
-                        shutil.rmtree(os.path.join(self.node_dir, f))
-                    pyflame.print(f'{f}: Deleted', text_color=TextColor.RED)
+        save_menu_registry(self.menus)
 
         self.get_node_scripts_lists(self.batch_node_menu_list, self.node_dir)
         self.get_node_scripts_lists(self.matchbox_node_menu_list, self.node_dir)
@@ -594,50 +883,24 @@ class BatchNodes:
 
         def rename():
 
-            def edit_menu_file(new_menu_name):
-
-                # Edit python menu file to change menu name
-                menu_script_path = os.path.join(self.node_dir, selected_menu + '.py')
-
-                menu_lines = open(menu_script_path, 'r')
-                lines = menu_lines.read().splitlines()
-
-                menu_lines.close()
+            def rename_node_files(new_menu_name):
 
-                for l in lines:
-                    if selected_menu in l:
-                        if 'flame.batch.create_node' not in l:
-                            line_index = lines.index(l)
-                            new_line = l.replace(selected_menu, new_menu_name)
-                            lines[line_index] = new_line
+                # Rename saved node setup directory and files if menu was created from a selected node
+                menu = self.menus[new_menu_name]
+                if not menu['setup']:
+                    return
 
-                out_file = open(menu_script_path, 'w')
-                for line in lines:
-                    print(line, file=out_file)
-                out_file.close()
+                current_dir = os.path.dirname(menu['setup'])
+                new_dir = os.path.join(os.path.dirname(current_dir), new_menu_name)
+                os.rename(current_dir, new_dir)
 
-            def rename_node_files(new_menu_name):
+                # iterate through files in saved setup directory to change file names
+                for file_name in os.listdir(new_dir):
+                    if selected_menu in file_name:
+                        new_file_name = file_name.replace(selected_menu, new_menu_name)
+                        os.rename(os.path.join(new_dir, file_name), os.path.join(new_dir, new_file_name))
 
-                # Rename saved node directory if it exists
-                for root, dirs, files in os.walk(self.node_dir):
-                    for d in dirs:
-                        if d == selected_menu:
-                            current_dir = os.path.join(root, d)
-                            new_dir = current_dir.replace(selected_menu, new_menu_name)
-                            os.rename(current_dir, new_dir)
-
-                            # iterate through files in saved setup directory to change file names
-                            for file_name in os.listdir(new_dir):
-                                if selected_menu in file_name:
-                                    new_file_name = file_name.replace(selected_menu, new_menu_name)
-                                    os.rename(os.path.join(new_dir, file_name), os.path.join(new_dir, new_file_name))
-
-                # Rename python file and saved setup if it exists
-                for f in os.listdir(self.node_dir):
-                    if f == selected_menu + '.py':
-                        os.rename(os.path.join(self.node_dir, selected_menu + '.py'), os.path.join(self.node_dir, new_menu_name + '.py'))
-                    if f == selected_menu + '.pyc':
-                        os.rename(os.path.join(self.node_dir, selected_menu + '.pyc'), os.path.join(self.node_dir, new_menu_name + '.pyc'))
+                menu['setup'] = os.path.join(new_dir, os.path.basename(menu['setup']).replace(selected_menu, new_menu_name))
 
             if not new_name_entry.text:
                 return
@@ -653,10 +916,12 @@ class BatchNodes:
 
             new_menu_name = new_name_entry.text
 
-            edit_menu_file(new_menu_name)
+            self.menus[new_menu_name] = self.menus.pop(selected_menu)
 
             rename_node_files(new_menu_name)
 
+            save_menu_registry(self.menus)
+
             self.batch_node_menu_list.clear()
             self.matchbox_node_menu_list.clear()
             self.logik_node_menu_list.clear()
@@ -717,97 +982,35 @@ class BatchNodes:
 
     def create_node(self):
 
-        def create_node_script():
-
-            def replace_tokens():
-
-                token_dict = {}
-
-                token_dict['<NodeName>'] = node_name
-                token_dict['<CreateNodeLine>'] = self.create_node_line
-                token_dict['<Version>'] = SCRIPT_VERSION
-
-                # Replace tokens in menu template
-                for key, value in token_dict.items():
-                    for line in template_lines:
-                        if key in line:
-                            line_index = template_lines.index(line)
-                            new_line = re.sub(key, value, line)
-                            template_lines[line_index] = new_line
-
-            # Read template
-            template = open(self.create_node_template, 'r')
-            template_lines = template.read().splitlines()
-
-            # Replace tokens in template
-            replace_tokens()
-
-            # Write out temp node
-            out_file = open(node_script, 'w')
-            for line in template_lines:
-                print(line, file=out_file)
-            out_file.close()
-
-        # Create node scripts for selected nodes
+        # Add menu for node to registry
         node_name = self.node_name.replace('.', '_')
-        #print ('node_name:', node_name, '\n')
 
-        node_script = os.path.join(self.node_dir, node_name) + '.py'
+        self.menus[node_name] = {
+            'node_type': self.node_type,
+            'shader': self.shader,
+            'setup': '',
+            }
 
-        # Create script for new node
-        create_node_script()
+        save_menu_registry(self.menus)
 
-        pyflame.print(f'{node_name}: Node Script Saved.', text_color=TextColor.GREEN)
+        pyflame.print(f'{node_name}: Node Menu Saved.', text_color=TextColor.GREEN)
 
     def save_selected_node(self):
 
-        def create_node_script():
-
-            def replace_tokens():
-
-                token_dict = {}
-
-                token_dict['<NodeName>'] = node_name
-                token_dict['<NodeType>'] = node_type
-                token_dict['<NodeSetupPathName>'] = node_setup_path_name
-                token_dict['<Version>'] = SCRIPT_VERSION
-
-                # Replace tokens in menu template
-                for key, value in token_dict.items():
-                    for line in template_lines:
-                        if key in line:
-                            line_index = template_lines.index(line)
-                            new_line = re.sub(key, value, line)
-                            template_lines[line_index] = new_line
-
-            # Read template
-            template = open(self.save_selected_template, 'r')
-            template_lines = template.read().splitlines()
-
-            # Replace tokens in template
-            replace_tokens()
-
-            # Write out temp node
-            out_file = open(node_script, 'w')
-            for line in template_lines:
-                print(line, file=out_file)
-            out_file.close()
-
         selected_node = self.selection[0]
 
         node_name = str(selected_node.name)[1:-1]
 
-        # Check user python folder for existing node script
+        # Check menu registry for existing menu
         create_node = True
 
-        for n in os.listdir(self.node_dir):
-            if n == node_name:
-                create_node = PyFlameMessageWindow(
-                    message=f'Overwrite existing menu: {node_name}?',
-                    message_type=MessageType.WARNING,
-                    title=f'{SCRIPT_NAME}: Confirm Operation',
-                    parent=None,
-                    )
+        if node_name in self.menus:
+            create_node = PyFlameMessageWindow(
+                message=f'Overwrite existing menu: {node_name}?',
+                message_type=MessageType.WARNING,
+                title=f'{SCRIPT_NAME}: Confirm Operation',
+                parent=None,
+                )
 
         if create_node:
             node_type = str(selected_node.type)[1:-1]
@@ -828,11 +1031,16 @@ class BatchNodes:
 
             selected_node.save_node_setup(node_setup_path_name)
 
-            # Set script path
-            node_script = os.path.join(self.node_dir, node_name) + '.py'
+            # Add menu for node to registry
+            self.menus[node_name] = {
+                'node_type': node_type,
+                'shader': '',
+                'setup': node_setup_path_name,
+                }
+
+            save_menu_registry(self.menus)
 
-            # Create script for new node
-            create_node_script()
+            pyflame.refresh_hooks()
 
             PyFlameMessageWindow(
                 message=f'Menu created: {node_name}',
@@ -894,6 +1102,17 @@ def get_main_menu_custom_ui_actions():
 
 def get_batch_custom_ui_actions():
 
+    # Node menus are built from the menu registry
+    menu_actions = [
+        {
+            'name': menu_name,
+            'order': order,
+            'execute': partial(create_menu_node, menu_name, menu),
+            'minimumVersion': '2025'
+        }
+        for order, (menu_name, menu) in enumerate(sorted(load_menu_registry().items()), start=2)
+    ]
+
     return [
         {
             'name': 'Batch Nodes...',
@@ -912,6 +1131,6 @@ def get_batch_custom_ui_actions():
                     'isVisible': scope_node,
                     'minimumVersion': '2025'
                 }
-            ]
+            ] + menu_actions
         }
     ]
@@ -1,10 +1,10 @@
 """
 Script Name: Batch Rendertimer
-Script Version: 1.0.0
+Script Version: 1.1.0
 Flame Version: 2023
 Written by: Bob Maple
 Creation Date: 08.04.23
-Update Date: 08.04.23
+Update Date: 10.18.26
 
 Script Type: Batch Rendering
 
@@ -12,20 +12,61 @@ Description:
 
     Prints render start and end times to the console and to the Flame message area.
 
+    Every render is also appended to a JSONL log with batch group, render node, frame range,
+    resolution, elapsed time and frames per second. The log is written to
+    ~/.batch_rendertimer/renders.jsonl, or to the path in the BATCH_RENDERTIMER_LOG environment variable.
+
+    To see render history, percentiles and slow renders, run the script from a shell:
+
+        python3 batch_rendertimer.py
+        python3 batch_rendertimer.py --shot PYT_0010
+
 To install:
 
     Copy script folder into /opt/Autodesk/shared/python
+
+Updates:
+
+    v1.1.0 10.18.26
+        - Renders are logged to a JSONL file.
+        - Added shell report with per shot history, percentiles and regressions.
 """
 
+import argparse
+import datetime
+import json
+import os
+import statistics
 import time
 
-import flame
+LOG_PATH = os.environ.get('BATCH_RENDERTIMER_LOG', os.path.join(os.path.expanduser('~'), '.batch_rendertimer', 'renders.jsonl'))
+
+# Renders slower than this fraction of a render node's median fps are reported as regressions
+REGRESSION_THRESHOLD = 0.8
 
 
 def print_message(message):
+    import flame
     flame.messages.show_in_console(message, 'info', 5)
     print(message)
 
+def current_batch_group_name():
+    import flame
+    try:
+        return str(flame.batch.name)[1:-1]
+    except Exception:
+        return ''
+
+def log_render(record):
+    """Append render record to the log. Logging errors are printed and never stop the render."""
+    record['time'] = datetime.datetime.now().isoformat(timespec='seconds')
+    try:
+        os.makedirs(os.path.dirname(LOG_PATH), exist_ok=True)
+        with open(LOG_PATH, 'a') as log_file:
+            log_file.write(json.dumps(record) + '\n')
+    except OSError as error:
+        print('Batch Rendertimer: Could not write render log: ' + str(error))
+
 def batch_render_begin(info, userData, *args, **kwargs):
     userData["render_started"] = time.time()
     print("Render started: " + str(userData.get("render_started")))
@@ -36,5 +77,119 @@ def batch_render_end(info, userData, *args, **kwargs):
     render_secs  = render_ended - userData.get("render_started")
     print_message("Render time total: " + str(round(render_secs, 2)) + " seconds\n")
 
+    range_start = info.get('rangeStart', 0)
+    range_end = info.get('rangeEnd', 0)
+    frames = range_end - range_start + 1 if range_end >= range_start else 0
+
+    log_render({
+        'type': 'batch',
+        'batch_group': current_batch_group_name(),
+        'render_node': info.get('nodeName', ''),
+        'range_start': range_start,
+        'range_end': range_end,
+        'frames': frames,
+        'width': info.get('width', 0),
+        'height': info.get('height', 0),
+        'elapsed': round(render_secs, 3),
+        'fps': round(frames / render_secs, 3) if frames and render_secs > 0 else 0,
+        'aborted': bool(info.get('aborted', False)),
+        })
+
 def render_ended(module_name, sequence_name, elapsed_time_in_seconds):
     print_message("Timeline render ended: " + str(round(elapsed_time_in_seconds, 2)) + " seconds\n" )
+
+    log_render({
+        'type': 'timeline',
+        'batch_group': sequence_name,
+        'render_node': module_name,
+        'elapsed': round(elapsed_time_in_seconds, 3),
+        })
+
+#-------------------------------------
+# [Report]
+#-------------------------------------
+
+def read_log(path):
+    """Read render records from the log, skipping lines that can't be parsed."""
+    records = []
+    if not os.path.isfile(path):
+        return records
+    with open(path) as log_file:
+        for line in log_file:
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                continue
+    return records
+
+def percentile(values, percent):
+    """Return the given percentile of values, or the value itself if there is only one."""
+    if len(values) == 1:
+        return values[0]
+    return statistics.quantiles(values, n=100, method='inclusive')[percent - 1]
+
+def find_regressions(records):
+    """Return batch renders with fps below REGRESSION_THRESHOLD of the median of earlier renders of the same render node."""
+    regressions = []
+    history = {}
+    for record in records:
+        if record.get('type') != 'batch' or record.get('aborted') or not record.get('fps'):
+            continue
+        key = (record['batch_group'], record['render_node'])
+        previous = history.setdefault(key, [])
+        if previous:
+            median_fps = statistics.median(previous)
+            if record['fps'] < median_fps * REGRESSION_THRESHOLD:
+                regressions.append((record, median_fps))
+        previous.append(record['fps'])
+    return regressions
+
+def print_report(records, shot=None, history=10):
+    """Print render history, elapsed time percentiles and regressions per batch group."""
+    if shot:
+        records = [record for record in records if record.get('batch_group') == shot]
+    if not records:
+        print('No renders logged.')
+        return
+
+    shots = {}
+    for record in records:
+        shots.setdefault(record.get('batch_group', ''), []).append(record)
+
+    for shot_name, shot_records in sorted(shots.items()):
+        elapsed = [record['elapsed'] for record in shot_records]
+        fps = [record['fps'] for record in shot_records if record.get('fps')]
+
+        print('\n' + shot_name)
+        print('    Renders: {}  Elapsed p50: {:.2f}s  p90: {:.2f}s  Max: {:.2f}s'.format(
+            len(shot_records), percentile(elapsed, 50), percentile(elapsed, 90), max(elapsed)))
+        if fps:
+            print('    FPS p10: {:.2f}  p50: {:.2f}'.format(percentile(fps, 10), percentile(fps, 50)))
+
+        for record in shot_records[-history:]:
+            print('    {}  {:<24} {:>6} frames  {:>5}x{:<5} {:>9.2f}s {:>8} fps{}'.format(
+                record.get('time', ''),
+                record.get('render_node', ''),
+                record.get('frames', '-'),
+                record.get('width', '-'),
+                record.get('height', '-'),
+                record['elapsed'],
+                '{:.2f}'.format(record['fps']) if record.get('fps') else '-',
+                '  aborted' if record.get('aborted') else '',
+                ))
+
+    regressions = find_regressions(records)
+    if regressions:
+        print('\nRegressions (below {:.0%} of median fps):'.format(REGRESSION_THRESHOLD))
+        for record, median_fps in regressions:
+            print('    {}  {} / {}  {:.2f} fps (median {:.2f})'.format(
+                record.get('time', ''), record['batch_group'], record['render_node'], record['fps'], median_fps))
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Batch Rendertimer render report.')
+    parser.add_argument('--shot', help='Only show renders for this batch group or sequence.')
+    parser.add_argument('--history', type=int, default=10, help='Number of recent renders to list per shot.')
+    parser.add_argument('--log', default=LOG_PATH, help='Render log path.')
+    args = parser.parse_args()
+
+    print_report(read_log(args.log), args.shot, args.history)
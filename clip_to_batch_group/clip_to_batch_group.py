@@ -142,6 +142,8 @@ Updates:
 
 import os
 import re
+import shutil
+import tempfile
 
 import flame
 from lib.pyflame_lib_clip_to_batch_group import *
@@ -154,9 +156,70 @@ SCRIPT_NAME = 'Clip to Batch Group'
 SCRIPT_VERSION = 'v2.7.0'
 SCRIPT_PATH = os.path.abspath(os.path.dirname(__file__))
 
+class BatchGroupTemplate():
+    """
+    Batch Group Template
+    ====================
+
+    Mux and Render node network saved once as a batch setup and appended to each new batch group
+    when creating batch groups for many clips.
+
+    The setup is saved from the first batch group before any clip is added to it, so it only contains
+    the network. Clip specific values are set on the Render node after the setup is appended.
+    """
+
+    def __init__(self):
+
+        self.temp_folder = ''
+        self.setup_path = ''
+
+    @property
+    def saved(self):
+
+        return bool(self.setup_path)
+
+    def save(self, batch_group):
+        """
+        Save
+        ====
+
+        Save batch group setup to temp folder.
+        """
+
+        self.temp_folder = tempfile.mkdtemp(prefix='clip_to_batch_group_')
+        self.setup_path = os.path.join(self.temp_folder, 'template.batch')
+
+        batch_group.save_setup(self.setup_path)
+
+        pyflame.print(f'Batch Group Template Saved: {self.setup_path}')
+
+    def append(self, batch_group):
+        """
+        Append
+        ======
+
+        Append template setup to batch group.
+        """
+
+        batch_group.append_setup(self.setup_path)
+
+    def cleanup(self):
+        """
+        Cleanup
+        =======
+
+        Delete temp folder.
+        """
+
+        if self.temp_folder:
+            shutil.rmtree(self.temp_folder, ignore_errors=True)
+
+        self.temp_folder = ''
+        self.setup_path = ''
+
 class CreateBatchGroup():
 
-    def __init__(self, clip):
+    def __init__(self, clip, template=None):
 
         # Check script path, if path is incorrect, stop script.
         if not pyflame.verify_script_install():
@@ -205,6 +268,13 @@ class CreateBatchGroup():
             shelf_reels=self.shelf_reel_list,
             )
 
+        # When creating batch groups for many clips, the node network is built once in the first
+        # batch group and saved as a template before any clip is added.
+        self.template = template
+        if self.template is not None and not self.template.saved:
+            self.create_network()
+            self.template.save(self.batch_group)
+
     def import_batch_group(self):
         """
         Import Batch Group
@@ -369,6 +439,18 @@ class CreateBatchGroup():
         # Create render node and setup render node properties
         self.create_nodes()
 
+    def get_clip_node(self):
+        """
+        Get Clip Node
+        =============
+
+        Get first clip node in batch group. Template nodes may be created before the clip.
+        """
+
+        for node in flame.batch.nodes:
+            if isinstance(node, flame.PyClipNode):
+                return node
+
     def name_batch_group_shot_name(self):
         """
         Name Batch Group Shot Name
@@ -378,7 +460,7 @@ class CreateBatchGroup():
         """
 
         # Get clip from batch group
-        self.clip = flame.batch.nodes[0]
+        self.clip = self.get_clip_node()
 
         # Get shot name from clip
         self.shot_name = pyflame.shot_name_from_clip(self.clip.clip)
@@ -401,7 +483,7 @@ class CreateBatchGroup():
         Name batch group with clip name.
         """
 
-        self.clip = flame.batch.nodes[0]
+        self.clip = self.get_clip_node()
         self.clip_name = str(self.clip.name)[1:-1]
         self.batch_group.name = self.clip_name + self.additional_naming
 
@@ -414,12 +496,46 @@ class CreateBatchGroup():
         # Set shot name
         self.shot_name = self.clip_name
 
+    def create_network(self):
+        """
+        Create Network
+        ==============
+
+        Create Mux and Render nodes in batch group and connect them. Clip specific values are set in create_nodes.
+        """
+
+        # Create mux nodes
+        plate_in_mux = self.batch_group.create_node('Mux')
+        plate_in_mux.name = 'plate_in'
+        plate_in_mux.set_context(1, 'Default')
+        plate_in_mux.pos_x = 400
+        plate_in_mux.pos_y = -30
+
+        render_out_mux = self.batch_group.create_node('Mux')
+        render_out_mux.name = 'render_out'
+        render_out_mux.set_context(2, 'Default')
+        render_out_mux.pos_x = plate_in_mux.pos_x + 1600
+        render_out_mux.pos_y = plate_in_mux.pos_y - 30
+
+        # Create render node
+        render_node = self.batch_group.create_node('Render')
+        render_node.name = '<batch iteration>'
+        render_node.pos_x = render_out_mux.pos_x + 400
+        render_node.pos_y = render_out_mux.pos_y -30
+
+        # Connect nodes
+        flame.batch.connect_nodes(plate_in_mux, 'Result', render_out_mux, 'Default')
+        flame.batch.connect_nodes(render_out_mux, 'Result', render_node, 'Default')
+
     def create_nodes(self):
         """
         Create Nodes
         ============
 
         Create Mux and Render nodes in batch group and connect nodes.
+
+        If a template is used, the template setup is appended instead of creating the nodes. The batch
+        group the template was saved from already has the nodes.
         """
 
         # Set batch group duration
@@ -436,28 +552,24 @@ class CreateBatchGroup():
         clip_in = imported_clip.in_mark
         clip_out = imported_clip.out_mark
 
-        # Create mux nodes
-        plate_in_mux = self.batch_group.create_node('Mux')
-        plate_in_mux.name = 'plate_in'
-        plate_in_mux.set_context(1, 'Default')
-        plate_in_mux.pos_x = 400
-        plate_in_mux.pos_y = -30
+        # Create node network
+        if self.template is None:
+            self.create_network()
+        elif not any(str(node.name)[1:-1] == 'plate_in' for node in self.batch_group.nodes):
+            self.template.append(self.batch_group)
 
-        render_out_mux = self.batch_group.create_node('Mux')
-        render_out_mux.name = 'render_out'
-        render_out_mux.set_context(2, 'Default')
-        render_out_mux.pos_x = plate_in_mux.pos_x + 1600
-        render_out_mux.pos_y = plate_in_mux.pos_y - 30
+        # Get network nodes
+        for node in self.batch_group.nodes:
+            if str(node.type)[1:-1] == 'Render':
+                render_node = node
+            elif str(node.name)[1:-1] == 'plate_in':
+                plate_in_mux = node
 
-        # Create render node
-        render_node = self.batch_group.create_node('Render')
+        # Set clip specific render node properties
         render_node.frame_rate = clip_frame_rate
         render_node.range_end = self.clip.duration
         render_node.source_timecode = clip_timecode
         render_node.record_timecode = clip_timecode
-        render_node.name = '<batch iteration>'
-        render_node.pos_x = render_out_mux.pos_x + 400
-        render_node.pos_y = render_out_mux.pos_y -30
         render_node.shot_name = self.shot_name
 
         # Set in and out marks for render node if clip has in and out marks
@@ -467,10 +579,22 @@ class CreateBatchGroup():
         if str(clip_out) != '<NULL>':
             render_node.out_mark = clip_out
 
-        # Connect nodes
+        # Connect clip
         flame.batch.connect_nodes(self.clip, 'Default', plate_in_mux, 'Default')
-        flame.batch.connect_nodes(plate_in_mux, 'Result', render_out_mux, 'Default')
-        flame.batch.connect_nodes(render_out_mux, 'Result', render_node, 'Default')
+
+        # Batch tab is only shown once at the end when using a template
+        if self.template is None:
+            self.show_batch()
+
+        pyflame.print(f'Batch group created: {str(self.batch_group.name)[1:-1]}')
+
+    def show_batch(self):
+        """
+        Show Batch
+        ==========
+
+        Frame batch schematic. Go back to MediaHub if go_to_batch is False.
+        """
 
         try:
             flame.go_to('Batch')
@@ -481,39 +605,49 @@ class CreateBatchGroup():
         except:
             pass
 
-        pyflame.print(f'Batch group created: {str(self.batch_group.name)[1:-1]}')
-
 #-------------------------------------
 
-def clip_to_batch_group(selection):
+def create_batch_groups(selection, method_name):
+    """
+    Create Batch Groups
+    ===================
 
-    pyflame.print_title(f'{SCRIPT_NAME} {SCRIPT_VERSION}')
+    Create a batch group for each selected clip. When more than one clip is selected, the node network
+    is built once and appended to each batch group from a template setup.
+    """
+
+    template = BatchGroupTemplate() if len(selection) > 1 else None
 
-    for clip in selection:
-        create = CreateBatchGroup(clip)
-        create.clip_batch_group()
+    try:
+        for clip in selection:
+            create = CreateBatchGroup(clip, template)
+            getattr(create, method_name)()
+    finally:
+        if template is not None:
+            template.cleanup()
+
+    if template is not None:
+        create.show_batch()
 
     print('Done.\n')
 
-def clip_to_batch_group_shot_name(selection):
+def clip_to_batch_group(selection):
 
     pyflame.print_title(f'{SCRIPT_NAME} {SCRIPT_VERSION}')
 
-    for clip in selection:
-        create = CreateBatchGroup(clip)
-        create.clip_batch_group_shot_name()
+    create_batch_groups(selection, 'clip_batch_group')
 
-    print('Done.\n')
+def clip_to_batch_group_shot_name(selection):
+
+    pyflame.print_title(f'{SCRIPT_NAME} {SCRIPT_VERSION}')
+
+    create_batch_groups(selection, 'clip_batch_group_shot_name')
 
 def import_to_batch_group(selection):
 
     pyflame.print_title(f'{SCRIPT_NAME} - Import Clips {SCRIPT_VERSION}')
 
-    for clip in selection:
-        create = CreateBatchGroup(clip)
-        create.import_batch_group()
-
-    print('Done.\n')
+    create_batch_groups(selection, 'import_batch_group')
 
 def import_all_to_batch_group(selection):
 
@@ -528,11 +662,7 @@ def import_to_batch_group_shot_name(selection):
 
     pyflame.print_title(f'{SCRIPT_NAME} - Import Clips {SCRIPT_VERSION}')
 
-    for clip in selection:
-        create = CreateBatchGroup(clip)
-        create.import_batch_group_shot_name()
-
-    print('Done.\n')
+    create_batch_groups(selection, 'import_batch_group_shot_name')
 
 def import_all_to_batch_group_shot_name(selection):
 
@@ -99,6 +99,9 @@ class ColorSegmentFX:
 
         self.selection = selection
 
+        # Read timeline fx types of all segments once
+        self.snapshot = PyFlameTimelineSnapshot(self.selection, columns=['effect_types'])
+
         # Get selected sequence name
         if len(self.selection) == 1:
             self.sequence_name = str(self.selection[0].name)[1:-1]
@@ -229,18 +232,7 @@ class ColorSegmentFX:
                 List of all segment fx types in selected sequence.
         """
 
-        fx_types = []
-
-        for segment in self.selection:
-            for version in segment.versions:
-                for track in version.tracks:
-                    for segment in track.segments:
-                        try:
-                            for tlfx in segment.effects:
-                                if tlfx.type not in fx_types:
-                                    fx_types.append(tlfx.type)
-                        except:
-                            pass
+        fx_types = self.snapshot.unique('effect_types')
 
         if not fx_types:
             PyFlameMessageWindow(
@@ -282,24 +274,17 @@ class ColorSegmentFX:
         color_name = self.color_menu.color
         rgba_value = self.color_menu.color_value
 
+        fx_type = self.fx_type_menu.text
+        segments = self.snapshot.segments(self.snapshot.where(effect_types=lambda effect_types: fx_type in effect_types))
+
         if color_name == 'No Color':
-            # Search through segments in timeline for selected timeline fx and remove color.
-            for sequence in self.selection:
-                for version in sequence.versions:
-                    for track in version.tracks:
-                        for segment in track.segments:
-                            for tlfx in segment.effects:
-                                if tlfx.type == self.fx_type_menu.text:
-                                    segment.clear_colour()
+            # Remove color from segments in timeline with selected timeline fx.
+            for segment in segments:
+                segment.clear_colour()
         else:
-            # Search through segments in timeline for selected timeline fx and apply selected color.
-            for sequence in self.selection:
-                for version in sequence.versions:
-                    for track in version.tracks:
-                        for segment in track.segments:
-                            for tlfx in segment.effects:
-                                if tlfx.type == self.fx_type_menu.text:
-                                    segment.colour = rgba_value
+            # Apply selected color to segments in timeline with selected timeline fx.
+            for segment in segments:
+                segment.colour = rgba_value
 
         pyflame.print('Color applied to selected FX type segments.', text_color=TextColor.GREEN)
 
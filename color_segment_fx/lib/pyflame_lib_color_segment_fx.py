@@ -78,9 +78,13 @@ import platform
 import re
 import shutil
 import subprocess
+import tempfile
+import time
 import traceback
 from shiboken6 import isValid
 import xml.etree.ElementTree as ET
+from array import array
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from functools import partial
 from subprocess import PIPE, Popen
@@ -442,6 +446,9 @@ class _PyFlame:
         ```
     """
 
+    # Export preset version of the current version of Flame. Set by get_flame_export_preset_version.
+    _flame_export_preset_version = None
+
     @staticmethod
     def print_title(text: str) -> None:
         """
@@ -858,7 +865,8 @@ class _PyFlame:
             """
 
             for key, value in folders.items():
-                key = pyflame.resolve_tokens(key) # Resolve tokens in folder name
+                if '<' in key:
+                    key = pyflame.resolve_tokens(key) # Resolve tokens in folder name
                 new_folder = parent_folder.create_folder(key)
                 if shot_name_tag and new_folder.name == shot_name_tag:
                     new_folder.tags=[f'ShotName: {shot_name_tag}']
@@ -869,7 +877,8 @@ class _PyFlame:
         pyflame.print_dict(folder_structure)
 
         # Create the main shot folder
-        folder_name = pyflame.resolve_tokens(folder_name) # Resolve tokens in folder name
+        if '<' in folder_name:
+            folder_name = pyflame.resolve_tokens(folder_name) # Resolve tokens in folder name
         root_folder = dest.create_folder(folder_name)
 
         # Tag root folder with shot name if shot_name_tag is provided and folder_name matches shot_name_tag
@@ -883,13 +892,18 @@ class _PyFlame:
         pyflame.print(f'Media Panel Folder Created: {folder_name}', arrow=True)
 
     @staticmethod
-    def create_media_panel_folders(folder_list: list[str], folder_structure: dict[str, Any], dest: flame.PyFolder | flame.PyLibrary) -> None:
+    def create_media_panel_folders(folder_list: list[str], folder_structure: dict[str, Any], dest: flame.PyFolder | flame.PyLibrary, clone: bool=True) -> None:
         """
         Create Media Panel Folders
         ==========================
 
         Create folders in the Media Panel from a list of folder names. Tokens can be used in folder names.
 
+        By default the folder structure is created once in a staging folder, then copied for each folder in the list
+        and renamed. This takes far fewer Flame API calls than creating every sub-folder of every folder. Folders and
+        sub-folders named after each folder are tagged the same as when they are created one at a time. If copying
+        fails, any remaining folders are created one sub-folder at a time. The staging folder is deleted when done.
+
         Args
         ----
             `folder_list` (list[str]):
@@ -901,18 +915,24 @@ class _PyFlame:
             `dest` (Folder):
                 The destination folder/library in the Media Panel where the folders will be created.
 
+            `clone` (bool, optional):
+                Copy a staging folder structure for each folder instead of creating each sub-folder.
+                (Default: `True`)
+
         Raises
         ------
             TypeError:
                 If `folder_list` is not a list.
                 If `folder_structure` is not a dictionary.
                 If `dest` is not a flame.PyFolder or flame.PyLibrary.
+                If `clone` is not a boolean.
 
         Notes:
         -----
             Tokens can be used in folder names.
 
-            Uses _PyFlame.create_media_panel_folder() to create each folder in list.
+            Uses _PyFlame.create_media_panel_folder() to create the staging folder structure, or each folder in list when
+            `clone` is False.
 
         Example
         -------
@@ -948,14 +968,63 @@ class _PyFlame:
             pyflame.raise_type_error('pyflame.create_media_panel_folders', 'folder_structure', 'dict', folder_structure)
         if not isinstance(dest, (flame.PyFolder, flame.PyLibrary)):
             pyflame.raise_type_error('pyflame.create_media_panel_folders', 'dest', 'flame.PyFolder | flame.PyLibrary', dest)
+        if not isinstance(clone, bool):
+            pyflame.raise_type_error('pyflame.create_media_panel_folders', 'clone', 'bool', clone)
 
         pyflame.print('Creating Media Panel Folders...')
         pyflame.print('Folder Structure:', underline=True, print_to_flame=False, text_color=TextColor.BLUE)
         pyflame.print_dict(folder_structure)
 
-        for folder_name in folder_list:
+        created_folders = 0
+
+        # Create folder structure once in a staging folder, then copy and rename it for each folder.
+        if clone and len(folder_list) > 1:
+            staging_folder = None
+            try:
+                staging_folder = dest.create_folder('PyFlame Staging')
+                _PyFlame.create_media_panel_folder('Template', folder_structure, staging_folder)
+                template_folder = staging_folder.folders[0]
+
+                # Sub-folder name -> positions of sub-folders with that name, as lists of folders indexes.
+                # Copies have the same sub-folders, so sub-folders named after a shot can be tagged in each copy.
+                sub_folder_positions = {}
+                template_queue = [([], template_folder)]
+                for position, folder in template_queue:
+                    for index, sub_folder in enumerate(folder.folders):
+                        sub_folder_position = position + [index]
+                        sub_folder_positions.setdefault(str(sub_folder.name)[1:-1], []).append(sub_folder_position)
+                        template_queue.append((sub_folder_position, sub_folder))
+
+                for folder_name in folder_list:
+                    resolved_name = pyflame.resolve_tokens(folder_name) if '<' in folder_name else folder_name
+                    new_folder = flame.media_panel.copy(template_folder, dest)[0]
+                    try:
+                        new_folder.name = resolved_name
+                        if resolved_name == folder_name:
+                            new_folder.tags = [f'ShotName: {folder_name}']
+                        # Tag sub-folders named after the shot, same as pyflame.create_media_panel_folder
+                        for position in sub_folder_positions.get(folder_name, []):
+                            sub_folder = new_folder
+                            for index in position:
+                                sub_folder = sub_folder.folders[index]
+                            sub_folder.tags = [f'ShotName: {folder_name}']
+                    except Exception:
+                        # Remove the copy so the fallback doesn't leave a Template folder behind
+                        flame.delete(new_folder)
+                        raise
+                    created_folders += 1
+            except Exception as e:
+                pyflame.print(f'Unable to copy staging folder, creating folders one at a time: {e}', text_color=TextColor.YELLOW)
+            finally:
+                if staging_folder:
+                    flame.delete(staging_folder)
+
+        for folder_name in folder_list[created_folders:]:
             _PyFlame.create_media_panel_folder(folder_name, folder_structure, dest, folder_name)
 
+        if created_folders:
+            pyflame.print(f'Media Panel Folders Created: {created_folders} copied, {len(folder_list) - created_folders} created', arrow=True)
+
     @staticmethod
     def create_file_system_folder(folder_name: str, folder_structure: dict[str, Any], dest_path: str, skip_existing: bool=False) -> None:
         """
@@ -1076,13 +1145,112 @@ class _PyFlame:
         flame.execute_shortcut("Refresh the MediaHub's Folders and Files")
 
     @staticmethod
-    def create_file_system_folders(folder_list: list[str], folder_structure: dict[str, Any], dest_path: str) -> None:
+    def plan_file_system_folders(folder_list: list[str], folder_structure: dict[str, Any], dest_path: str) -> list[str]:
+        """
+        Plan File System Folders
+        ========================
+
+        Get the file system folders that pyflame.create_file_system_folders would create, without creating anything.
+        Tokens in folder names are resolved once per unique name, so every folder uses the same date and time.
+
+        The top level folder in folder_structure is replaced by each folder name in folder_list.
+
+        Args
+        ----
+            `folder_list` (list[str]):
+                List of folder names to create.
+
+            `folder_structure` (dict):
+                Dictionary representing the folder structure to create in each folder.
+
+            `dest_path` (str):
+                Path where folders will be created.
+
+        Returns
+        -------
+            `folder_plan` (list[str]):
+                Deduplicated list of absolute folder paths, parents before children.
+
+        Raises
+        ------
+            TypeError:
+                If `folder_list` is not a list.
+                If `folder_structure` is not a dictionary.
+                If `dest_path` is not a string.
+
+        Example
+        -------
+            To check which folders will be created:
+            ```
+            folder_plan = pyflame.plan_file_system_folders(
+                folder_list=['PYT_0010', 'PYT_0020'],
+                folder_structure={'Shot_Folder': {'Folder1': {'SubFolder1': {}}}},
+                dest_path='/path/to/dest/folder',
+                )
+            ```
+
+            folder_plan will be:
+            ```
+            [
+                '/path/to/dest/folder/PYT_0010',
+                '/path/to/dest/folder/PYT_0010/Folder1',
+                '/path/to/dest/folder/PYT_0010/Folder1/SubFolder1',
+                '/path/to/dest/folder/PYT_0020',
+                '/path/to/dest/folder/PYT_0020/Folder1',
+                '/path/to/dest/folder/PYT_0020/Folder1/SubFolder1',
+            ]
+            ```
+        """
+
+        # Validate Arguments
+        if not isinstance(folder_list, list):
+            pyflame.raise_type_error('pyflame.plan_file_system_folders', 'folder_list', 'list', folder_list)
+        if not isinstance(folder_structure, dict):
+            pyflame.raise_type_error('pyflame.plan_file_system_folders', 'folder_structure', 'dict', folder_structure)
+        if not isinstance(dest_path, str):
+            pyflame.raise_type_error('pyflame.plan_file_system_folders', 'dest_path', 'str', dest_path)
+
+        date = datetime.datetime.now()
+        resolved_names = {}
+
+        def resolve(name: str) -> str:
+            if name not in resolved_names:
+                resolved_names[name] = pyflame.resolve_tokens(name, date=date) if '<' in name else name
+            return resolved_names[name]
+
+        # Folder structure paths relative to each folder in folder_list
+        structure_paths = []
+
+        def add_sub_folders(value: dict, parent_path: str) -> None:
+            for key, value in value.items():
+                path = os.path.join(parent_path, resolve(key))
+                structure_paths.append(path)
+                add_sub_folders(value, path)
+
+        for value in folder_structure.values():
+            add_sub_folders(value, '')
+
+        folder_plan = {}
+        for folder_name in folder_list:
+            folder_path = os.path.join(dest_path, resolve(folder_name))
+            folder_plan[folder_path] = None
+            for path in structure_paths:
+                folder_plan[os.path.join(folder_path, path)] = None
+
+        return list(folder_plan)
+
+    @staticmethod
+    def create_file_system_folders(folder_list: list[str], folder_structure: dict[str, Any], dest_path: str, dry_run: bool=False, max_workers: int=16) -> list[str]:
         """
         Create File System Folders
         ==========================
 
         Create file system folders for a list of folders. Tokens can be used in folder names.
 
+        Folders are created in two steps. Every folder to create is first listed with pyflame.plan_file_system_folders.
+        Only the deepest folders are then created, in parallel, since os.makedirs creates their parents. This keeps
+        network file systems busy instead of waiting on one folder at a time. The MediaHub is refreshed once at the end.
+
         Args
         ----
             `folder_list` (list[str]):
@@ -1094,19 +1262,34 @@ class _PyFlame:
             `dest_path` (str):
                 Path where folders will be created.
 
+            `dry_run` (bool, optional):
+                Print the folders that would be created without creating them.
+                (Default: `False`)
+
+            `max_workers` (int, optional):
+                Number of folders to create at the same time.
+                (Default: `16`)
+
+        Returns
+        -------
+            `folder_plan` (list[str]):
+                Folders created, or folders that would be created if `dry_run` is True. Folders that could not be
+                created are left out, see pyflame.create_file_system_folder_plan.
+
         Raises
         ------
             TypeError:
                 If `folder_list` is not a list.
                 If `folder_structure` is not a dictionary.
                 If `dest_path` is not a string.
+                If `dry_run` is not a boolean.
+            ValueError:
+                If `max_workers` is not an integer greater than 0.
 
         Notes:
         -----
             Tokens can be used in folder names.
 
-            Uses _PyFlame.create_file_system_folder() to create each folder in list.
-
         Example
         -------
             To create file system folders:
@@ -1159,13 +1342,107 @@ class _PyFlame:
             pyflame.raise_type_error('pyflame.create_file_system_folders', 'folder_structure', 'dict', folder_structure)
         if not isinstance(dest_path, str):
             pyflame.raise_type_error('pyflame.create_file_system_folders', 'dest_path', 'str', dest_path)
+        if not isinstance(dry_run, bool):
+            pyflame.raise_type_error('pyflame.create_file_system_folders', 'dry_run', 'bool', dry_run)
+        if not isinstance(max_workers, int) or max_workers < 1:
+            pyflame.raise_value_error('pyflame.create_file_system_folders', 'max_workers', 'int greater than 0', max_workers)
 
         pyflame.print('Creating File System Folders', text_color=TextColor.GREEN)
         pyflame.print('Folder Structure:', underline=True, print_to_flame=False, text_color=TextColor.BLUE)
         pyflame.print_dict(folder_structure)
 
-        for folder_name in folder_list:
-            _PyFlame.create_file_system_folder(folder_name, folder_structure, dest_path)
+        folder_plan = pyflame.plan_file_system_folders(folder_list, folder_structure, dest_path)
+
+        if dry_run:
+            pyflame.print(f'File System Folder Plan: {len(folder_plan)} folders', underline=True, print_to_flame=False, text_color=TextColor.BLUE)
+            for path in folder_plan:
+                print(f'    {path}')
+            print('\n', end='')
+            return folder_plan
+
+        return pyflame.create_file_system_folder_plan(folder_plan, max_workers)
+
+    @staticmethod
+    def create_file_system_folder_plan(folder_plan: list[str], max_workers: int=16) -> list[str]:
+        """
+        Create File System Folder Plan
+        ==============================
+
+        Create folders listed by pyflame.plan_file_system_folders, or any list of absolute folder paths.
+
+        Only the deepest folders are created, in parallel, since os.makedirs creates their parents. The MediaHub is
+        refreshed once at the end.
+
+        Folders that could not be created are printed and left out of the returned list, so callers can compare it
+        with `folder_plan` to tell if any part of the folder tree is missing.
+
+        Args
+        ----
+            `folder_plan` (list[str]):
+                Absolute folder paths to create.
+
+            `max_workers` (int, optional):
+                Number of folders to create at the same time.
+                (Default: `16`)
+
+        Returns
+        -------
+            `created_folders` (list[str]):
+                Folders in `folder_plan` that exist after creating folders.
+
+        Raises
+        ------
+            TypeError:
+                If `folder_plan` is not a list.
+            ValueError:
+                If `max_workers` is not an integer greater than 0.
+
+        Example
+        -------
+            To create folders for two shots with different folder structures:
+            ```
+            folder_plan = pyflame.plan_file_system_folders(['PYT_0010'], {'Plates': {}}, dest_path)
+            folder_plan += pyflame.plan_file_system_folders(['PYT_0020'], {'Renders': {}}, dest_path)
+            pyflame.create_file_system_folder_plan(folder_plan)
+            ```
+        """
+
+        # Validate Arguments
+        if not isinstance(folder_plan, list):
+            pyflame.raise_type_error('pyflame.create_file_system_folder_plan', 'folder_plan', 'list', folder_plan)
+        if not isinstance(max_workers, int) or max_workers < 1:
+            pyflame.raise_value_error('pyflame.create_file_system_folder_plan', 'max_workers', 'int greater than 0', max_workers)
+
+        # Only the deepest folders need to be created, os.makedirs creates their parents.
+        parent_folders = {os.path.dirname(path) for path in folder_plan}
+        leaf_folders = [path for path in folder_plan if path not in parent_folders]
+
+        def create_folder(path: str) -> str | None:
+            try:
+                os.makedirs(path, exist_ok=True)
+            except OSError as e:
+                return f'Error creating directory {path}: {e}'
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            errors = [error for error in executor.map(create_folder, leaf_folders) if error]
+
+        for error in errors:
+            print(error)
+
+        # Parent folders of failed folders may still have been created, so check which folders exist.
+        if errors:
+            created_folders = [path for path in folder_plan if os.path.isdir(path)]
+        else:
+            created_folders = list(folder_plan)
+
+        pyflame.print(f'Created {len(created_folders)} File System Folders', text_color=TextColor.GREEN)
+        if errors:
+            pyflame.print(f'Failed To Create {len(folder_plan) - len(created_folders)} File System Folders', print_type=PrintType.ERROR)
+
+        # Refresh Media Panel
+        flame.execute_shortcut("Refresh the MediaHub's Folders and Files")
+
+        return created_folders
 
     @staticmethod
     def copy_to_clipboard(value: str | int) -> None:
@@ -1627,6 +1904,8 @@ class _PyFlame:
         name does not conflict with names in a given list of existing node names. If a conflict is found,
         the function appends an incrementing number to the original name until a unique name is created.
 
+        When creating nodes one at a time, use `PyFlameNameAllocator` so existing names are only read once.
+
         Args
         ----
             `node_names` (list[str]):
@@ -1681,17 +1960,15 @@ class _PyFlame:
                 pyflame.raise_type_error('pyflame.generate_unique_node_names', 'existing_node_names: name', 'str', name)
 
         # Check node names for uniqueness
+        allocator = PyFlameNameAllocator(existing_node_names)
         new_node_names = []
         for name in node_names:
             # If name starts with a number, add a '_' to the name
             if name[0].isdigit():
                 name = f'_{name}'
-            original_name = name
-            i = 1
-            # Keep appending a number to the name until it's unique
-            while name in existing_node_names:
-                name = f"{original_name}{i}"
-                i += 1
+
+            # Append a number to the name if it's not unique
+            name = allocator.allocate(name)
 
             # Add the unique name to the list
             new_node_names.append(name)
@@ -2721,6 +2998,51 @@ class _PyFlame:
             #return int(scaled_size * 0.8)
             return value
 
+    @staticmethod
+    def get_flame_export_preset_version() -> str:
+        """
+        Get Flame Export Preset Version
+        ===============================
+
+        Get export preset version for the current version of Flame from the default Jpeg export preset XML.
+
+        The XML is only read the first time this is called in a Flame session. Later calls return the stored version.
+
+        Returns
+        -------
+            `export_version` (str):
+                Export preset version for current version of Flame.
+
+        Example
+        -------
+            To check if a preset can be used with the current version of Flame:
+            ```
+            current_export_version, _ = pyflame.get_export_preset_version(preset_path)
+            compatible = current_export_version <= pyflame.get_flame_export_preset_version()
+            ```
+        """
+
+        if _PyFlame._flame_export_preset_version is None:
+
+            # Open Flame default Jpeg export preset XML
+            preset_dir = flame.PyExporter.get_presets_dir(
+                flame.PyExporter.PresetVisibility.Autodesk, flame.PyExporter.PresetType.Image_Sequence
+            )
+            preset_path = os.path.join(
+                preset_dir, "Jpeg", "Jpeg (8-bit).xml"
+            )
+            preset_xml_tree = ET.parse(preset_path)
+            root = preset_xml_tree.getroot()
+
+            # Get version default export preset is currently set to
+            for setting in root.iter('preset'):
+                _PyFlame._flame_export_preset_version = setting.get('version')
+
+            print(f'    Flame default export preset version: {_PyFlame._flame_export_preset_version}')
+            print('\n', end='')
+
+        return _PyFlame._flame_export_preset_version
+
     @staticmethod
     def get_export_preset_version(preset_path: str) -> Tuple[str, str]:
         """
@@ -2782,32 +3104,8 @@ class _PyFlame:
 
             return current_export_version
 
-        def get_export_version() -> str:
-            """
-            Get export version for current version of Flame from the default
-            Jpeg export preset XML.
-            """
-
-            # Open Flame default Jpeg export preset XML
-            preset_dir = flame.PyExporter.get_presets_dir(
-                flame.PyExporter.PresetVisibility.Autodesk, flame.PyExporter.PresetType.Image_Sequence
-            )
-            preset_path = os.path.join(
-                preset_dir, "Jpeg", "Jpeg (8-bit).xml"
-            )
-            preset_xml_tree = ET.parse(preset_path)
-            root = preset_xml_tree.getroot()
-
-            # Get version default export preset is currently set to
-            for setting in root.iter('preset'):
-                default_export_version = setting.get('version')
-                print(f'    Flame default export preset version: {default_export_version}')
-                print('\n', end='')
-
-            return default_export_version
-
         current_export_version = get_current_export_version(preset_path)
-        export_version = get_export_version()
+        export_version = pyflame.get_flame_export_preset_version()
 
         return current_export_version, export_version
 
@@ -2893,20 +3191,7 @@ class _PyFlame:
         if not isinstance(new_name, str):
             pyflame.raise_type_error('pyflame.iterate_name', 'new_name', 'str', new_name)
 
-        # Initialize a counter
-        counter = 1
-
-        # Initialize the potential new name
-        potential_name = new_name
-
-        # Loop until we find a unique name
-        while potential_name in existing_names:
-            # Increment the name with the counter
-            potential_name = f"{new_name} {counter}"
-            # Increment the counter
-            counter += 1
-
-        return potential_name
+        return PyFlameNameAllocator(existing_names, separator=' ').allocate(new_name)
 
     @staticmethod
     def get_export_preset_names() -> List[str]:
@@ -3113,6 +3398,8 @@ class _PyFlame:
         If `sorted` is False, performs a linear search through the PyObjects contained within the given PyObject. This can be slower
         for large lists of PyObjects.
 
+        To look up many folders by tag, use `PyFlameMediaPanelIndex.tagged` instead. It reads each folder's tags once.
+
         Args
         ----
             pyobject (flame.PyLibrary, flame.PyDesktop, or flame.PyFolder):
@@ -3280,7 +3567,7 @@ class _PyFlame:
         return shot_name
 
     @staticmethod
-    def get_media_panel_shot_folder(shot_name: str, pyobject: flame.PyClip | flame.PyBatch | flame.PyDesktop, search_location: flame.PyLibrary | flame.PyFolder, dest_folder_path: str) -> flame.PyFolder | None:
+    def get_media_panel_shot_folder(shot_name: str, pyobject: flame.PyClip | flame.PyBatch | flame.PyDesktop, search_location: flame.PyLibrary | flame.PyFolder, dest_folder_path: str, index: 'PyFlameMediaPanelIndex | None'=None) -> flame.PyFolder | None:
         """
         Get Media Panel Folder
         ======================
@@ -3309,6 +3596,11 @@ class _PyFlame:
                 Destination folder path in Shot Folder.
                 Example 'Shot_Folder/Plates'
 
+            index (PyFlameMediaPanelIndex | None):
+                Media Panel index of search_location. Use when moving or copying many objects so the
+                Media Panel is only searched once. If None, search_location is searched.
+                (Default: None)
+
         Returns
         -------
             dest_folder (flame.PyFolder):
@@ -3336,6 +3628,8 @@ class _PyFlame:
             pyflame.raise_type_error('pyflame.get_media_panel_shot_folder', 'search_location', 'PyLibrary or PyFolder', search_location)
         if not isinstance(dest_folder_path, str):
             pyflame.raise_type_error('pyflame.get_media_panel_shot_folder', 'dest_folder_path', 'string', dest_folder_path)
+        if index is not None and not isinstance(index, PyFlameMediaPanelIndex):
+            pyflame.raise_type_error('pyflame.get_media_panel_shot_folder', 'index', 'PyFlameMediaPanelIndex | None', index)
 
         def get_folder_from_path(folder: flame.PyFolder, media_panel_folder_path: str) -> flame.PyFolder:
             """
@@ -3381,11 +3675,17 @@ class _PyFlame:
 
             return dest_folder
 
+        # Use index if provided
+        if index is not None:
+            return index.shot_folder(shot_name, dest_folder_path)
+
         # Create target tag for shot folder search
         target_tag = f'ShotName: {shot_name}'
 
         # Search through search_location(flame.PyLibrary or flame.PyFolder) for shot folder with matching target tag
         shot_folder = pyflame.find_by_tag(search_location.folders, target_tag)
+        if shot_folder is None:
+            return None
 
         # If dest_folder_path is a single folder, return shot_folder
         if '/' not in dest_folder_path:
@@ -3397,7 +3697,7 @@ class _PyFlame:
         return dest_folder
 
     @staticmethod
-    def move_to_shot_folder(shot_name: str, pyobject: flame.PyClip | flame.PyBatch | flame.PyDesktop, search_location: flame.PyLibrary | flame.PyFolder, dest_folder_path: str) -> None:
+    def move_to_shot_folder(shot_name: str, pyobject: flame.PyClip | flame.PyBatch | flame.PyDesktop, search_location: flame.PyLibrary | flame.PyFolder, dest_folder_path: str, index: 'PyFlameMediaPanelIndex | None'=None) -> None:
         """
         Move to Shot Folder
         ===================
@@ -3421,6 +3721,11 @@ class _PyFlame:
                 Destination folder path in Shot Folder.
                 Example 'Shot_Folder/Plates'
 
+            index (PyFlameMediaPanelIndex | None):
+                Media Panel index of search_location. Use when moving or copying many objects so the
+                Media Panel is only searched once. If None, search_location is searched.
+                (Default: None)
+
         Examples
         --------
             Move to shot folder:
@@ -3443,9 +3748,11 @@ class _PyFlame:
             pyflame.raise_type_error('pyflame.move_to_shot_folder', 'search_location', 'PyLibrary or PyFolder', search_location)
         if not isinstance(dest_folder_path, str):
             pyflame.raise_type_error('pyflame.move_to_shot_folder', 'dest_folder_path', 'string', dest_folder_path)
+        if index is not None and not isinstance(index, PyFlameMediaPanelIndex):
+            pyflame.raise_type_error('pyflame.move_to_shot_folder', 'index', 'PyFlameMediaPanelIndex | None', index)
 
         # Get Destination Folder
-        dest_folder = pyflame.get_media_panel_shot_folder(shot_name, pyobject, search_location, dest_folder_path)
+        dest_folder = pyflame.get_media_panel_shot_folder(shot_name, pyobject, search_location, dest_folder_path, index)
 
         # If Destination Folder is None, print error and return
         if dest_folder is None:
@@ -3456,7 +3763,7 @@ class _PyFlame:
         flame.media_panel.move(pyobject, dest_folder)
 
     @staticmethod
-    def copy_to_shot_folder(shot_name: str, pyobject: flame.PyClip | flame.PyBatch | flame.PyDesktop, search_location: flame.PyLibrary | flame.PyFolder, dest_folder_path: str) -> None:
+    def copy_to_shot_folder(shot_name: str, pyobject: flame.PyClip | flame.PyBatch | flame.PyDesktop, search_location: flame.PyLibrary | flame.PyFolder, dest_folder_path: str, index: 'PyFlameMediaPanelIndex | None'=None) -> None:
         """
         Copy to Shot Folder
         ===================
@@ -3480,6 +3787,11 @@ class _PyFlame:
                 Destination folder path in Shot Folder.
                 Example 'Shot_Folder/Plates'
 
+            index (PyFlameMediaPanelIndex | None):
+                Media Panel index of search_location. Use when moving or copying many objects so the
+                Media Panel is only searched once. If None, search_location is searched.
+                (Default: None)
+
         Example
         -------
             Copy to shot folder:
@@ -3502,9 +3814,11 @@ class _PyFlame:
             pyflame.raise_type_error('pyflame.copy_to_shot_folder', 'search_location', 'PyLibrary or PyFolder', search_location)
         if not isinstance(dest_folder_path, str):
             pyflame.raise_type_error('pyflame.copy_to_shot_folder', 'dest_folder_path', 'string', dest_folder_path)
+        if index is not None and not isinstance(index, PyFlameMediaPanelIndex):
+            pyflame.raise_type_error('pyflame.copy_to_shot_folder', 'index', 'PyFlameMediaPanelIndex | None', index)
 
         # Get Destination Folder
-        dest_folder = pyflame.get_media_panel_shot_folder(shot_name, pyobject, search_location, dest_folder_path)
+        dest_folder = pyflame.get_media_panel_shot_folder(shot_name, pyobject, search_location, dest_folder_path, index)
 
         # If Destination Folder is None, print error and return
         if dest_folder is None:
@@ -3514,6 +3828,225 @@ class _PyFlame:
         # Copy PyObject to Destination Folder
         flame.media_panel.copy(pyobject, dest_folder)
 
+    @staticmethod
+    def iterate_segments(selection: list,
+                         effect_type: str | list[str] | None=None,
+                         include_hidden: bool=True,
+                         include_gaps: bool=True,
+                         track_type: str='video',
+                         record_range: Tuple[int, int] | None=None,
+                         ):
+        """
+        Iterate Segments
+        ================
+
+        Yield segments across a selection of sequences/clips, filtered as early as possible.
+
+        Replaces hand written `for version -> for track -> for segment` loops. Filters are checked
+        cheapest first, and each segment attribute is read at most once. Segments in a track are in
+        record order, so with `record_range` the rest of a track is skipped once the range is passed.
+
+        Arguments are checked when called, before the first segment is read. Effect types are matched exactly.
+
+        Args
+        ----
+            `selection` (list):
+                Sequences, clips, or segments. Segments are filtered but not walked.
+
+            `effect_type` (str | list[str] | None, optional):
+                Only yield segments with a Timeline FX of this type, or any of these types.
+                (Default: `None`)
+
+            `include_hidden` (bool, optional):
+                Yield hidden segments.
+                (Default: `True`)
+
+            `include_gaps` (bool, optional):
+                Yield gaps.
+                (Default: `True`)
+
+            `track_type` (str, optional):
+                Tracks to walk: `video`, `audio`, or `all`.
+                (Default: `video`)
+
+            `record_range` (tuple[int, int] | None, optional):
+                Only yield segments overlapping this (start, end) range of record frames. End is exclusive.
+                (Default: `None`)
+
+        Yields
+        ------
+            flame.PySegment:
+                Segments that pass all filters.
+
+        Example
+        -------
+            Get all visible segments with Text Timeline FX:
+            ```
+            for segment in pyflame.iterate_segments(selection, effect_type='Text', include_hidden=False):
+                ...
+            ```
+        """
+
+        effect_type = pyflame._check_segment_filters('pyflame.iterate_segments', selection, effect_type, track_type, record_range)
+
+        segments = pyflame._iterate_filtered_segments(selection, effect_type, include_hidden, include_gaps, track_type, record_range, read_effects=False)
+
+        return (segment for segment, effects in segments)
+
+    @staticmethod
+    def iterate_effects(selection: list,
+                        effect_type: str | list[str] | None=None,
+                        include_hidden: bool=True,
+                        track_type: str='video',
+                        record_range: Tuple[int, int] | None=None,
+                        ):
+        """
+        Iterate Effects
+        ===============
+
+        Yield (segment, effect) pairs across a selection of sequences/clips.
+
+        Same as `pyflame.iterate_segments`, but yields each matching Timeline FX along with its
+        segment. Gaps are always skipped since they can't hold Timeline FX.
+
+        Arguments are checked when called, before the first segment is read. Effect types are matched exactly.
+
+        Args
+        ----
+            `selection` (list):
+                Sequences, clips, or segments.
+
+            `effect_type` (str | list[str] | None, optional):
+                Only yield Timeline FX of this type, or any of these types.
+                (Default: `None`)
+
+            `include_hidden` (bool, optional):
+                Yield Timeline FX on hidden segments.
+                (Default: `True`)
+
+            `track_type` (str, optional):
+                Tracks to walk: `video`, `audio`, or `all`.
+                (Default: `video`)
+
+            `record_range` (tuple[int, int] | None, optional):
+                Only walk segments overlapping this (start, end) range of record frames. End is exclusive.
+                (Default: `None`)
+
+        Yields
+        ------
+            tuple[flame.PySegment, flame.PyTimelineFX]:
+                Segment and Timeline FX.
+
+        Example
+        -------
+            Save all Action Timeline FX setups:
+            ```
+            for segment, effect in pyflame.iterate_effects(selection, effect_type='Action'):
+                effect.save_setup(path)
+            ```
+        """
+
+        effect_type = pyflame._check_segment_filters('pyflame.iterate_effects', selection, effect_type, track_type, record_range)
+
+        segments = pyflame._iterate_filtered_segments(selection, effect_type, include_hidden, False, track_type, record_range, read_effects=True)
+
+        return (
+            (segment, effect)
+            for segment, effects in segments
+            for effect, effect_type_value in effects
+            if effect_type is None or effect_type_value in effect_type
+            )
+
+    @staticmethod
+    def _check_segment_filters(function_name, selection, effect_type, track_type, record_range) -> frozenset | None:
+        """
+        Check Segment Filters
+        =====================
+
+        Validate arguments shared by `iterate_segments` and `iterate_effects` before any segment is read.
+        Not intended to be used outside of this file.
+
+        Returns `effect_type` as a frozenset of effect types, or None, so effect types are always matched exactly.
+        """
+
+        if not isinstance(selection, (list, tuple)):
+            pyflame.raise_type_error(function_name, 'selection', 'list', selection)
+        if effect_type is not None and not isinstance(effect_type, (str, list, tuple, set, frozenset)):
+            pyflame.raise_type_error(function_name, 'effect_type', 'str | list[str] | None', effect_type)
+        if track_type not in ('video', 'audio', 'all'):
+            pyflame.raise_value_error(function_name, 'track_type', 'video, audio, or all', track_type)
+        if record_range is not None and (not isinstance(record_range, (list, tuple)) or len(record_range) != 2):
+            pyflame.raise_type_error(function_name, 'record_range', 'tuple[int, int] | None', record_range)
+
+        if isinstance(effect_type, str):
+            return frozenset((effect_type,))
+        if effect_type is not None:
+            return frozenset(effect_type)
+
+        return None
+
+    @staticmethod
+    def _iterate_filtered_segments(selection, effect_type, include_hidden, include_gaps, track_type, record_range, read_effects):
+        """
+        Iterate Filtered Segments
+        =========================
+
+        Shared generator for `iterate_segments` and `iterate_effects`. Not intended to be used outside of this file.
+        Arguments must already be checked with `_check_segment_filters`.
+
+        Yields (segment, effects) where effects is a list of (effect, effect type) read once. Effects
+        are only read if `effect_type` is set or `read_effects` is True, otherwise the list is empty.
+        """
+
+        def get_tracks(item):
+            if track_type in ('video', 'all'):
+                for version in item.versions:
+                    for track in version.tracks:
+                        yield track
+            if track_type in ('audio', 'all'):
+                for audio_track in item.audio_tracks:
+                    for channel in audio_track.channels:
+                        yield channel
+
+        def check_segment(segment):
+            # Returns (passed, effects, past_range)
+            if record_range is not None:
+                record_in = segment.record_in.frame
+                if record_in >= record_range[1]:
+                    return False, [], True
+                if segment.record_out.frame <= record_range[0]:
+                    return False, [], False
+
+            is_gap = segment.type == 'Gap'
+            if is_gap and (not include_gaps or effect_type is not None):
+                return False, [], False
+
+            if not include_hidden and segment.hidden.get_value():
+                return False, [], False
+
+            effects = []
+            if (effect_type is not None or read_effects) and not is_gap:
+                effects = [(effect, effect.type) for effect in segment.effects]
+                if effect_type is not None and not any(effect_type_value in effect_type for effect, effect_type_value in effects):
+                    return False, [], False
+
+            return True, effects, False
+
+        for item in selection:
+            if isinstance(item, flame.PySegment):
+                passed, effects, past_range = check_segment(item)
+                if passed:
+                    yield item, effects
+                continue
+
+            for track in get_tracks(item):
+                for segment in track.segments:
+                    passed, effects, past_range = check_segment(segment)
+                    if past_range:
+                        break
+                    if passed:
+                        yield segment, effects
+
 pyflame = _PyFlame
 
 #-------------------------------------
@@ -3994,124 +4527,1232 @@ class PyFlameConfig:
             indent=2,
             )
 
-        print('-' * 28, '\n')
+        print('-' * 28, '\n')
+
+        pyflame.print('Script Configuration Loaded', arrow=True)
+
+    def save_config(self, config_values: Dict[str, Any] | None=None, config_path: str | None=None) -> None:
+        """
+        Save Config
+        ===========
+
+        Saves the current configuration values to the JSON file.
+
+        This method updates the configuration values with any provided values and writes them to
+        the configuration file specified by `config_path`. It ensures that existing values are
+        preserved unless explicitly overwritten.
+
+        Args
+        ----
+            `config_values` (Dict[str, Any]):
+                A dictionary of configuration values to update.
+                (Default: None)
+
+            `config_path` (str):
+                The file path to save the configuration JSON file. This does not need to be set in most cases.
+                (Default: None)
+
+        Raises
+        ------
+            TypeError:
+                If `config_values` is not a dictionary.
+
+        Example
+        -------
+            To save the current configuration values:
+            ```
+            settings.save_config(
+                config_values={
+                    'camera_path': self.path_entry.text(),
+                    'scene_scale': self.scene_scale_slider.get_value(),
+                    'import_type': self.import_type.text(),
+                    'st_map_setup': self.st_map_setup.isChecked(),
+                    }
+                )
+            ```
+        """
+
+        # Validate Argument types
+        if config_values is not None and not isinstance(config_values, dict):
+            raise TypeError(f"PyFlameConfig.save_config: Expected 'config_values' to be a dictionary | None, got {type(config_values).__name__} instead.")
+        if config_path is not None and not isinstance(config_path, str):
+            raise TypeError(f"PyFlameConfig.save_config: Expected 'config_path' to be a str | None, got {type(config_path).__name__} instead.")
+
+        pyflame.print('Saving Script Configuration', underline=True, )
+
+        if config_path is None:
+            config_path = self.config_path
+
+        if config_values:
+            self.config_values.update(config_values)
+
+        # Ensure the script name is in the config
+        self.config_values['script_name'] = self.script_name
+
+        # script_name should be the first key in the config
+        self.config_values = {key: self.config_values[key] for key in ['script_name'] + list(self.config_values.keys())}
+
+        # Read existing config to keep unaltered values
+        if os.path.exists(config_path):
+            with open(config_path, 'r') as f:
+                existing_config: Dict[str, Any] = json.load(f)
+        else:
+            existing_config = {}
+
+        # Update only provided values
+        existing_config.update(self.config_values)
+
+        with open(config_path, 'w') as f:
+            json.dump(existing_config, f, indent=4)
+
+        # Update the instance attributes with new config values
+        for key, value in self.config_values.items():
+            setattr(self, key, value)
+
+        # Print values to terminal
+        pyflame.print_json(
+            json_data=self.config_values,
+            indent=2,
+            )
+
+        print('-' * 27, '\n')
+
+        pyflame.print('Script Configuration Saved', arrow=True)
+
+    def get_config_values(config_path: str) -> Dict[str, Any]:
+        """
+        Get Config Values
+        =================
+
+        Returns the current configuration values.
+
+        This method provides access to the current state of configuration values stored in the instance.
+
+        Args
+        ----
+            `config_path` (str):
+                The file path to the configuration JSON file.
+
+        Returns
+        -------
+            Dict[str, Any]: The current configuration values.
+        """
+
+        # Validate Argument type
+        if not isinstance(config_path, str):
+            raise TypeError(f"PyFlameConfig.get_config_values: Expected 'config_path' to be a string, got {type(config_path).__name__} instead.")
+
+        # Load the configuration from the JSON file
+        with open(config_path, 'r') as f:
+            return json.load(f)
+
+class PyFlameTempFiles:
+    """
+    PyFlameTempFiles
+    ================
+
+    Hands out unique scratch paths for setup save/load round trips.
+
+    Each instance gets its own folder, so two Flame sessions, or two operations in the same
+    session, never write to the same file. The folder is created in RAM backed `/dev/shm` when it
+    is available, otherwise in the system temp folder. The folder and everything in it is deleted
+    on cleanup unless `keep` is True.
+
+    Args
+    ----
+        `prefix` (str, optional):
+            Prefix of the temp folder name. The process id is added to the prefix.
+            (Default: `SCRIPT_NAME`)
+
+        `keep` (bool, optional):
+            Keep the temp folder and its files after cleanup for debugging. Path is printed.
+            (Default: `False`)
+
+    Properties
+    ----------
+        `folder` (str):
+            Path to the temp folder. Created on first use.
+
+    Methods
+    -------
+        `path(name: str='setup', extension: str='')` -> str:
+            Return a new unique path inside the temp folder.
+
+        `cleanup()`:
+            Delete the temp folder unless `keep` is True.
+
+    Examples
+    --------
+        Save and reload a Timeline FX setup:
+        ```
+        with PyFlameTempFiles() as temp_files:
+            for segment in segments:
+                setup_path = temp_files.path('action', '.action')
+                action_fx.save_setup(setup_path)
+                ...
+                action_fx.load_setup(setup_path)
+        ```
+    """
+
+    def __init__(self, prefix: str=SCRIPT_NAME, keep: bool=False) -> None:
+
+        # Validate Arguments
+        if not isinstance(prefix, str):
+            raise TypeError(f"PyFlameTempFiles: Expected 'prefix' to be a string, got {type(prefix).__name__} instead.")
+        if not isinstance(keep, bool):
+            raise TypeError(f"PyFlameTempFiles: Expected 'keep' to be a bool, got {type(keep).__name__} instead.")
+
+        self.prefix = re.sub(r'[^\w.-]', '_', prefix.strip().lower())
+        self.keep = keep
+        self._folder = None
+        self._count = 0
+
+    def __enter__(self) -> 'PyFlameTempFiles':
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback) -> bool:
+
+        self.cleanup()
+
+        # Don't suppress exceptions
+        return False
+
+    @staticmethod
+    def temp_root() -> str:
+        """
+        Temp Root
+        =========
+
+        Return `/dev/shm` if it is a writable folder, otherwise the system temp folder.
+        """
+
+        if os.path.isdir('/dev/shm') and os.access('/dev/shm', os.W_OK | os.X_OK):
+            return '/dev/shm'
+        return tempfile.gettempdir()
+
+    @property
+    def folder(self) -> str:
+
+        if self._folder is None:
+            self._folder = tempfile.mkdtemp(prefix=f'{self.prefix}_{os.getpid()}_', dir=self.temp_root())
+        return self._folder
+
+    def path(self, name: str='setup', extension: str='') -> str:
+        """
+        Path
+        ====
+
+        Return a new unique path inside the temp folder. The file is not created.
+
+        Args
+        ----
+            `name` (str):
+                Base name of the file.
+                (Default: `setup`)
+
+            `extension` (str):
+                Extension added to the file name, including the dot.
+                (Default: `''`)
+
+        Returns
+        -------
+            str:
+                Unique path in the temp folder.
+        """
+
+        self._count += 1
+        return os.path.join(self.folder, f'{name}_{self._count:04d}{extension}')
+
+    def cleanup(self) -> None:
+        """
+        Cleanup
+        =======
+
+        Delete the temp folder unless `keep` is True. Paths handed out after cleanup go in a new
+        temp folder.
+        """
+
+        if self._folder is None:
+            return
+
+        if self.keep:
+            print(f'PyFlameTempFiles: Temp files kept: {self._folder}')
+        else:
+            shutil.rmtree(self._folder, ignore_errors=True)
+
+        self._folder = None
+
+class PyFlameTimelineSnapshot:
+    """
+    PyFlameTimelineSnapshot
+    =======================
+
+    Read-only, column based snapshot of the segments in a selection of sequences.
+
+    The selection is walked once and each requested attribute is read once per segment. Queries,
+    filters, and group-bys then run against the snapshot in memory instead of the Flame API.
+    Frame and resolution columns are stored as integer arrays, everything else as lists. Row `i`
+    of every column belongs to the same segment.
+
+    Only the flame objects passed in are used, so the snapshot can be built from stand-in objects
+    with the same attributes.
+
+    Args
+    ----
+        `selection` (list):
+            Sequences or clips to snapshot.
+
+        `columns` (list[str] | None, optional):
+            Columns to capture. Capturing fewer columns means fewer Flame API reads. `segment` and
+            `sequence_name` are always captured. If None, all columns are captured.
+            (Default: `None`)
+
+        `include_hidden` (bool, optional):
+            Include hidden segments.
+            (Default: `True`)
+
+        `include_gaps` (bool, optional):
+            Include gaps.
+            (Default: `False`)
+
+        `track_type` (str, optional):
+            Tracks to walk: `video`, `audio`, or `all`.
+            (Default: `video`)
+
+    Columns
+    -------
+        `segment`: flame.PySegment
+        `sequence_name`: Name of the sequence the segment is in.
+        `name`: Segment name.
+        `shot_name`: Segment shot name.
+        `record_in`, `record_out`: Record frames.
+        `source_in`, `source_out`: Source frames. -1 if not available.
+        `source_width`, `source_height`: Source resolution. -1 if not available.
+        `file_path`: Source file path.
+        `tape_name`: Source tape name.
+        `colour`: Segment colour as an RGB tuple.
+        `effect_types`: Tuple of Timeline FX types on the segment.
+
+    Methods
+    -------
+        `column(name: str)` -> list | array:
+            Get a column.
+
+        `row(index: int)` -> dict:
+            Get a row as a dictionary of captured columns.
+
+        `where(**conditions)` -> list[int]:
+            Row indexes where every column matches. A condition can be a value or a callable.
+
+        `group_by(name: str, rows: list[int] | None=None)` -> dict[Any, list[int]]:
+            Group row indexes by the value of a column.
+
+        `unique(name: str, rows: list[int] | None=None)` -> list:
+            Unique values of a column in row order.
+
+        `segments(rows: list[int] | None=None)` -> list[flame.PySegment]:
+            Segments for row indexes.
+
+    Examples
+    --------
+        Get all resolutions in selected sequences:
+        ```
+        snapshot = PyFlameTimelineSnapshot(selection, columns=['source_width', 'source_height'])
+        resolutions = snapshot.unique('source_width'), snapshot.unique('source_height')
+        ```
+
+        Get segments with Text Timeline FX, grouped by shot:
+        ```
+        snapshot = PyFlameTimelineSnapshot(selection, columns=['shot_name', 'effect_types'])
+        rows = snapshot.where(effect_types=lambda types: 'Text' in types)
+        shots = snapshot.group_by('shot_name', rows)
+        ```
+    """
+
+    COLUMNS = (
+        'segment',
+        'sequence_name',
+        'name',
+        'shot_name',
+        'record_in',
+        'record_out',
+        'source_in',
+        'source_out',
+        'source_width',
+        'source_height',
+        'file_path',
+        'tape_name',
+        'colour',
+        'effect_types',
+        )
+
+    _INT_COLUMNS = ('record_in', 'record_out', 'source_in', 'source_out', 'source_width', 'source_height')
+
+    def __init__(self,
+                 selection: list,
+                 columns: list[str] | None=None,
+                 include_hidden: bool=True,
+                 include_gaps: bool=False,
+                 track_type: str='video',
+                 ) -> None:
+
+        # Validate Arguments
+        if not isinstance(selection, (list, tuple)):
+            pyflame.raise_type_error('PyFlameTimelineSnapshot', 'selection', 'list', selection)
+        if columns is not None:
+            if not isinstance(columns, (list, tuple)):
+                pyflame.raise_type_error('PyFlameTimelineSnapshot', 'columns', 'list[str] | None', columns)
+            unknown = [name for name in columns if name not in self.COLUMNS]
+            if unknown:
+                pyflame.raise_value_error('PyFlameTimelineSnapshot', 'columns', f'any of {", ".join(self.COLUMNS)}', unknown)
+        if track_type not in ('video', 'audio', 'all'):
+            pyflame.raise_value_error('PyFlameTimelineSnapshot', 'track_type', 'video, audio, or all', track_type)
+
+        if columns is None:
+            columns = self.COLUMNS
+
+        self.column_names = tuple(name for name in self.COLUMNS if name in ('segment', 'sequence_name') or name in columns)
+        self._columns = {name: array('q') if name in self._INT_COLUMNS else [] for name in self.column_names}
+
+        self._build(selection, include_hidden, include_gaps, track_type)
+
+    def __len__(self) -> int:
+
+        return len(self._columns['segment'])
+
+    @staticmethod
+    def _value(attribute) -> Any:
+        """
+        Get the value of a PyAttribute, or the object itself if it isn't one.
+        """
+
+        if hasattr(attribute, 'get_value'):
+            return attribute.get_value()
+        return attribute
+
+    @staticmethod
+    def _frame(pytime) -> int:
+        """
+        Get the frame number of a PyTime, or -1 if not available.
+        """
+
+        frame = getattr(pytime, 'frame', None)
+        return frame if isinstance(frame, int) else -1
+
+    def _build(self, selection, include_hidden, include_gaps, track_type) -> None:
+
+        columns = self._columns
+        value = self._value
+        frame = self._frame
+
+        for sequence in selection:
+            sequence_name = value(sequence.name)
+
+            tracks = []
+            if track_type in ('video', 'all'):
+                tracks.extend(track for version in sequence.versions for track in version.tracks)
+            if track_type in ('audio', 'all'):
+                tracks.extend(channel for audio_track in sequence.audio_tracks for channel in audio_track.channels)
+
+            for track in tracks:
+                for segment in track.segments:
+                    if not include_gaps and segment.type == 'Gap':
+                        continue
+                    if not include_hidden and segment.hidden.get_value():
+                        continue
+
+                    columns['segment'].append(segment)
+                    columns['sequence_name'].append(sequence_name)
+
+                    if 'name' in columns:
+                        columns['name'].append(value(segment.name))
+                    if 'shot_name' in columns:
+                        columns['shot_name'].append(value(segment.shot_name))
+                    if 'record_in' in columns:
+                        columns['record_in'].append(frame(segment.record_in))
+                    if 'record_out' in columns:
+                        columns['record_out'].append(frame(segment.record_out))
+                    if 'source_in' in columns:
+                        columns['source_in'].append(frame(segment.source_in))
+                    if 'source_out' in columns:
+                        columns['source_out'].append(frame(segment.source_out))
+                    if 'source_width' in columns:
+                        columns['source_width'].append(getattr(segment, 'source_width', None) or -1)
+                    if 'source_height' in columns:
+                        columns['source_height'].append(getattr(segment, 'source_height', None) or -1)
+                    if 'file_path' in columns:
+                        columns['file_path'].append(getattr(segment, 'file_path', ''))
+                    if 'tape_name' in columns:
+                        columns['tape_name'].append(value(getattr(segment, 'tape_name', '')))
+                    if 'colour' in columns:
+                        columns['colour'].append(tuple(segment.colour))
+                    if 'effect_types' in columns:
+                        columns['effect_types'].append(tuple(effect.type for effect in segment.effects))
+
+    #-------------------------------------
+    # [Methods]
+    #-------------------------------------
+
+    def column(self, name: str) -> list:
+        """
+        Column
+        ======
+
+        Get a column.
+
+        Args
+        ----
+            `name` (str):
+                Column name.
+
+        Returns
+        -------
+            list | array:
+                Column values, one per row.
+
+        Raises
+        ------
+            ValueError:
+                If column was not captured.
+        """
+
+        if name not in self._columns:
+            pyflame.raise_value_error('PyFlameTimelineSnapshot.column', 'name', f'any of {", ".join(self.column_names)}', name)
+
+        return self._columns[name]
+
+    def row(self, index: int) -> Dict[str, Any]:
+        """
+        Row
+        ===
+
+        Get a row as a dictionary of captured columns.
+        """
+
+        return {name: values[index] for name, values in self._columns.items()}
+
+    def where(self, **conditions) -> List[int]:
+        """
+        Where
+        =====
+
+        Get row indexes where every column matches its condition.
+
+        A condition can be a value to compare with `==`, or a callable that takes the column value
+        and returns True or False.
+
+        Example
+        -------
+            ```
+            rows = snapshot.where(source_width=1920, shot_name=lambda name: name.startswith('ABC'))
+            ```
+        """
+
+        rows = range(len(self))
+
+        for name, condition in conditions.items():
+            values = self.column(name)
+            if callable(condition):
+                rows = [row for row in rows if condition(values[row])]
+            else:
+                rows = [row for row in rows if values[row] == condition]
+
+        return list(rows)
+
+    def group_by(self, name: str, rows: List[int] | None=None) -> Dict[Any, List[int]]:
+        """
+        Group By
+        ========
+
+        Group row indexes by the value of a column.
+
+        Args
+        ----
+            `name` (str):
+                Column to group by.
+
+            `rows` (list[int] | None):
+                Row indexes to group. If None, all rows.
+                (Default: `None`)
+
+        Returns
+        -------
+            dict:
+                Dictionary of {column value: [row indexes]} in row order.
+        """
+
+        values = self.column(name)
+        groups = {}
+
+        for row in (range(len(self)) if rows is None else rows):
+            groups.setdefault(values[row], []).append(row)
+
+        return groups
+
+    def unique(self, name: str, rows: List[int] | None=None) -> list:
+        """
+        Unique
+        ======
+
+        Get unique values of a column in row order. For `effect_types`, unique effect types are returned.
+        """
+
+        values = self.column(name)
+        rows = range(len(self)) if rows is None else rows
+
+        if name == 'effect_types':
+            return list(dict.fromkeys(effect_type for row in rows for effect_type in values[row]))
+        return list(dict.fromkeys(values[row] for row in rows))
+
+    def segments(self, rows: List[int] | None=None) -> list:
+        """
+        Segments
+        ========
+
+        Get the flame segments for row indexes. If `rows` is None, all segments.
+        """
+
+        segments = self._columns['segment']
+
+        if rows is None:
+            return list(segments)
+        return [segments[row] for row in rows]
+
+class PyFlameMediaPanelIndex:
+    """
+    PyFlameMediaPanelIndex
+    ======================
+
+    Index of the folders in a Media Panel Library or Folder.
+
+    The folder tree is walked once, the first time the index is used, and maps:
+        - Folder path -> folder. Paths are relative to `search_location`, i.e. 'PYT_0010/Plates'.
+        - Shot name -> folder, from 'ShotName: <shot_name>' folder tags.
+        - Tag -> folder.
+        - Folder -> sub-folders by name, so folders inside a shot folder are found from that shot folder even when
+          sibling folders share its name.
+
+    Use one index for a whole operation instead of searching the Media Panel for every clip. The index
+    does not see folders created after it was built. Call `invalidate()` after creating or deleting
+    folders in `search_location`; the index is rebuilt on the next lookup.
+
+    If more than one folder has the same shot name or tag, the folder closest to `search_location` is used.
+
+    Args
+    ----
+        `search_location` (flame.PyLibrary | flame.PyFolder):
+            Media Panel Library or Folder to index.
+
+    Methods
+    -------
+        `folder(path: str)` -> flame.PyFolder | None:
+            Get folder from path relative to `search_location`.
+
+        `shot_folder(shot_name: str, dest_folder_path: str='')` -> flame.PyFolder | None:
+            Get shot folder, or a folder inside the shot folder.
+
+        `tagged(tag: str)` -> flame.PyFolder | None:
+            Get folder with tag.
+
+        `invalidate()`:
+            Drop the index. It is rebuilt on the next lookup.
+
+    Example
+    -------
+        Move clips to the Plates folder in their shot folders:
+        ```
+        index = PyFlameMediaPanelIndex(flame.projects.current_project.current_workspace.libraries[0])
+
+        for clip in clips:
+            pyflame.move_to_shot_folder(
+                shot_name=pyflame.shot_name_from_clip(clip),
+                pyobject=clip,
+                search_location=index.search_location,
+                dest_folder_path='Shot_Folder/Plates',
+                index=index,
+                )
+        ```
+    """
+
+    def __init__(self, search_location: flame.PyLibrary | flame.PyFolder) -> None:
+
+        # Validate Argument
+        if not isinstance(search_location, (flame.PyLibrary, flame.PyFolder)):
+            pyflame.raise_type_error('PyFlameMediaPanelIndex', 'search_location', 'flame.PyLibrary | flame.PyFolder', search_location)
+
+        self.search_location = search_location
+
+        self._paths = None
+        self._shots = None
+        self._tags = None
+        self._sub_folders = None
+
+    def _build(self) -> None:
+        """
+        Build
+        =====
+
+        Walk the folder tree breadth first, reading each folder's name and tags once.
+        """
+
+        self._paths = {}
+        self._shots = {}
+        self._tags = {}
+        self._sub_folders = {} # id(folder) -> (folder, {sub-folder name: sub-folder})
+
+        queue = [('', None, folder) for folder in self.search_location.folders]
+
+        for parent_path, parent_folder, folder in queue:
+            name = str(folder.name)[1:-1]
+            path = f'{parent_path}/{name}' if parent_path else name
+            self._paths.setdefault(path, folder)
+
+            # The folder is kept with its sub-folders so its id can't be reused while the index exists
+            self._sub_folders[id(folder)] = (folder, {})
+            if parent_folder is not None:
+                self._sub_folders[id(parent_folder)][1].setdefault(name, folder)
+
+            tags = folder.tags.get_value() if getattr(folder, 'tags', None) else []
+
+            for tag in tags:
+                self._tags.setdefault(tag, folder)
+                if tag.startswith('ShotName: '):
+                    self._shots.setdefault(tag.split(': ', 1)[1], folder)
+
+            queue.extend((path, folder, sub_folder) for sub_folder in folder.folders)
+
+        pyflame.print(f'Media Panel Index Built: {len(self._paths)} Folders', print_to_flame=False)
+
+    def _lookup_path(self, path: str) -> flame.PyFolder | None:
+
+        if self._paths is None:
+            self._build()
+
+        return self._paths.get(path.strip('/'))
+
+    #-------------------------------------
+    # [Methods]
+    #-------------------------------------
+
+    def folder(self, path: str) -> flame.PyFolder | None:
+        """
+        Folder
+        ======
+
+        Get folder from path relative to `search_location`.
+
+        Args
+        ----
+            `path` (str):
+                Folder path, i.e. 'PYT_0010/Plates'.
+
+        Returns
+        -------
+            flame.PyFolder | None:
+                Folder, or None if not found.
+        """
+
+        if not isinstance(path, str):
+            pyflame.raise_type_error('PyFlameMediaPanelIndex.folder', 'path', 'str', path)
+
+        return self._lookup_path(path)
+
+    def shot_folder(self, shot_name: str, dest_folder_path: str='') -> flame.PyFolder | None:
+        """
+        Shot Folder
+        ===========
+
+        Get folder tagged with 'ShotName: <shot_name>', or a folder inside it.
+
+        `dest_folder_path` follows the same format as `pyflame.get_media_panel_shot_folder`. The first
+        folder in the path stands for the shot folder. If part of the path does not exist, the deepest
+        existing folder is returned.
+
+        Args
+        ----
+            `shot_name` (str):
+                Name of shot.
+
+            `dest_folder_path` (str, optional):
+                Destination folder path in shot folder, i.e. 'Shot_Folder/Plates'.
+                (Default: ``)
+
+        Returns
+        -------
+            flame.PyFolder | None:
+                Folder, or None if no shot folder is found.
+        """
+
+        if not isinstance(shot_name, str):
+            pyflame.raise_type_error('PyFlameMediaPanelIndex.shot_folder', 'shot_name', 'str', shot_name)
+        if not isinstance(dest_folder_path, str):
+            pyflame.raise_type_error('PyFlameMediaPanelIndex.shot_folder', 'dest_folder_path', 'str', dest_folder_path)
+
+        if self._shots is None:
+            self._build()
+
+        folder = self._shots.get(shot_name)
+        if folder is None:
+            return None
+
+        # Drop the shot folder placeholder, then walk down the shot folder's own sub-folders as far as they exist
+        for folder_name in dest_folder_path.split('/')[1:]:
+            sub_folder = self._sub_folders[id(folder)][1].get(folder_name)
+            if sub_folder is None:
+                break
+            folder = sub_folder
+
+        return folder
+
+    def tagged(self, tag: str) -> flame.PyFolder | None:
+        """
+        Tagged
+        ======
+
+        Get folder with tag.
+
+        Args
+        ----
+            `tag` (str):
+                Full tag, i.e. 'ShotName: PYT_0010'.
+
+        Returns
+        -------
+            flame.PyFolder | None:
+                Folder, or None if not found.
+        """
+
+        if not isinstance(tag, str):
+            pyflame.raise_type_error('PyFlameMediaPanelIndex.tagged', 'tag', 'str', tag)
+
+        if self._tags is None:
+            self._build()
+
+        return self._tags.get(tag)
+
+    def invalidate(self) -> None:
+        """
+        Invalidate
+        ==========
+
+        Drop the index. Call after creating, renaming, tagging, or deleting folders in `search_location`.
+        The index is rebuilt on the next lookup.
+        """
+
+        self._paths = None
+        self._shots = None
+        self._tags = None
+        self._sub_folders = None
+
+class PyFlameNameAllocator:
+    """
+    PyFlameNameAllocator
+    ====================
+
+    Hands out unique names, i.e. for new Batch nodes.
+
+    Existing names are read once into a set. Each allocated name is added to the set, and a counter is
+    kept per base name so the next name for the same base starts where the last one ended. Allocating
+    many names only reads the existing names from Flame once.
+
+    Args
+    ----
+        `existing_names` (list[str] | None, optional):
+            Names already in use.
+            (Default: `None`)
+
+        `separator` (str, optional):
+            String between base name and number.
+            (Default: ``)
+
+        `start` (int, optional):
+            First number to append to a base name.
+            (Default: `1`)
+
+    Methods
+    -------
+        `from_batch(batch: flame.PyBatch | None=None, separator: str='', start: int=1)` -> PyFlameNameAllocator:
+            Create allocator with the names of all nodes in a batch. If batch is None, flame.batch is used.
+
+        `allocate(name: str, numbered: bool=False)` -> str:
+            Get a unique name and register it.
+
+        `register(name: str)`:
+            Register a name created outside of the allocator.
+
+    Example
+    -------
+        Name new nodes:
+        ```
+        names = PyFlameNameAllocator.from_batch(separator='_')
+
+        for clip in clips:
+            node = flame.batch.create_node('Action')
+            node.name = names.allocate('action') # action, action_1, action_2...
+        ```
+    """
+
+    def __init__(self, existing_names: list[str] | None=None, separator: str='', start: int=1) -> None:
+
+        # Validate Arguments
+        if existing_names is not None and not isinstance(existing_names, (list, set, tuple)):
+            pyflame.raise_type_error('PyFlameNameAllocator', 'existing_names', 'list[str] | None', existing_names)
+        if not isinstance(separator, str):
+            pyflame.raise_type_error('PyFlameNameAllocator', 'separator', 'str', separator)
+        if not isinstance(start, int):
+            pyflame.raise_type_error('PyFlameNameAllocator', 'start', 'int', start)
+
+        self.names = set(existing_names) if existing_names is not None else set()
+        self.separator = separator
+        self.start = start
+
+        self._counters = {}
+
+    def __contains__(self, name: str) -> bool:
+
+        return name in self.names
+
+    @classmethod
+    def from_batch(cls, batch: flame.PyBatch | None=None, separator: str='', start: int=1) -> 'PyFlameNameAllocator':
+        """
+        From Batch
+        ==========
+
+        Create allocator with the names of all nodes in a batch.
+
+        Args
+        ----
+            `batch` (flame.PyBatch | None, optional):
+                Batch to read node names from. If None, flame.batch is used.
+                (Default: `None`)
+
+            `separator` (str, optional):
+                String between base name and number.
+                (Default: ``)
+
+            `start` (int, optional):
+                First number to append to a base name.
+                (Default: `1`)
+
+        Returns
+        -------
+            PyFlameNameAllocator
+        """
+
+        if batch is None:
+            batch = flame.batch
+
+        return cls([str(node.name)[1:-1] for node in batch.nodes], separator, start)
+
+    def allocate(self, name: str, numbered: bool=False) -> str:
+        """
+        Allocate
+        ========
+
+        Get a unique name and register it.
+
+        The name is returned as is if unused, otherwise a number is appended. Numbers count up from
+        `start` and continue from the last number handed out for the same name.
+
+        Args
+        ----
+            `name` (str):
+                Base name.
+
+            `numbered` (bool, optional):
+                Always append a number, even if the base name is unused.
+                (Default: `False`)
+
+        Returns
+        -------
+            str:
+                Unique name.
+        """
+
+        if not isinstance(name, str):
+            pyflame.raise_type_error('PyFlameNameAllocator.allocate', 'name', 'str', name)
+
+        if not numbered and name not in self.names:
+            self.names.add(name)
+            return name
+
+        number = self._counters.get(name, self.start)
+        unique_name = f'{name}{self.separator}{number}'
+
+        while unique_name in self.names:
+            number += 1
+            unique_name = f'{name}{self.separator}{number}'
+
+        self._counters[name] = number + 1
+        self.names.add(unique_name)
+
+        return unique_name
+
+    def register(self, name: str) -> None:
+        """
+        Register
+        ========
+
+        Register a name created outside of the allocator so it is not handed out.
+
+        Args
+        ----
+            `name` (str):
+                Name in use.
+        """
+
+        if not isinstance(name, str):
+            pyflame.raise_type_error('PyFlameNameAllocator.register', 'name', 'str', name)
+
+        self.names.add(name)
+
+class PyFlameBatchGraph:
+    """
+    PyFlameBatchGraph
+    =================
+
+    Describe Batch nodes, connections, and layout first, then create everything in one pass.
+
+    Nodes are added by key. Positions can be absolute or relative to another node in the graph or an
+    existing Batch node. Names and positions are resolved in memory when `build()` is called: existing
+    node names are read once, existing node positions are read once per anchor node, then nodes are
+    created, named, positioned, and connected in the order they were added.
+
+    Args
+    ----
+        `batch` (flame.PyBatch | None, optional):
+            Batch to build in. If None, flame.batch is used.
+            (Default: `None`)
+
+    Methods
+    -------
+        `add_node(key: str, node_type: str, name: str='', position: tuple[int, int] | None=None, relative_to: str | flame.PyNode | None=None, offset: tuple[int, int]=(0, 0), attributes: dict | None=None)` -> str:
+            Add a node to the graph.
+
+        `connect(source: str | flame.PyNode, source_socket: str, dest: str | flame.PyNode, dest_socket: str)`:
+            Add a connection. Nodes can be graph keys or existing Batch nodes.
+
+        `build(organize: bool=False)` -> dict[str, flame.PyNode]:
+            Create nodes and connections. Returns created nodes by key.
+
+    Example
+    -------
+        Add a Mux after a node with a Blur after it:
+        ```
+        graph = PyFlameBatchGraph()
+        graph.add_node('mux', 'Mux', name='mux', relative_to=selected_node, offset=(300, 0))
+        graph.add_node('blur', 'Blur', relative_to='mux', offset=(300, 0))
+        graph.connect(selected_node, 'Default', 'mux', 'Default')
+        graph.connect('mux', 'Default', 'blur', 'Default')
+        nodes = graph.build()
+        ```
+    """
+
+    def __init__(self, batch: flame.PyBatch | None=None) -> None:
 
-        pyflame.print('Script Configuration Loaded', arrow=True)
+        self.batch = batch if batch is not None else flame.batch
 
-    def save_config(self, config_values: Dict[str, Any] | None=None, config_path: str | None=None) -> None:
-        """
-        Save Config
-        ===========
+        self._nodes = {}
+        self._connections = []
 
-        Saves the current configuration values to the JSON file.
+    def add_node(self,
+                 key: str,
+                 node_type: str,
+                 name: str='',
+                 position: tuple[int, int] | None=None,
+                 relative_to: str | flame.PyNode | None=None,
+                 offset: tuple[int, int]=(0, 0),
+                 attributes: dict[str, Any] | None=None,
+                 ) -> str:
+        """
+        Add Node
+        ========
 
-        This method updates the configuration values with any provided values and writes them to
-        the configuration file specified by `config_path`. It ensures that existing values are
-        preserved unless explicitly overwritten.
+        Add a node to the graph.
 
         Args
         ----
-            `config_values` (Dict[str, Any]):
-                A dictionary of configuration values to update.
-                (Default: None)
+            `key` (str):
+                Key used to refer to the node in the graph.
 
-            `config_path` (str):
-                The file path to save the configuration JSON file. This does not need to be set in most cases.
-                (Default: None)
+            `node_type` (str):
+                Batch node type, i.e. 'Mux'.
+
+            `name` (str, optional):
+                Node name. A number is appended if the name is in use. If empty, Flame names the node.
+                (Default: ``)
+
+            `position` (tuple[int, int] | None, optional):
+                Absolute position. Used if `relative_to` is None. If both are None, the node is placed at the
+                Batch cursor position.
+                (Default: `None`)
+
+            `relative_to` (str | flame.PyNode | None, optional):
+                Graph key or existing Batch node to position relative to.
+                (Default: `None`)
+
+            `offset` (tuple[int, int], optional):
+                X and Y offset from `relative_to`.
+                (Default: `(0, 0)`)
+
+            `attributes` (dict | None, optional):
+                Node attributes to set after creation, i.e. {'range_active': True}.
+                (Default: `None`)
+
+        Returns
+        -------
+            str:
+                Node key.
 
         Raises
         ------
-            TypeError:
-                If `config_values` is not a dictionary.
+            ValueError:
+                If `key` is already in the graph or `relative_to` is not in the graph.
+        """
 
-        Example
-        -------
-            To save the current configuration values:
-            ```
-            settings.save_config(
-                config_values={
-                    'camera_path': self.path_entry.text(),
-                    'scene_scale': self.scene_scale_slider.get_value(),
-                    'import_type': self.import_type.text(),
-                    'st_map_setup': self.st_map_setup.isChecked(),
-                    }
-                )
-            ```
+        # Validate Arguments
+        if not isinstance(key, str):
+            pyflame.raise_type_error('PyFlameBatchGraph.add_node', 'key', 'str', key)
+        if key in self._nodes:
+            pyflame.raise_value_error('PyFlameBatchGraph.add_node', 'key', 'a key not already in the graph', key)
+        if not isinstance(node_type, str):
+            pyflame.raise_type_error('PyFlameBatchGraph.add_node', 'node_type', 'str', node_type)
+        if not isinstance(name, str):
+            pyflame.raise_type_error('PyFlameBatchGraph.add_node', 'name', 'str', name)
+        if isinstance(relative_to, str) and relative_to not in self._nodes:
+            pyflame.raise_value_error('PyFlameBatchGraph.add_node', 'relative_to', 'a key already in the graph', relative_to)
+
+        self._nodes[key] = {
+            'node_type': node_type,
+            'name': name,
+            'position': position,
+            'relative_to': relative_to,
+            'offset': offset,
+            'attributes': attributes or {},
+            }
+
+        return key
+
+    def connect(self, source: str | flame.PyNode, source_socket: str, dest: str | flame.PyNode, dest_socket: str) -> None:
         """
+        Connect
+        =======
 
-        # Validate Argument types
-        if config_values is not None and not isinstance(config_values, dict):
-            raise TypeError(f"PyFlameConfig.save_config: Expected 'config_values' to be a dictionary | None, got {type(config_values).__name__} instead.")
-        if config_path is not None and not isinstance(config_path, str):
-            raise TypeError(f"PyFlameConfig.save_config: Expected 'config_path' to be a str | None, got {type(config_path).__name__} instead.")
+        Add a connection. Connections are made in the order they are added, after all nodes are created.
 
-        pyflame.print('Saving Script Configuration', underline=True, )
+        Args
+        ----
+            `source` (str | flame.PyNode):
+                Graph key or existing Batch node.
 
-        if config_path is None:
-            config_path = self.config_path
+            `source_socket` (str):
+                Output socket name, i.e. 'Default'.
 
-        if config_values:
-            self.config_values.update(config_values)
+            `dest` (str | flame.PyNode):
+                Graph key or existing Batch node.
 
-        # Ensure the script name is in the config
-        self.config_values['script_name'] = self.script_name
+            `dest_socket` (str):
+                Input socket name, i.e. 'Front'.
+        """
 
-        # script_name should be the first key in the config
-        self.config_values = {key: self.config_values[key] for key in ['script_name'] + list(self.config_values.keys())}
+        for arg_name, node in (('source', source), ('dest', dest)):
+            if isinstance(node, str) and node not in self._nodes:
+                pyflame.raise_value_error('PyFlameBatchGraph.connect', arg_name, 'a key already in the graph', node)
 
-        # Read existing config to keep unaltered values
-        if os.path.exists(config_path):
-            with open(config_path, 'r') as f:
-                existing_config: Dict[str, Any] = json.load(f)
-        else:
-            existing_config = {}
+        self._connections.append((source, source_socket, dest, dest_socket))
 
-        # Update only provided values
-        existing_config.update(self.config_values)
+    def _resolve_positions(self) -> Dict[str, Tuple[int, int]]:
+        """
+        Resolve Positions
+        =================
 
-        with open(config_path, 'w') as f:
-            json.dump(existing_config, f, indent=4)
+        Resolve absolute positions of all nodes in the graph. Existing anchor node positions are read once.
+        """
 
-        # Update the instance attributes with new config values
-        for key, value in self.config_values.items():
-            setattr(self, key, value)
+        positions = {}
+        anchor_positions = {}
+        cursor_position = None
 
-        # Print values to terminal
-        pyflame.print_json(
-            json_data=self.config_values,
-            indent=2,
-            )
+        def resolve(key):
+            if key in positions:
+                return positions[key]
 
-        print('-' * 27, '\n')
+            node = self._nodes[key]
+            relative_to = node['relative_to']
 
-        pyflame.print('Script Configuration Saved', arrow=True)
+            if isinstance(relative_to, str):
+                base = resolve(relative_to)
+            elif relative_to is not None:
+                if id(relative_to) not in anchor_positions:
+                    anchor_positions[id(relative_to)] = (int(str(relative_to.pos_x)), int(str(relative_to.pos_y)))
+                base = anchor_positions[id(relative_to)]
+            elif node['position'] is not None:
+                base = node['position']
+            else:
+                nonlocal cursor_position
+                if cursor_position is None:
+                    cursor_position = tuple(self.batch.cursor_position)
+                base = cursor_position
 
-    def get_config_values(config_path: str) -> Dict[str, Any]:
-        """
-        Get Config Values
-        =================
+            positions[key] = (int(base[0] + node['offset'][0]), int(base[1] + node['offset'][1]))
 
-        Returns the current configuration values.
+            return positions[key]
 
-        This method provides access to the current state of configuration values stored in the instance.
+        for key in self._nodes:
+            resolve(key)
+
+        return positions
+
+    def build(self, organize: bool=False) -> Dict[str, flame.PyNode]:
+        """
+        Build
+        =====
+
+        Create nodes and connections.
 
         Args
         ----
-            `config_path` (str):
-                The file path to the configuration JSON file.
+            `organize` (bool, optional):
+                Organize the Batch schematic once after everything is created.
+                (Default: `False`)
 
         Returns
         -------
-            Dict[str, Any]: The current configuration values.
+            dict[str, flame.PyNode]:
+                Created nodes by key.
         """
 
-        # Validate Argument type
-        if not isinstance(config_path, str):
-            raise TypeError(f"PyFlameConfig.get_config_values: Expected 'config_path' to be a string, got {type(config_path).__name__} instead.")
+        positions = self._resolve_positions()
 
-        # Load the configuration from the JSON file
-        with open(config_path, 'r') as f:
-            return json.load(f)
+        # Resolve names against a single read of existing node names
+        names = {}
+        if any(node['name'] for node in self._nodes.values()):
+            allocator = PyFlameNameAllocator.from_batch(self.batch)
+            names = {key: allocator.allocate(node['name']) for key, node in self._nodes.items() if node['name']}
+
+        created = {}
+
+        for key, node in self._nodes.items():
+            new_node = self.batch.create_node(node['node_type'])
+            if key in names:
+                new_node.name = names[key]
+            new_node.pos_x, new_node.pos_y = positions[key]
+            for attribute, value in node['attributes'].items():
+                setattr(new_node, attribute, value)
+            created[key] = new_node
+
+        for source, source_socket, dest, dest_socket in self._connections:
+            source = created[source] if isinstance(source, str) else source
+            dest = created[dest] if isinstance(dest, str) else dest
+            self.batch.connect_nodes(source, source_socket, dest, dest_socket)
+
+        if organize:
+            self.batch.organize()
+
+        pyflame.print(f'Batch Graph Built: {len(created)} Nodes, {len(self._connections)} Connections', print_to_flame=False)
+
+        return created
 
 #-------------------------------------
 # [PyFlame QT Widgets]
@@ -23224,6 +24865,297 @@ class PyFlameProgressWindow:
         self.progress_window.text_edit.text = 'Value Error: Check terminal output for more information.'
         self.progress_window.line_color = Color.RED
 
+class PyFlameProgress:
+    """
+    PyFlameProgress
+    ===============
+
+    Context manager around `PyFlameProgressWindow` for driving progress from a plain loop.
+
+    Keeps its own count of completed tasks so scripts don't need to look up the index of the
+    current item, and limits updates to the progress window to `fps` times per second. The
+    window text shows tasks completed, throughput, and estimated time remaining.
+
+    Pressing Escape in the progress window, or calling `cancel()`, cancels the operation.
+    Check `cancelled` inside the loop, or use `iterate()` which stops on its own.
+
+    Args
+    ----
+        `total_tasks` (int):
+            Total number of tasks to be completed.
+
+        `task` (str, optional):
+            Name of task to be displayed in progress window.
+            (Default: `Processing`)
+
+        `title` (str, optional):
+            Text shown in top left of window.
+            (Default: `Processing...`)
+
+        `fps` (int | float, optional):
+            Maximum number of progress window updates per second.
+            (Default: `10`)
+
+        `close_when_done` (bool, optional):
+            Close the progress window on exit. If False the Done button is enabled instead.
+            (Default: `False`)
+
+        `parent` (PyFlameWindow | None, optional):
+            Parent window of the progress window.
+            (Default: `None`)
+
+    Properties
+    ----------
+        `completed` (int):
+            Number of tasks completed.
+
+        `cancelled` (bool):
+            True if the operation has been cancelled.
+
+        `elapsed` (float):
+            Seconds since the operation started.
+
+        `rate` (float):
+            Tasks completed per second.
+
+        `eta` (float | None):
+            Estimated seconds remaining. None until the first task is complete.
+
+    Methods
+    -------
+        `advance(count: int=1, text: str | None=None)`:
+            Mark `count` tasks as complete. Window is only updated if enough time has passed.
+
+        `iterate(items)`:
+            Yield items, advancing after each one. Stops if cancelled.
+
+        `cancel()`:
+            Cancel the operation.
+
+    Examples
+    --------
+        Drive progress from a loop:
+        ```
+        with PyFlameProgress(total_tasks=len(segments), task='Updating Segments') as progress:
+            for segment in segments:
+                if progress.cancelled:
+                    break
+                update_segment(segment)
+                progress.advance()
+        ```
+
+        Or let the progress object drive the loop:
+        ```
+        with PyFlameProgress(total_tasks=len(segments)) as progress:
+            for segment in progress.iterate(segments):
+                update_segment(segment)
+        ```
+    """
+
+    def __init__(self: 'PyFlameProgress',
+                 total_tasks: int,
+                 task: str='Processing',
+                 title: str='Processing...',
+                 fps: int | float=10,
+                 close_when_done: bool=False,
+                 parent: PyFlameWindow | None=None,
+                 ) -> None:
+
+        # Validate Arguments
+        if not isinstance(total_tasks, int):
+            pyflame.raise_type_error('PyFlameProgress', 'total_tasks', 'int', total_tasks)
+        if not isinstance(task, str):
+            pyflame.raise_type_error('PyFlameProgress', 'task', 'str', task)
+        if not isinstance(title, str):
+            pyflame.raise_type_error('PyFlameProgress', 'title', 'str', title)
+        if not isinstance(fps, (int, float)) or fps <= 0:
+            pyflame.raise_value_error('PyFlameProgress', 'fps', 'number greater than 0', fps)
+        if not isinstance(close_when_done, bool):
+            pyflame.raise_type_error('PyFlameProgress', 'close_when_done', 'bool', close_when_done)
+
+        self.total_tasks = total_tasks
+        self.task = task
+        self.title = title
+        self.close_when_done = close_when_done
+        self.parent = parent
+
+        self._interval = 1.0 / fps
+        self._completed = 0
+        self._cancelled = False
+        self._finished = False
+        self._start_time = 0.0
+        self._last_update = 0.0
+        self._text = ''
+        self.progress_window = None
+
+    def __enter__(self) -> 'PyFlameProgress':
+
+        self.progress_window = PyFlameProgressWindow(
+            parent=self.parent,
+            total_tasks=max(self.total_tasks, 1),
+            task=self.task,
+            title=self.title,
+            )
+
+        # Escape key or closing the window cancels
+        self.progress_window.progress_window.escape_pressed = self.cancel
+        self.progress_window.progress_window.rejected.connect(self.cancel)
+
+        self._start_time = time.monotonic()
+        self._update_window()
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback) -> bool:
+
+        self._finished = True
+
+        if exc_type is not None:
+            self.progress_window.title = 'Error: Check terminal.'
+            self.progress_window.line_color = Color.RED
+        elif self._cancelled:
+            self.progress_window.title = 'Cancelled'
+            pyflame.print(f'{self.task} Cancelled: {self._completed} of {self.total_tasks} completed in {self.elapsed:.1f} seconds', print_type=PrintType.WARNING)
+        else:
+            pyflame.print(f'{self.task} Complete: {self._completed} tasks in {self.elapsed:.1f} seconds ({self.rate:.1f} per second)', print_type=PrintType.INFO)
+
+        self.progress_window.tasks_complete = True
+        self.progress_window.text = self._status_text()
+
+        if self.close_when_done or self._cancelled:
+            self.progress_window.close()
+
+        # Don't suppress exceptions
+        return False
+
+    #-------------------------------------
+    # [Properties]
+    #-------------------------------------
+
+    @property
+    def completed(self) -> int:
+
+        return self._completed
+
+    @property
+    def cancelled(self) -> bool:
+
+        return self._cancelled
+
+    @property
+    def elapsed(self) -> float:
+
+        return time.monotonic() - self._start_time
+
+    @property
+    def rate(self) -> float:
+
+        elapsed = self.elapsed
+        if elapsed <= 0:
+            return 0.0
+        return self._completed / elapsed
+
+    @property
+    def eta(self) -> float | None:
+
+        rate = self.rate
+        if not self._completed or not rate:
+            return None
+        return max(self.total_tasks - self._completed, 0) / rate
+
+    #-------------------------------------
+    # [Methods]
+    #-------------------------------------
+
+    def advance(self, count: int=1, text: str | None=None) -> None:
+        """
+        Advance
+        =======
+
+        Mark tasks as complete.
+
+        The progress window is only updated if at least 1/fps seconds have passed since the last
+        update, or if this was the last task.
+
+        Args
+        ----
+            `count` (int):
+                Number of tasks completed.
+                (Default: `1`)
+
+            `text` (str | None):
+                Optional line of text shown in the window under the progress message, such as the
+                name of the item just completed.
+                (Default: `None`)
+        """
+
+        self._completed += count
+
+        if text is not None:
+            self._text = text
+
+        now = time.monotonic()
+
+        if now - self._last_update >= self._interval or self._completed >= self.total_tasks:
+            self._update_window(now)
+
+    def iterate(self, items):
+        """
+        Iterate
+        =======
+
+        Yield each item, advancing progress after the caller is done with it. Stops if cancelled.
+
+        Args
+        ----
+            `items` (iterable):
+                Items to iterate over.
+        """
+
+        for item in items:
+            if self._cancelled:
+                return
+            yield item
+            self.advance()
+
+    def cancel(self) -> None:
+        """
+        Cancel
+        ======
+
+        Cancel the operation. Has no effect once the operation is finished.
+        """
+
+        if not self._finished:
+            self._cancelled = True
+
+    def _status_text(self) -> str:
+
+        lines = [f'{self.task}: [{self._completed} of {self.total_tasks}]']
+
+        if self._completed:
+            eta = self.eta
+            lines.append(f'{self.rate:.1f} per second')
+            if eta is not None and not self._finished:
+                lines.append(f'Time remaining: {datetime.timedelta(seconds=round(eta))}')
+            else:
+                lines.append(f'Elapsed: {datetime.timedelta(seconds=round(self.elapsed))}')
+
+        if self._text:
+            lines.append('')
+            lines.append(self._text)
+
+        return '\n'.join(lines)
+
+    def _update_window(self, now: float | None=None) -> None:
+
+        self._last_update = now if now is not None else time.monotonic()
+
+        # Setting processing_task also processes Qt events, which lets Escape cancel
+        self.progress_window.processing_task = min(self._completed + 1, max(self.total_tasks, 1))
+        self.progress_window.text = self._status_text()
+
+
 class PyFlamePasswordWindow:
     """
     PyFlamePasswordWindow
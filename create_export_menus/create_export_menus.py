@@ -174,9 +174,12 @@ Updates:
 # [Imports]
 #-------------------------------------
 
+import copy
+import datetime
+import json
 import os
 import re
-import shutil
+import xml.etree.ElementTree as ET
 from functools import partial
 
 import flame
@@ -189,6 +192,715 @@ from lib.pyflame_lib_create_export_menus import *
 SCRIPT_NAME = 'Create Export Menus'
 SCRIPT_VERSION = 'v5.4.0'
 SCRIPT_PATH = os.path.abspath(os.path.dirname(__file__))
+MENU_REGISTRY_PATH = os.path.join(SCRIPT_PATH, 'export_menus.json')
+PRESET_CATALOGUE_PATH = os.path.join(SCRIPT_PATH, 'config', 'preset_catalogue.json')
+
+# Matches every export path token in one pass
+TOKEN_PATTERN = re.compile(r'<(ProjectName|ProjectNickName|ShotName|SeqName|SEQNAME|UserName|UserNickName|ClipName|Resolution|ClipHeight|ClipWidth|YYYY|YY|MM|DD|Hour|hour|Minute|AMPM|ampm|TapeName)>')
+
+#-------------------------------------
+# [Menu Registry]
+#-------------------------------------
+
+def load_menu_registry() -> dict:
+    """
+    Load Menu Registry
+    ==================
+
+    Load saved export menus from MENU_REGISTRY_PATH.
+
+    Shared menus are stored by menu name under 'Shared'. Project menus are stored by project name, then menu name,
+    under 'Project'. Each menu is a dict with:
+        flame_version: Minimum version of Flame the menu is shown in.
+        reveal_in_mediahub: Open the export path in the MediaHub after export.
+        reveal_in_finder: Open the export path in the Finder after export.
+        exports: List of exports run for each clip. Each export has the preset tab number, the export preset path,
+                 the tokenized export path and the exporter settings.
+
+    Returns:
+    --------
+        dict: Saved export menus. Empty menus if registry does not exist or can't be read.
+    """
+
+    try:
+        with open(MENU_REGISTRY_PATH, 'r') as registry_file:
+            registry = json.load(registry_file)
+    except (OSError, ValueError):
+        registry = {}
+
+    registry.setdefault('Project', {})
+    registry.setdefault('Shared', {})
+
+    return registry
+
+def save_menu_registry(registry: dict) -> None:
+    """
+    Save Menu Registry
+    ==================
+
+    Save export menus to MENU_REGISTRY_PATH sorted by menu name.
+    """
+
+    registry = {
+        'Project': {project: dict(sorted(menus.items())) for project, menus in sorted(registry['Project'].items()) if menus},
+        'Shared': dict(sorted(registry['Shared'].items())),
+        }
+
+    with open(MENU_REGISTRY_PATH, 'w') as registry_file:
+        json.dump(registry, registry_file, indent=4)
+
+def migrate_menu_scripts(registry: dict) -> bool:
+    """
+    Migrate Menu Scripts
+    ====================
+
+    Move export menus from generated python menu files made by older versions of Create Export Menus into the menu
+    registry and delete the menu files.
+
+    Returns:
+    --------
+        bool: True if any menu files were migrated.
+    """
+
+    def read_menu_script(menu_script_path: str) -> tuple:
+
+        with open(menu_script_path, 'r') as menu_script:
+            script = menu_script.read()
+
+        def setting(name: str, text: str) -> bool:
+            value = re.search(name + r' = (True|False)', text)
+            return bool(value) and value.group(1) == 'True'
+
+        menu_name = re.search(r'Export Menu: (.+)', script)
+        flame_version = re.search(r"'minimumVersion': '([^']*)'", script)
+
+        menu = {
+            'flame_version': flame_version.group(1) if flame_version else '',
+            'reveal_in_mediahub': setting('reveal_in_mediahub', script),
+            'reveal_in_finder': setting('reveal_in_finder', script),
+            'exports': [],
+            }
+
+        for tab, preset_lines in re.findall(r'# Export preset (\w+)\n(.*?)# Export preset \1 END', script, re.S):
+            export_path = re.search(r"translate_tokenized_path\(clip, '([^']*)'\)", preset_lines)
+            preset_path = re.search(r"clip_output\.export\(clip, '([^']*)'", preset_lines)
+            if not export_path or not preset_path:
+                continue
+            export = {
+                'tab': ['One', 'Two', 'Three', 'Four', 'Five'].index(tab) + 1,
+                'preset_path': preset_path.group(1),
+                'export_path': export_path.group(1),
+                'use_top_layer': setting('use_top_video_track', preset_lines),
+                'foreground': setting('foreground', preset_lines),
+                'export_between_marks': setting('export_between_marks', preset_lines),
+                }
+            if 'include_subtitles' in preset_lines:
+                export['include_subtitles'] = setting('include_subtitles', preset_lines)
+                export['subtitles_as_files'] = setting('export_subtitles_as_files', preset_lines)
+                export['all_subtitles'] = setting('export_all_subtitles', preset_lines)
+            menu['exports'].append(export)
+
+        return menu_name.group(1).strip() if menu_name else os.path.basename(menu_script_path)[:-3], menu
+
+    menu_dirs = []
+    shared_menus_dir = os.path.join(SCRIPT_PATH, 'shared_menus')
+    project_menus_dir = os.path.join(SCRIPT_PATH, 'project_menus')
+    if os.path.isdir(shared_menus_dir):
+        menu_dirs.append((shared_menus_dir, registry['Shared']))
+    if os.path.isdir(project_menus_dir):
+        for project in sorted(os.listdir(project_menus_dir)):
+            if os.path.isdir(os.path.join(project_menus_dir, project)):
+                menu_dirs.append((os.path.join(project_menus_dir, project), registry['Project'].setdefault(project, {})))
+
+    migrated = False
+
+    for menu_dir, menus in menu_dirs:
+        for file_name in sorted(os.listdir(menu_dir)):
+            if not file_name.endswith('.py'):
+                continue
+
+            menu_script_path = os.path.join(menu_dir, file_name)
+            menu_name, menu = read_menu_script(menu_script_path)
+            if not menu['exports']:
+                continue
+
+            menus[menu_name] = menu
+
+            os.remove(menu_script_path)
+            if os.path.isfile(menu_script_path + 'c'):
+                os.remove(menu_script_path + 'c')
+
+            pyflame.print(f'Menu Migrated: {menu_name}')
+            migrated = True
+
+    return migrated
+
+#-------------------------------------
+# [Export]
+#-------------------------------------
+
+def get_shot_name(clip, clip_name: str) -> str:
+    """
+    Get Shot Name
+    =============
+
+    Get shot name assigned to clip. If clip has no assigned shot name, guess it from the clip name.
+    """
+
+    try:
+        if clip.versions[0].tracks[0].segments[0].shot_name != '':
+            return str(clip.versions[0].tracks[0].segments[0].shot_name)[1:-1]
+    except:
+        return ''
+
+    shot_name_split = re.split(r'(\d+)', clip_name)
+
+    if len(shot_name_split) > 1:
+        if shot_name_split[1].isalnum():
+            return shot_name_split[0] + shot_name_split[1]
+        return shot_name_split[0] + shot_name_split[1] + shot_name_split[2]
+    return clip_name
+
+def get_tape_name(clip) -> str:
+    """
+    Get Tape Name
+    =============
+
+    Get tape name of clip. Empty string if clip has no tape name.
+    """
+
+    try:
+        return str(clip.versions[0].tracks[0].segments[0].tape_name)
+    except:
+        return ''
+
+# Tokens that are the same for every clip in an export. Values are read once per export.
+SESSION_TOKENS = {
+    'ProjectName': lambda date: flame.project.current_project.name,
+    'ProjectNickName': lambda date: flame.project.current_project.nickname,
+    'UserName': lambda date: flame.users.current_user.name,
+    'UserNickName': lambda date: flame.users.current_user.nickname,
+    'YYYY': lambda date: date.strftime('%Y'),
+    'YY': lambda date: date.strftime('%y'),
+    'MM': lambda date: date.strftime('%m'),
+    'DD': lambda date: date.strftime('%d'),
+    'Hour': lambda date: date.strftime('%H'),
+    'hour': lambda date: date.strftime('%I').lstrip('0'),
+    'Minute': lambda date: date.strftime('%M'),
+    'AMPM': lambda date: date.strftime('%p'),
+    'ampm': lambda date: date.strftime('%p').lower(),
+    }
+
+# Tokens read from each clip. get returns the value of another clip token so values are only read once per clip.
+CLIP_TOKENS = {
+    'ClipName': lambda clip, get: str(clip.name)[1:-1],
+    'ShotName': lambda clip, get: get_shot_name(clip, get('ClipName')),
+    'SeqName': lambda clip, get: re.split('[^a-zA-Z]', get('ShotName'))[0], # Sequence name abreviation from shot name
+    'SEQNAME': lambda clip, get: get('SeqName').upper(),
+    'Resolution': lambda clip, get: f'{get("ClipWidth")}x{get("ClipHeight")}',
+    'ClipHeight': lambda clip, get: str(clip.height),
+    'ClipWidth': lambda clip, get: str(clip.width),
+    'TapeName': lambda clip, get: get_tape_name(clip),
+    }
+
+class ExportPathTranslator:
+    """
+    Export Path Translator
+    ======================
+
+    Replace tokens in export paths for one export.
+
+    Each export path is split into text and tokens once and reused for every clip. Only tokens that are in the export
+    path are read. Project, user and date tokens are read once per translator. Clip tokens are read once per clip,
+    and reused for every export path translated for that clip.
+
+    Args:
+    -----
+        date (datetime.datetime, optional):
+            Time export started. All clips in an export use the same time so time tokens don't change mid export.
+            Default is now.
+
+    Example:
+    --------
+        ```
+        translator = ExportPathTranslator()
+        for clip in selection:
+            export_path = translator.translate(clip, '/exports/<ShotName>/<YYYY><MM><DD>')
+        ```
+    """
+
+    # Compiled export paths, shared by all translators
+    compiled_paths = {}
+
+    def __init__(self, date: datetime.datetime=None) -> None:
+
+        self.date = date or datetime.datetime.now()
+        self.session_values = {}
+
+        # Clip token values keyed by id(clip). The clip is kept with its values so its id can't be reused.
+        self.clip_values = {}
+
+    @classmethod
+    def compile(cls, export_path: str) -> list:
+        """
+        Compile
+        =======
+
+        Split export path into text and token names. Text is at even indexes, token names at odd indexes.
+        """
+
+        if export_path not in cls.compiled_paths:
+            cls.compiled_paths[export_path] = TOKEN_PATTERN.split(export_path)
+
+        return cls.compiled_paths[export_path]
+
+    def translate(self, clip, export_path: str) -> str:
+        """
+        Translate
+        =========
+
+        Replace tokens in export path with values from clip, project, user and export date.
+
+        Args:
+        -----
+            clip (flame.PyClip):
+                Clip being exported.
+            export_path (str):
+                Tokenized export path.
+
+        Returns:
+        --------
+            str: Translated export path.
+        """
+
+        parts = self.compile(export_path)
+        if len(parts) == 1:
+            return export_path
+
+        clip_values = self.clip_values.setdefault(id(clip), (clip, {}))[1]
+
+        def get(token: str) -> str:
+            if token in SESSION_TOKENS:
+                if token not in self.session_values:
+                    self.session_values[token] = SESSION_TOKENS[token](self.date)
+                return self.session_values[token]
+            if token not in clip_values:
+                clip_values[token] = CLIP_TOKENS[token](clip, get)
+            return clip_values[token]
+
+        translated_parts = list(parts)
+        for index in range(1, len(parts), 2):
+            translated_parts[index] = get(parts[index])
+
+        return ''.join(translated_parts)
+
+class ExportQueue:
+    """
+    Export Queue
+    ============
+
+    Export a selection of clips with every export saved in an export menu.
+
+    The whole selection is planned before anything is exported. Every export path is translated and every export
+    directory is created in one pass. Clips going to the same directory with the same export settings are grouped
+    into a single exporter call. Groups are exported one at a time under a single progress window. Escape cancels
+    the groups that haven't started. Failed groups are listed when the queue is done and can be retried.
+
+    Exports saved with Foreground Export off are sent to Flame's background export queue, so Flame can be used while
+    they render.
+
+    Args:
+    -----
+        selection (list):
+            Selected clips.
+        menu_name (str):
+            Export menu name.
+        menu (dict):
+            Export menu from the menu registry.
+    """
+
+    def __init__(self, selection, menu_name: str, menu: dict) -> None:
+
+        self.menu_name = menu_name
+        self.menu = menu
+        self.clip_output = flame.PyExporter()
+
+        self.groups = self.plan([item for item in selection if isinstance(item, flame.PyClip)])
+        self.create_directories()
+
+    def plan(self, clips: list) -> list:
+        """
+        Plan
+        ====
+
+        Translate export paths for every clip and export, and group clips by export and export path.
+
+        Returns:
+        --------
+            list: Export groups. Each group is a dict with the export, export path, clips, and error.
+        """
+
+        translator = ExportPathTranslator()
+
+        groups = {}
+        for clip in clips:
+            for export_index, export in enumerate(self.menu['exports']):
+                export_path = translator.translate(clip, export['export_path'])
+                group = groups.setdefault((export_index, export_path), {
+                    'export': export,
+                    'export_path': export_path,
+                    'clips': [],
+                    'error': '',
+                    })
+                group['clips'].append(clip)
+
+        return list(groups.values())
+
+    def create_directories(self) -> None:
+        """
+        Create Directories
+        ==================
+
+        Create every export directory before the first export. Groups whose directory can't be created are marked
+        as failed.
+        """
+
+        for export_path in sorted({group['export_path'] for group in self.groups}):
+            error = ''
+            if not export_path:
+                error = 'Export path is empty.'
+            else:
+                try:
+                    os.makedirs(export_path, exist_ok=True)
+                except OSError as e:
+                    error = f'Could not create export path: {e}'
+
+            if error:
+                for group in self.groups:
+                    if group['export_path'] == export_path:
+                        group['error'] = error
+
+    def export_group(self, group: dict) -> None:
+        """
+        Export Group
+        ============
+
+        Export clips in group with the group's export settings. Errors are stored in the group.
+        """
+
+        export = group['export']
+
+        self.clip_output.use_top_video_track = export['use_top_layer']
+        self.clip_output.foreground = export['foreground']
+        self.clip_output.export_between_marks = export['export_between_marks']
+
+        # Subtitle settings are only saved with menus created in Flame 2024.2 or later
+        if 'include_subtitles' in export:
+            self.clip_output.include_subtitles = export['include_subtitles']
+            self.clip_output.export_subtitles_as_files = export['subtitles_as_files']
+            self.clip_output.export_all_subtitles = export['all_subtitles']
+
+        try:
+            self.clip_output.export(group['clips'], export['preset_path'], group['export_path'])
+            group['error'] = ''
+        except Exception as e:
+            group['error'] = str(e)
+
+    def run(self, groups: list) -> list:
+        """
+        Run
+        ===
+
+        Export groups under one progress window.
+
+        Args:
+        -----
+            groups (list):
+                Export groups to export.
+
+        Returns:
+        --------
+            list: Groups that failed or were cancelled.
+        """
+
+        failed = [group for group in groups if group['error']]
+        groups = [group for group in groups if not group['error']]
+
+        with PyFlameProgress(total_tasks=len(groups), task='Exporting', title=f'{SCRIPT_NAME}: {self.menu_name}') as progress:
+            for group in groups:
+                if progress.cancelled:
+                    group['error'] = 'Cancelled.'
+                    failed.append(group)
+                    continue
+
+                self.export_group(group)
+
+                clip_names = ', '.join(str(clip.name)[1:-1] for clip in group['clips'])
+                if group['error']:
+                    failed.append(group)
+                    pyflame.print(f'Export Failed: {clip_names}: {group["error"]}', print_type=PrintType.ERROR)
+                else:
+                    pyflame.print(f'Exported: {clip_names}\n', text_color=TextColor.GREEN)
+
+                progress.advance(text=group['export_path'])
+
+        return failed
+
+    def start(self) -> None:
+        """
+        Start
+        =====
+
+        Export all groups. If any fail, list the failures and ask to retry them. Reveal the export path once done.
+        """
+
+        pyflame.print_title(f'{SCRIPT_NAME} - Clip Export {SCRIPT_VERSION}')
+
+        pyflame.print(f'Exporting: {self.menu_name}')
+
+        if not self.groups:
+            return
+
+        failed = self.run(self.groups)
+
+        while failed:
+            failures = '\n'.join(f'{", ".join(str(clip.name)[1:-1] for clip in group["clips"])}: {group["error"]}' for group in failed)
+            if not PyFlameMessageWindow(
+                message=f'{len(failed)} of {len(self.groups)} exports failed:\n\n{failures}\n\nRetry failed exports?',
+                message_type=MessageType.WARNING,
+                title=f'{SCRIPT_NAME}: Export Errors',
+                parent=None,
+                ):
+                return
+
+            for group in failed:
+                group['error'] = ''
+            self.create_directories()
+            failed = self.run(failed)
+
+        export_path = self.groups[-1]['export_path']
+
+        # Open export path in MediaHub after export
+        if self.menu['reveal_in_mediahub']:
+            flame.go_to('MediaHub')
+            flame.mediahub.files.set_path(export_path)
+            pyflame.print('MediaHub opened to export path.')
+
+        # Open export path in finder after export
+        if self.menu['reveal_in_finder']:
+            pyflame.open_in_finder(
+                path=export_path,
+                )
+            pyflame.print('Finder opened to export path.')
+
+        pyflame.print('Export complete.', text_color=TextColor.GREEN)
+
+def export_clips(selection, menu_name: str, menu: dict) -> None:
+    """
+    Export Clips
+    ============
+
+    Export selected clips with every export saved in an export menu.
+
+    Args:
+    -----
+        selection (list):
+            Selected clips.
+        menu_name (str):
+            Export menu name.
+        menu (dict):
+            Export menu from the menu registry.
+    """
+
+    ExportQueue(selection, menu_name, menu).start()
+
+#-------------------------------------
+# [Preset Catalogue]
+#-------------------------------------
+
+class PresetCatalogue:
+    """
+    Preset Catalogue
+    ================
+
+    Cache of export preset directory listings and preset versions, saved to PRESET_CATALOGUE_PATH between sessions.
+
+    Directory listings are cached with the directory mtime. Preset versions are cached with the preset file mtime and
+    size. Presets are only listed and read again when they change. Compatibility is checked against the export preset
+    version of the current version of Flame, which is read once per session.
+    """
+
+    def __init__(self) -> None:
+
+        # Without the current export preset version no preset can be checked, so no presets are compatible.
+        try:
+            self.export_version = pyflame.get_flame_export_preset_version() or ''
+        except (OSError, ET.ParseError) as e:
+            pyflame.print(f'Could Not Read Flame Export Preset Version: {e}', text_color=TextColor.YELLOW)
+            self.export_version = ''
+        self.cache = self.load()
+        self.changed = False
+
+    def load(self) -> dict:
+        """
+        Load
+        ====
+
+        Load cache file. Cache is empty if it is unreadable.
+        """
+
+        try:
+            with open(PRESET_CATALOGUE_PATH, 'r') as cache_file:
+                cache = json.load(cache_file)
+        except (OSError, ValueError):
+            cache = {}
+
+        cache.setdefault('directories', {})
+        cache.setdefault('presets', {})
+
+        return cache
+
+    def save(self) -> None:
+        """
+        Save
+        ====
+
+        Save cache file if anything changed since it was loaded.
+        """
+
+        if not self.changed:
+            return
+
+        try:
+            os.makedirs(os.path.dirname(PRESET_CATALOGUE_PATH), exist_ok=True)
+            with open(PRESET_CATALOGUE_PATH, 'w') as cache_file:
+                json.dump(self.cache, cache_file)
+            self.changed = False
+        except OSError as e:
+            pyflame.print(f'Could Not Save Preset Catalogue: {e}', text_color=TextColor.YELLOW)
+
+    def list_directory(self, directory: str) -> tuple:
+        """
+        List Directory
+        ==============
+
+        Get preset files and sub directories in directory. Directory is only listed again if its mtime changed.
+
+        Returns:
+        --------
+            tuple: Sorted lists of xml file names and sub directory names. Empty lists if directory does not exist
+                or can't be listed.
+        """
+
+        try:
+            mtime = os.stat(directory).st_mtime
+        except OSError:
+            return [], []
+
+        cached = self.cache['directories'].get(directory)
+        if cached and cached['mtime'] == mtime:
+            return cached['files'], cached['dirs']
+
+        files = []
+        dirs = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        dirs.append(entry.name)
+                    elif entry.name.endswith('.xml'):
+                        files.append(entry.name)
+        except OSError:
+            # Listing can fail even when stat works, i.e. no read permission. Treat as empty and don't cache.
+            return [], []
+
+        # Forget versions of presets that were removed from directory
+        if cached:
+            for file in set(cached['files']) - set(files):
+                self.cache['presets'].pop(os.path.join(directory, file), None)
+
+        self.cache['directories'][directory] = {'mtime': mtime, 'files': sorted(files), 'dirs': sorted(dirs)}
+        self.changed = True
+
+        return self.cache['directories'][directory]['files'], self.cache['directories'][directory]['dirs']
+
+    def preset_version(self, path: str) -> str:
+        """
+        Preset Version
+        ==============
+
+        Get export preset version of preset file. Preset is only read again if its mtime or size changed.
+
+        Returns:
+        --------
+            str: Preset version. Empty string if preset can't be read.
+        """
+
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return ''
+
+        cached = self.cache['presets'].get(path)
+        if cached and cached['mtime'] == stat.st_mtime and cached['size'] == stat.st_size:
+            return cached['version']
+
+        version = ''
+        try:
+            for _, element in ET.iterparse(path, events=('start',)):
+                if element.tag == 'preset':
+                    version = element.get('version', '')
+                    break
+        except ET.ParseError:
+            pass
+
+        self.cache['presets'][path] = {
+            'mtime': stat.st_mtime,
+            'size': stat.st_size,
+            'type': 'movie_file' if '/movie_file/' in path else 'file_sequence',
+            'version': version,
+            }
+        self.changed = True
+
+        return version
+
+    def compatible_presets(self, preset_path: str) -> list:
+        """
+        Compatible Presets
+        ==================
+
+        Get export presets in preset_path and its sub directories that are compatible with the current version of
+        Flame. A preset is compatible if its version is less than or equal to the current export preset version.
+
+        Args:
+        -----
+            preset_path (str):
+                Path to export presets to check.
+
+        Returns:
+        --------
+            list: Sorted preset names relative to preset_path without extension. Empty if the current export preset
+                version could not be read.
+        """
+
+        if not self.export_version:
+            return []
+
+        compatible_preset_list = []
+
+        directories = [preset_path]
+        while directories:
+            directory = directories.pop()
+            files, dirs = self.list_directory(directory)
+            directories.extend(os.path.join(directory, d) for d in dirs)
+
+            for file in files:
+                path = os.path.join(directory, file)
+                version = self.preset_version(path)
+                if version and version <= self.export_version:
+                    compatible_preset_list.append(os.path.relpath(path, preset_path)[:-4])
+
+        return sorted(compatible_preset_list)
 
 #-------------------------------------
 # [Main Script]
@@ -214,12 +926,13 @@ class ExportMenuSetup:
         # Get current project name
         self.flame_project_name = flame.project.current_project.name
 
-        # Create export preset menu folders if they don't exist. Saved export presets are stored in these folders.
-        self.project_menus_dir, self.shared_menus_dir = self.create_menu_folders()
+        # Load saved export menus. Menus saved as python files by older versions are moved into the menu registry.
+        self.menu_registry = load_menu_registry()
+        if migrate_menu_scripts(self.menu_registry):
+            save_menu_registry(self.menu_registry)
+            pyflame.refresh_hooks()
 
         # Paths
-        self.menu_template_path = os.path.join(SCRIPT_PATH, 'assets/templates/menu_template') # Path to menu template used to create new export menus
-        self.current_project_created_presets_path = os.path.join(SCRIPT_PATH, 'project_menus', self.flame_project_name) # Path to current project export preset menus folder
         self.project_preset_path = self.get_project_preset_path() # Path to current project export presets
         self.shared_preset_path = '/opt/Autodesk/shared/export/presets' # Path to shared export presets
 
@@ -265,29 +978,6 @@ class ExportMenuSetup:
 
         return settings
 
-    def create_menu_folders(self) -> tuple:
-            """
-            Create Menu Folders
-            ===================
-
-            Create project and shared menu folders if they don't exist.
-            Export presets are saved in these folders.
-
-            Returns:
-            --------
-                project_menus_dir, shared_menus_dir (tuple):
-                    project_menus_dir (str): Path to project export preset menus folder.
-                    shared_menus_dir (str): Path to shared export preset menus folder
-            """
-
-            project_menus_dir = os.path.join(SCRIPT_PATH, 'project_menus')
-            shared_menus_dir = os.path.join(SCRIPT_PATH, 'shared_menus')
-            for folder in [project_menus_dir, shared_menus_dir]:
-                if not os.path.isdir(folder):
-                    os.makedirs(folder)
-
-            return project_menus_dir, shared_menus_dir
-
     def get_project_preset_path(self) -> str:
         """
         Get Project Preset Path
@@ -330,82 +1020,14 @@ class ExportMenuSetup:
         Get lists of saved export presets for project and shared presets.
         """
 
-        def get_compatible_preset_list(preset_path) -> list:
-            """
-            Get Compatible Preset List
-            ==========================
-
-            Get list of shared export presets that are compatible with current version of flame.
-
-            Args:
-            -----
-                preset_path (str):
-                    Path to export presets to check.
-
-            Returns:
-            --------
-                compatible_preset_list (list):
-                    List of export presets compatible with current version of flame.
-                Or empty list if no presets found.
-            """
-
-            def check_preset_version(path) -> bool:
-                """
-                Check Preset Version
-                ====================
-
-                Check export presets for flame version compatibility.
-
-                If preset version is less than or equal to current export version then return True to add preset to list. Otherwise return False.
-
-                current_export_version (str): Export version of preset at preset_path.
-                export_version (str): Current export version of flame.
-
-                Args:
-                -----
-                    path (str):
-                        Path to export preset.
-
-                Returns:
-                --------
-                    bool: True if preset is compatible with current version of flame. False if not.
-                """
-
-                current_export_version, export_version = pyflame.get_export_preset_version(path)
-
-                # If preset version is less than or equal to current export version then return True to add preset to list. Otherwise return False.
-                if current_export_version <= export_version:
-                    return True
-                return False
-
-            try:
-                compatible_preset_list = [] # List of export presets compatible with current version of flame
-                preset_list = [] # List of all export presets in preset_path
-
-                # Walk through the directory and get the xml files
-                for root, dirs, files in os.walk(preset_path):
-                    for file in files:
-                        if file.endswith('.xml'):
-                            file_path = os.path.join(root, file) # Get full path to xml file
-                            file = file_path.rsplit(preset_path + '/', 1)[1] # Remove preset path from file path
-                            preset_list.append(file)
-                #print('preset_list:', preset_list, '\n')
-
-                # Check each preset for compatibility with current version of flame
-                for preset in preset_list:
-                    path = os.path.join(preset_path, preset)
-                    if check_preset_version(path):
-                        compatible_preset_list.append(preset[:-4])
-                compatible_preset_list = sorted(compatible_preset_list)
-                return compatible_preset_list # Return list of export presets compatible with current version of flame
-            except:
-                return [] # Return empty list if no presets found
+        catalogue = PresetCatalogue()
 
         # Get saved export preset lists
-        self.project_movie_preset_list = get_compatible_preset_list(self.project_movie_preset_path)
-        self.project_file_seq_preset_list = get_compatible_preset_list(self.project_file_seq_preset_path)
-        self.shared_movie_preset_list = get_compatible_preset_list(self.shared_movie_preset_path)
-        self.shared_file_seq_preset_list = get_compatible_preset_list(self.shared_file_seq_preset_path)
+        self.project_movie_preset_list = catalogue.compatible_presets(self.project_movie_preset_path)
+        self.project_file_seq_preset_list = catalogue.compatible_presets(self.project_file_seq_preset_path)
+        self.shared_movie_preset_list = catalogue.compatible_presets(self.shared_movie_preset_path)
+        self.shared_file_seq_preset_list = catalogue.compatible_presets(self.shared_file_seq_preset_path)
+        catalogue.save()
 
         print('\nSaved Export Presets:\n')
 
@@ -1054,19 +1676,10 @@ class ExportMenuSetup:
                     parent=None,
                     ):
 
-                    # Get menu path
-                    if 'Shared: ' in self.edit_saved_export_menu_menu.text:
-                        menu_path = os.path.join(self.shared_menus_dir, menu_name)
-                    else:
-                        menu_path = os.path.join(self.project_menus_dir, self.flame_project_name, menu_name)
-                    #print('Menu path:', menu_path, '\n')
-
-                    # Delete menu files
-                    os.remove(menu_path + '.py')
-                    try:
-                        os.remove(menu_path + '.pyc')
-                    except:
-                        pass
+                    # Remove menu from menu registry
+                    menus, menu_name = self.get_registry_menus(self.edit_saved_export_menu_menu.text)
+                    del menus[menu_name]
+                    save_menu_registry(self.menu_registry)
 
                     pyflame.print(f'Menu deleted: {menu_name}')
 
@@ -1081,30 +1694,21 @@ class ExportMenuSetup:
                 Duplicate export menu currently selected in the Export Menus pushbutton menu.
                 """
 
-                # Get name of menu to duplicate from pushbutton text
-                menu_name = self.edit_saved_export_menu_menu.text.split(' ', 1)[1]
-                #print('Menu to duplicate:', menu_name)
+                # Get menu to duplicate from pushbutton text
+                menus, menu_name = self.get_registry_menus(self.edit_saved_export_menu_menu.text)
+                menu_prefix = self.edit_saved_export_menu_menu.text.split(' ', 1)[0] + ' '
 
-                # Get menu path
-                if 'Shared: ' in self.edit_saved_export_menu_menu.text:
-                    menu_path = os.path.join(self.shared_menus_dir, menu_name) + '.py'
-                    menu_prefix = 'Shared: '
-                else:
-                    menu_path = os.path.join(self.project_menus_dir, self.flame_project_name, menu_name) + '.py'
-                    menu_prefix = 'Project: '
-                #print('Existing menu path:', menu_path)
+                # Add 'copy' to menu name. If menu name exists, add ' copy' until unique name is found.
+                new_menu_name = menu_name + ' copy'
+                while new_menu_name in menus:
+                    new_menu_name = new_menu_name + ' copy'
 
-                # Add 'copy' to menu name and check for existing file. If exists, add ' copy' until unique name is found.
-                new_menu_path = menu_path[:-3] + ' copy.py'
-                while os.path.exists(new_menu_path):
-                    new_menu_path = new_menu_path[:-3] + ' copy.py'
-                #print('New menu path:', new_menu_path, '\n')
-
-                # Copy menu python file
-                shutil.copy(menu_path, new_menu_path)
+                # Copy menu
+                menus[new_menu_name] = copy.deepcopy(menus[menu_name])
+                save_menu_registry(self.menu_registry)
 
                 # Load new menu name to Export Menus pushbutton
-                self.edit_saved_export_menu_menu.text = menu_prefix + new_menu_path.rsplit('/', 1)[1][:-3]
+                self.edit_saved_export_menu_menu.text = menu_prefix + new_menu_name
 
                 # Load menu settings from duplicated menu
                 self.load_preset()
@@ -1263,19 +1867,11 @@ class ExportMenuSetup:
         print('Saved Export Menus:\n')
 
         # Get saved project export menus
-        try:
-            project_export_menus = ['Project: ' + x[:-3] for x in os.listdir(os.path.join(self.project_menus_dir, self.flame_project_name)) if x.endswith('.py')]
-            project_export_menus.sort()
-        except:
-            project_export_menus = []
+        project_export_menus = ['Project: ' + x for x in sorted(self.menu_registry['Project'].get(self.flame_project_name, {}))]
         self.print_list('Project Export Menus', project_export_menus)
 
         # Get saved shared export menus
-        try:
-            shared_export_menus = ['Shared: ' + x[:-3] for x in os.listdir(self.shared_menus_dir) if x.endswith('.py')]
-            shared_export_menus.sort()
-        except:
-            shared_export_menus = []
+        shared_export_menus = ['Shared: ' + x for x in sorted(self.menu_registry['Shared'])]
         self.print_list('Shared Export Menus', shared_export_menus)
 
         # Combine project and shared export menus lists
@@ -1296,6 +1892,31 @@ class ExportMenuSetup:
         if not all_export_menus[0] == 'No Saved Export Menus Found':
             self.load_preset()
 
+    def get_registry_menus(self, menu_text: str) -> tuple:
+        """
+        Get Registry Menus
+        ==================
+
+        Get menus from the menu registry for the visibility in the export menus pushbutton text.
+
+        Args:
+        -----
+            menu_text (str):
+                Export menus pushbutton text. For example 'Shared: Menu Name'.
+
+        Returns:
+        --------
+            menus, menu_name (tuple):
+                menus (dict): Shared menus or current project menus from the menu registry.
+                menu_name (str): Menu name without visibility.
+        """
+
+        visibility, menu_name = menu_text.split(': ', 1)
+
+        if visibility == 'Shared':
+            return self.menu_registry['Shared'], menu_name
+        return self.menu_registry['Project'].setdefault(self.flame_project_name, {}), menu_name
+
     def load_preset(self, preset_to_load=None) -> None:
         """
         Load selected preset from the saved presets pushbutton menu.
@@ -1349,33 +1970,22 @@ class ExportMenuSetup:
 
         elif preset_to_load:
             self.edit_saved_export_menu_menu.text = preset_to_load
-        selected_menu_name = self.edit_saved_export_menu_menu.text.rsplit(': ', 1)[1] # Get selected menu name from pushbutton text
-        #print('Selected Menu Name:', selected_menu_name)
+        menus, selected_menu_name = self.get_registry_menus(self.edit_saved_export_menu_menu.text) # Get selected menu name from pushbutton text
+        menu = menus[selected_menu_name]
+        exports = {export['tab']: export for export in menu['exports']}
 
         self.edit_menu_name_entry.text = selected_menu_name # Set Menu Name Entry
 
         # Set Menu Visibility Pushbutton Menu
         if 'Shared: ' in self.edit_saved_export_menu_menu.text:
             self.edit_menu_visibility_menu.text = 'Shared'
-            selected_menu_path = os.path.join(self.shared_menus_dir, selected_menu_name) + '.py'
         elif 'Project: ' in self.edit_saved_export_menu_menu.text:
             self.edit_menu_visibility_menu.text = 'Project'
-            selected_menu_path = os.path.join(self.project_menus_dir, self.flame_project_name, selected_menu_name) + '.py'
-
-        # Read in menu script
-        #-----------------------------------------
-
-        get_menu_values = open(selected_menu_path, 'r')
-        menu_lines = get_menu_values.read().splitlines()
-
-        get_menu_values.close()
 
         def get_preset_info(preset_num, enable_btn, saved_preset_type_label, saved_presets_label, export_path_label, export_path_entry, top_layer_button, foreground_button, between_marks_button, token_button, export_button, server_button, saved_presets_button, include_subtitles_button, subtitles_export_mode_button, subtitles_tracks_button, ):
 
             # Get preset info
-            preset_start_index = menu_lines.index(f'        # Export preset {preset_num}')
-            preset_end_index = menu_lines.index(f'        # Export preset {preset_num} END') + 1
-            preset_lines = menu_lines[preset_start_index:preset_end_index]
+            export = exports[preset_num]
 
             if enable_btn:
                 enable_btn.checked = True
@@ -1398,73 +2008,39 @@ class ExportMenuSetup:
 
             # Set UI elements
             print(f'Preset: {preset_num}')
-            for line in preset_lines:
-                if line == '        clip_output.use_top_video_track = True':
-                    top_layer_button.checked = True
-                    print('Use Top Layer: True')
-                elif line == '        clip_output.use_top_video_track = False':
-                    top_layer_button.checked = False
-                    print('Use Top Layer: False')
-                elif line == '        clip_output.foreground = True':
-                    foreground_button.checked = True
-                    print('Foreground Export: True')
-                elif line == '        clip_output.foreground = False':
-                    foreground_button.checked = False
-                    print('Foreground Export: False')
-                elif line == '        clip_output.export_between_marks = True':
-                    between_marks_button.checked = True
-                    print('Export Between Marks: True')
-                elif line == '        clip_output.export_between_marks = False':
-                    between_marks_button.checked = False
-                    print('Export Between Marks: False')
-                elif '        new_export_path = translate_tokenized_path(clip, ' in line:
-                    path = line.split("'", 2)[1]
-                    export_path_entry.text = path
-                    print('Export Path:', path)
-                elif '        clip_output.export(clip, ' in line:
-                    preset_path = line.split("'", 2)[1]
-                    preset_name = preset_path.rsplit('/', 1)[1][:-4]
-                    saved_presets_button.text = preset_name
-                    print('Preset Name:', preset_name)
-                # Subtitles
-                elif '        clip_output.include_subtitles = True' in line:
-                    include_subtitles_button.checked = True
-                    subtitles_export_mode_button.enabled = True
-                    subtitles_tracks_button.enabled = True
-                    print('Include subtitles: True')
-                elif '        clip_output.include_subtitles = False' in line:
-                    include_subtitles_button.checked = False
-                    subtitles_export_mode_button.enabled = False
-                    subtitles_tracks_button.enabled = False
-                    print('Include subtitles: False')
-                elif '        clip_output.export_subtitles_as_files = False' in line:
-                    subtitles_export_mode_button.text = 'Burn in Image'
-                    print('Subtitles export mode: Burn in Image')
-                elif '        clip_output.export_subtitles_as_files = True' in line:
-                    subtitles_export_mode_button.text = 'Export as Files'
-                    print('Subtitles export mode: Export as Files')
-                elif '        clip_output.export_all_subtitles = True' in line:
-                    subtitles_tracks_button.text = 'All Subtitles Tracks'
-                    print('Subtitles tracks: All Subtitles Tracks')
-                elif '        clip_output.export_all_subtitles = False' in line:
-                    subtitles_tracks_button.text = 'Current Subtitles Track'
-                    print('Subtitles tracks: Current Subtitles Track')
-
-                if 'clip_output.export' in line:
-                    if 'project' in line:
-                        if 'file_sequence' in line:
-                            export_button.text = 'Project: File Sequence'
-                            print('Saved Preset Type: Project File Seq')
-                        elif 'movie_file' in line:
-                            export_button.text = 'Project: Movie'
-                            print('Saved Preset Type: Project Movie File')
-                    if 'shared' in line:
-                        if 'file_sequence' in line:
-                            export_button.text = 'Shared: File Sequence'
-                            print('Saved Preset Type: Shared File Seq')
-                        elif 'movie_file' in line:
-                            export_button.text = 'Shared: Movie'
-                            print('Saved Preset Type: Shared Movie File')
+
+            top_layer_button.checked = export['use_top_layer']
+            print('Use Top Layer:', export['use_top_layer'])
+            foreground_button.checked = export['foreground']
+            print('Foreground Export:', export['foreground'])
+            between_marks_button.checked = export['export_between_marks']
+            print('Export Between Marks:', export['export_between_marks'])
+            export_path_entry.text = export['export_path']
+            print('Export Path:', export['export_path'])
+
+            # Subtitles
+            if 'include_subtitles' in export:
+                include_subtitles_button.checked = export['include_subtitles']
+                subtitles_export_mode_button.enabled = export['include_subtitles']
+                subtitles_tracks_button.enabled = export['include_subtitles']
+                print('Include subtitles:', export['include_subtitles'])
+                subtitles_export_mode_button.text = 'Export as Files' if export['subtitles_as_files'] else 'Burn in Image'
+                print('Subtitles export mode:', subtitles_export_mode_button.text)
+                subtitles_tracks_button.text = 'All Subtitles Tracks' if export['all_subtitles'] else 'Current Subtitles Track'
+                print('Subtitles tracks:', subtitles_tracks_button.text)
+
+            # Preset type and name
+            preset_path = export['preset_path']
+            preset_type = 'Shared' if preset_path.startswith(self.shared_preset_path + '/') else 'Project'
+            if '/file_sequence/' in preset_path:
+                export_button.text = f'{preset_type}: File Sequence'
+                preset_name = preset_path.split('/file_sequence/', 1)[1][:-4]
+            else:
+                export_button.text = f'{preset_type}: Movie'
+                preset_name = preset_path.split('/movie_file/', 1)[1][:-4]
+            print('Saved Preset Type:', export_button.text)
+            saved_presets_button.text = preset_name
+            print('Preset Name:', preset_name)
 
         def disable_ui_elements(enable_btn, saved_preset_type_label, saved_presets_label, export_path_label, export_path_entry, top_layer_button, foreground_button, between_marks_button, token_button, export_button, server_button, saved_presets_button, include_subtitles_button, subtitles_export_mode_button, subtitles_tracks_button):
 
@@ -1488,45 +2064,37 @@ class ExportMenuSetup:
 
         print('Loading Preset...\n')
 
-        if '    reveal_in_mediahub = True' in menu_lines:
-            self.edit_reveal_in_mediahub_pushbutton.checked = True
-            print('Reveal in Mediahub: True')
-        else:
-            self.edit_reveal_in_mediahub_pushbutton.checked = False
-            print('Reveal in Mediahub: False')
+        self.edit_reveal_in_mediahub_pushbutton.checked = menu['reveal_in_mediahub']
+        print('Reveal in Mediahub:', menu['reveal_in_mediahub'])
 
-        if '    reveal_in_finder = True' in menu_lines:
-            self.edit_reveal_in_finder_pushbutton.checked = True
-            print('Reveal in Finder: True')
-        else:
-            self.edit_reveal_in_finder_pushbutton.checked = False
-            print('Reveal in Finder: False')
+        self.edit_reveal_in_finder_pushbutton.checked = menu['reveal_in_finder']
+        print('Reveal in Finder:', menu['reveal_in_finder'])
 
         # Get preset UI settings. If none are found, disable UI for that tab
 
-        get_preset_info('One', None, self.edit_saved_presets_label_01, self.edit_saved_presets_label_01, self.edit_export_path_label_01, self.edit_export_path_entry_01, self.edit_top_layer_pushbutton_01, self.edit_foreground_pushbutton_01, self.edit_between_marks_pushbutton_01, self.edit_token_pushbutton_01, self.edit_preset_type_menu_01, self.edit_server_browse_button_01, self.edit_presets_menu_01, self.edit_include_subtitles_pushbutton_01, self.edit_subtitles_export_mode_menu_01, self.edit_subtitles_tracks_menu_01)
+        get_preset_info(1, None, self.edit_saved_presets_label_01, self.edit_saved_presets_label_01, self.edit_export_path_label_01, self.edit_export_path_entry_01, self.edit_top_layer_pushbutton_01, self.edit_foreground_pushbutton_01, self.edit_between_marks_pushbutton_01, self.edit_token_pushbutton_01, self.edit_preset_type_menu_01, self.edit_server_browse_button_01, self.edit_presets_menu_01, self.edit_include_subtitles_pushbutton_01, self.edit_subtitles_export_mode_menu_01, self.edit_subtitles_tracks_menu_01)
         preset_01_push_btn_text = self.edit_presets_menu_01.text
 
         try:
-            get_preset_info('Two', self.edit_enable_preset_pushbutton_02, self.edit_saved_preset_type_label_02, self.edit_saved_presets_label_02, self.edit_export_path_label_02, self.edit_export_path_entry_02, self.edit_top_layer_pushbutton_02, self.edit_foreground_pushbutton_02, self.edit_between_marks_pushbutton_02, self.edit_token_pushbutton_02, self.edit_preset_type_menu_02, self.edit_server_browse_button_02, self.edit_presets_menu_02, self.edit_include_subtitles_pushbutton_02, self.edit_subtitles_export_mode_menu_02, self.edit_subtitles_tracks_menu_02)
+            get_preset_info(2, self.edit_enable_preset_pushbutton_02, self.edit_saved_preset_type_label_02, self.edit_saved_presets_label_02, self.edit_export_path_label_02, self.edit_export_path_entry_02, self.edit_top_layer_pushbutton_02, self.edit_foreground_pushbutton_02, self.edit_between_marks_pushbutton_02, self.edit_token_pushbutton_02, self.edit_preset_type_menu_02, self.edit_server_browse_button_02, self.edit_presets_menu_02, self.edit_include_subtitles_pushbutton_02, self.edit_subtitles_export_mode_menu_02, self.edit_subtitles_tracks_menu_02)
             preset_02_push_btn_text = self.edit_presets_menu_02.text
         except:
             # Disable UI elements if nothing loaded for preset two
             disable_ui_elements(self.edit_enable_preset_pushbutton_02, self.edit_saved_preset_type_label_02, self.edit_saved_presets_label_02, self.edit_export_path_label_02, self.edit_export_path_entry_02, self.edit_top_layer_pushbutton_02, self.edit_foreground_pushbutton_02, self.edit_between_marks_pushbutton_02, self.edit_token_pushbutton_02, self.edit_preset_type_menu_02, self.edit_server_browse_button_02, self.edit_presets_menu_02, self.edit_include_subtitles_pushbutton_02, self.edit_subtitles_export_mode_menu_02, self.edit_subtitles_tracks_menu_02)
         try:
-            get_preset_info('Three', self.edit_enable_preset_pushbutton_03, self.edit_saved_preset_type_label_03, self.edit_saved_presets_label_03, self.edit_export_path_label_03, self.edit_export_path_entry_03, self.edit_top_layer_pushbutton_03, self.edit_foreground_pushbutton_03, self.edit_between_marks_pushbutton_03, self.edit_token_pushbutton_03, self.edit_preset_type_menu_03, self.edit_server_browse_button_03, self.edit_presets_menu_03, self.edit_include_subtitles_pushbutton_03, self.edit_subtitles_export_mode_menu_03, self.edit_subtitles_tracks_menu_03)
+            get_preset_info(3, self.edit_enable_preset_pushbutton_03, self.edit_saved_preset_type_label_03, self.edit_saved_presets_label_03, self.edit_export_path_label_03, self.edit_export_path_entry_03, self.edit_top_layer_pushbutton_03, self.edit_foreground_pushbutton_03, self.edit_between_marks_pushbutton_03, self.edit_token_pushbutton_03, self.edit_preset_type_menu_03, self.edit_server_browse_button_03, self.edit_presets_menu_03, self.edit_include_subtitles_pushbutton_03, self.edit_subtitles_export_mode_menu_03, self.edit_subtitles_tracks_menu_03)
             preset_03_push_btn_text = self.edit_presets_menu_03.text
         except:
             # Disable UI elements if nothing loaded for preset three
             disable_ui_elements(self.edit_enable_preset_pushbutton_03, self.edit_saved_preset_type_label_03, self.edit_saved_presets_label_03, self.edit_export_path_label_03, self.edit_export_path_entry_03, self.edit_top_layer_pushbutton_03, self.edit_foreground_pushbutton_03, self.edit_between_marks_pushbutton_03, self.edit_token_pushbutton_03, self.edit_preset_type_menu_03, self.edit_server_browse_button_03, self.edit_presets_menu_03, self.edit_include_subtitles_pushbutton_03, self.edit_subtitles_export_mode_menu_03, self.edit_subtitles_tracks_menu_03)
         try:
-            get_preset_info('Four', self.edit_enable_preset_pushbutton_04, self.edit_saved_preset_type_label_04, self.edit_saved_presets_label_04, self.edit_export_path_label_04, self.edit_export_path_entry_04, self.edit_top_layer_pushbutton_04, self.edit_foreground_pushbutton_04, self.edit_between_marks_pushbutton_04, self.edit_token_pushbutton_04, self.edit_preset_type_menu_04, self.edit_server_browse_button_04, self.edit_presets_menu_04, self.edit_include_subtitles_pushbutton_04, self.edit_subtitles_export_mode_menu_04, self.edit_subtitles_tracks_menu_04)
+            get_preset_info(4, self.edit_enable_preset_pushbutton_04, self.edit_saved_preset_type_label_04, self.edit_saved_presets_label_04, self.edit_export_path_label_04, self.edit_export_path_entry_04, self.edit_top_layer_pushbutton_04, self.edit_foreground_pushbutton_04, self.edit_between_marks_pushbutton_04, self.edit_token_pushbutton_04, self.edit_preset_type_menu_04, self.edit_server_browse_button_04, self.edit_presets_menu_04, self.edit_include_subtitles_pushbutton_04, self.edit_subtitles_export_mode_menu_04, self.edit_subtitles_tracks_menu_04)
             preset_04_push_btn_text = self.edit_presets_menu_04.text
         except:
             # Disable UI elements if nothing loaded for preset four
             disable_ui_elements(self.edit_enable_preset_pushbutton_04, self.edit_saved_preset_type_label_04, self.edit_saved_presets_label_04, self.edit_export_path_label_04, self.edit_export_path_entry_04, self.edit_top_layer_pushbutton_04, self.edit_foreground_pushbutton_04, self.edit_between_marks_pushbutton_04, self.edit_token_pushbutton_04, self.edit_preset_type_menu_04, self.edit_server_browse_button_04, self.edit_presets_menu_04, self.edit_include_subtitles_pushbutton_04, self.edit_subtitles_export_mode_menu_04, self.edit_subtitles_tracks_menu_04)
         try:
-            get_preset_info('Five', self.edit_enable_preset_pushbutton_05, self.edit_saved_preset_type_label_05, self.edit_saved_presets_label_05, self.edit_export_path_label_05, self.edit_export_path_entry_05, self.edit_top_layer_pushbutton_05, self.edit_foreground_pushbutton_05, self.edit_between_marks_pushbutton_05, self.edit_token_pushbutton_05, self.edit_preset_type_menu_05, self.edit_server_browse_button_05, self.edit_presets_menu_05, self.edit_include_subtitles_pushbutton_05, self.edit_subtitles_export_mode_menu_05, self.edit_subtitles_tracks_menu_05)
+            get_preset_info(5, self.edit_enable_preset_pushbutton_05, self.edit_saved_preset_type_label_05, self.edit_saved_presets_label_05, self.edit_export_path_label_05, self.edit_export_path_entry_05, self.edit_top_layer_pushbutton_05, self.edit_foreground_pushbutton_05, self.edit_between_marks_pushbutton_05, self.edit_token_pushbutton_05, self.edit_preset_type_menu_05, self.edit_server_browse_button_05, self.edit_presets_menu_05, self.edit_include_subtitles_pushbutton_05, self.edit_subtitles_export_mode_menu_05, self.edit_subtitles_tracks_menu_05)
             preset_05_push_btn_text = self.edit_presets_menu_05.text
         except:
             # Disable UI elements if nothing loaded for preset five
@@ -1784,67 +2352,45 @@ class ExportMenuSetup:
                         if not value['Export Path']:
                             return f'Preset {tab_number}: Enter export path.'
 
-        def get_menu_save_path() -> tuple:
+        def get_preset_path(preset_type_menu: str, preset_menu: str) -> str:
             """
-            Get Menu Save Path
-            ==================
+            Get Preset Path
+            ===============
+
+            Get path to selected export preset.
 
-            Get menu save path and name.
+            Args:
+            -----
+                preset_type_menu (str):
+                    Saved preset type pushbutton text.
+                preset_menu (str):
+                    Saved preset pushbutton text.
 
             Returns:
             --------
-                menu_flame_project, menu_save_path (tuple):
-                    menu_flame_project (str): Flame project name
-                    menu_save_path (str): menu save path
+                str: export preset path
             """
 
-            # Set path for new menu file
-            if menu_visibility == 'Project':
-                menu_save_dir = os.path.join(self.project_menus_dir, self.flame_project_name)
-                menu_flame_project = self.flame_project_name
+            # Get selected preset path
+            if 'Project' in preset_type_menu:
+                preset_path = self.project_preset_path
             else:
-                menu_save_dir = self.shared_menus_dir
-                menu_flame_project = 'None'
+                preset_path = self.shared_preset_path
 
-            if not os.path.isdir(menu_save_dir):
-                os.makedirs(menu_save_dir)
-
-            menu_file_name = menu_name.replace('.', '_') + '.py'
-
-            menu_save_path = os.path.join(menu_save_dir, menu_file_name)
-
-            return menu_flame_project, menu_save_path
-
-        def create_main_tab_token_dict() -> dict:
-            """
-            Create Main Tab Token Dictionary
-            ================================
-
-            Create dictionary for tokens in menu template with values from main tab.
-
-            Returns:
-            --------
-                dict:
-                    template token dictionary
-            """
-
-            # Create dictionary for tokens in menu template with values from main tab
-            main_tab_token_dict = {}
-            main_tab_token_dict['<FlameProject>'] = menu_flame_project
-            main_tab_token_dict['<PresetName>'] = menu_name
-            main_tab_token_dict['<PresetType>'] = menu_visibility
-            main_tab_token_dict['<RevealInMediaHub>'] = reveal_in_mediahub
-            main_tab_token_dict['<RevealInFinder>'] = reveal_in_finder
-            main_tab_token_dict['<FlameMinMaxVersion>'] = self.flame_min_max_version
+            if 'Movie' in preset_type_menu:
+                preset_dir_path = preset_path + '/movie_file'
+            else:
+                preset_dir_path = preset_path + '/file_sequence'
 
-            return main_tab_token_dict
+            return os.path.join(preset_dir_path, preset_menu) + '.xml'
 
-        def menu_template_preset_lines(tab_options_dict: dict) -> list:
+        def create_menu(tab_options_dict: dict) -> dict:
             """
-            Menu Template Preset Lines
-            ==========================
+            Create Menu
+            ===========
 
-            Create new lines to be added to menu template.
+            Create export menu to be saved in the menu registry from tab settings.
+            Subtitle settings are only added if Flame is 2024.2 or later.
 
             Args:
             -----
@@ -1853,123 +2399,40 @@ class ExportMenuSetup:
 
             Returns:
             --------
-                list:
-                    new lines to be added to menu template
+                dict: export menu
             """
 
-            def get_preset_path(preset_type_menu: str, preset_menu: str) -> str:
-
-                # Get selected preset path
-                if 'Project' in preset_type_menu:
-                    preset_path = self.project_preset_path
-                else:
-                    preset_path = self.shared_preset_path
-
-                if 'Movie' in preset_type_menu:
-                    preset_dir_path = preset_path + '/movie_file'
-                else:
-                    preset_dir_path = preset_path + '/file_sequence'
+            menu = {
+                'flame_version': self.flame_min_max_version,
+                'reveal_in_mediahub': reveal_in_mediahub,
+                'reveal_in_finder': reveal_in_finder,
+                'exports': [],
+                }
 
-                preset_file_path = os.path.join(preset_dir_path, preset_menu) + '.xml'
-
-                #print('preset path:', preset_file_path, '\n')
-
-                return preset_file_path
-
-            def new_lines(tab_number: str,
-                          top_layer: str,
-                          foreground_export: str,
-                          export_between_marks: str,
-                          include_subtitles: str,
-                          subtitles_export_mode: str,
-                          subtitles_tracks: str,
-                          export_path: str,
-                          preset_file_path: str) -> list:
-                """
-                Build new lines to be added to menu template. Add subtitle lines if Flame is 2024.2 or later.
+            print('tab options dict:', tab_options_dict, '\n')
 
-                Returns:
-                    list: menu_lines
-                """
+            # Loop through tabs to build menu exports
+            for tab_index, (key, value) in enumerate(tab_options_dict.items()):
+                if 'tab_zero' in key or value['Enabled'] != True:
+                    continue
+
+                export = {
+                    'tab': tab_index,
+                    'preset_path': get_preset_path(value['Preset Type Menu'], value['Preset Menu']),
+                    'export_path': value['Export Path'],
+                    'use_top_layer': value['Top Layer'],
+                    'foreground': value['Foreground Export'],
+                    'export_between_marks': value['Export Between Marks'],
+                    }
 
-                menu_lines.append("")
-                menu_lines.append(f"        # Export preset {tab_number}")
-                menu_lines.append("")
-                menu_lines.append("        # Export using top video track")
-                menu_lines.append(f"        clip_output.use_top_video_track = {top_layer}")
-                menu_lines.append(f"        print('\\n--> Export using top layer: {top_layer}')")
-                menu_lines.append("")
-                menu_lines.append("        # Set export to foreground")
-                menu_lines.append(f"        clip_output.foreground = {foreground_export}")
-                menu_lines.append(f"        print('--> Export in foreground: {foreground_export}')")
-                menu_lines.append("")
-                menu_lines.append("        # Export between markers")
-                menu_lines.append(f"        clip_output.export_between_marks = {export_between_marks}")
-                menu_lines.append(f"        print('--> Export between marks: {export_between_marks}\\n')")
-
-                # Add lines for subtitles if version of Flame is 2024.2 or greater.
                 if self.flame_version >= 2024.2:
-                    menu_lines.append("")
-                    menu_lines.append("        # Include subtitles")
-                    menu_lines.append(f"        clip_output.include_subtitles = {include_subtitles}")
-                    menu_lines.append(f"        print('--> Include subtitles: {include_subtitles}\\n')")
-                    menu_lines.append("")
-                    # Subtitles export mode: 'Burn in Image = False, 'Export as Files' = True
-                    if subtitles_export_mode == 'Burn in Image':
-                        subtitles_export_mode = False
-                    else:
-                        subtitles_export_mode = True
-                    menu_lines.append("        # Subtitles export mode")
-                    menu_lines.append(f"        clip_output.export_subtitles_as_files = {subtitles_export_mode}")
-                    menu_lines.append(f"        print('--> Subtitles export mode: {subtitles_export_mode}\\n')")
-                    menu_lines.append("")
-                    # Subtitles tracks: 'Current Subtitles Track' = False, 'All Subtitles Tracks' = True
-                    if subtitles_tracks == 'All Subtitles Tracks':
-                        subtitles_tracks = True
-                    else:
-                        subtitles_tracks = False
-                    menu_lines.append("        # Subtitles tracks")
-                    menu_lines.append(f"        clip_output.export_all_subtitles = {subtitles_tracks}")
-                    menu_lines.append(f"        print('--> Subtitles tracks: {subtitles_tracks}\\n')")
-
-                menu_lines.append("")
-                menu_lines.append("        # Translate tokens in path")
-                menu_lines.append("")
-                menu_lines.append(f"        new_export_path = translate_tokenized_path(clip, '{export_path}')")
-                menu_lines.append("")
-                menu_lines.append("        if not new_export_path:")
-                menu_lines.append("            return")
-                menu_lines.append("")
-                menu_lines.append("        if not os.path.isdir(new_export_path):")
-                menu_lines.append("            try:")
-                menu_lines.append("                os.makedirs(new_export_path)")
-                menu_lines.append("            except:")
-                menu_lines.append("                PyFlameMessageWindow(")
-                menu_lines.append("                    message=f'Could not create export path.\\n\\nPlease check the export path and try again.\\n\\n{new_export_path}',")
-                menu_lines.append("                    message_type=MessageType.ERROR,")
-                menu_lines.append("                    title='Export Path Error',")
-                menu_lines.append("                    parent=None,")
-                menu_lines.append("                )")
-                menu_lines.append("                return")
-                menu_lines.append("")
-                menu_lines.append(f"        clip_output.export(clip, '{preset_file_path}', new_export_path)")
-                menu_lines.append("")
-                menu_lines.append(f"        # Export preset {tab_number} END")
-                menu_lines.append("")
-
-            menu_lines = []
-
-            print('tab options dict:', tab_options_dict, '\n')
+                    export['include_subtitles'] = value['Include Subtitles']
+                    export['subtitles_as_files'] = value['Subtitles Export Mode'] != 'Burn in Image'
+                    export['all_subtitles'] = value['Subtitles Tracks'] == 'All Subtitles Tracks'
 
-            # Loop through tabs to build preset menus
-            for key, value in tab_options_dict.items():
-                tab_number = key.rsplit('_', 1)[1].capitalize()
-                if tab_number != 'Zero':
-                    if value['Enabled'] == True:
-                        preset_file_path = get_preset_path(value['Preset Type Menu'], value['Preset Menu'])
-                        new_lines(tab_number, value['Top Layer'], value['Foreground Export'], value['Export Between Marks'], value['Include Subtitles'], value['Subtitles Export Mode'], value['Subtitles Tracks'], value['Export Path'], preset_file_path)
+                menu['exports'].append(export)
 
-            return menu_lines
+            return menu
 
         def save_config() -> None:
             """
@@ -1990,42 +2453,6 @@ class ExportMenuSetup:
                     }
                 )
 
-        def get_original_menu_file_path(tab: str) -> str:
-            """
-            Get Original Menu File Path
-            ===========================
-
-            Get path to original menu file.
-
-            Args:
-            -----
-                tab (str):
-                    'Create' or 'Edit'
-
-            Returns:
-            --------
-                original_menu_file (str):
-                    original menu file path
-            """
-
-            if tab == 'Edit':
-                original_menu_name = self.edit_saved_export_menu_menu.text.split(' ', 1)[1]
-            else:
-                original_menu_name = None
-
-            if original_menu_name:
-                if 'Shared: ' in self.edit_saved_export_menu_menu.text:
-                    original_menu_file = os.path.join(self.shared_menus_dir, original_menu_name + '.py')
-                else:
-                    original_menu_file = os.path.join(self.project_menus_dir, self.flame_project_name, original_menu_name + '.py')
-            else:
-                original_menu_file = None
-
-            return original_menu_file
-
-        original_menu_file_path = get_original_menu_file_path(tab)
-        #print('Original menu file path:', original_menu_file_path, '\n')
-
         # Crate dictionary of all tab settings
         tab_options_dict = get_tab_settings(tab)
 
@@ -2046,8 +2473,8 @@ class ExportMenuSetup:
                 menu_visibility, menu_name, reveal_in_mediahub, reveal_in_finder (tuple):
                     menu_visibility (str): 'Project' or 'Shared'
                     menu_name (str): menu name
-                    reveal_in_mediahub (str): 'True' or 'False'
-                    reveal_in_finder (str): 'True' or 'False'
+                    reveal_in_mediahub (bool): Reveal export path in MediaHub after export
+                    reveal_in_finder (bool): Reveal export path in Finder after export
             """
 
             # Get values from main tab
@@ -2055,8 +2482,8 @@ class ExportMenuSetup:
                 if 'tab_zero' in key:
                     menu_visibility = value['Menu Visibility']
                     menu_name = value['Menu Name']
-                    reveal_in_mediahub = str(value['Reveal in MediaHub'])
-                    reveal_in_finder = str(value['Reveal in Finder'])
+                    reveal_in_mediahub = value['Reveal in MediaHub']
+                    reveal_in_finder = value['Reveal in Finder']
 
             return menu_visibility, menu_name, reveal_in_mediahub, reveal_in_finder
 
@@ -2073,116 +2500,14 @@ class ExportMenuSetup:
             )
             return
 
-        # Get menu save path and name
-        menu_flame_project, menu_save_path = get_menu_save_path()
-
-        # Create dict of tokens from main tab settings
-        main_tab_token_dict = create_main_tab_token_dict()
-
-        def load_menu_template() -> list:
-            """
-            Load Menu Template
-            ==================
-
-            Open menu template and return as list of lines.
-
-            Returns:
-            --------
-                template_lines (list):
-                    menu template lines
-            """
-
-            # Open menu template
-            get_config_values = open(self.menu_template_path, 'r')
-            template_lines = get_config_values.read().splitlines()
-            get_config_values.close()
-
-            return template_lines
-
-        # Load menu template
-        template_lines = load_menu_template()
-
-        def replace_main_tab_tokens() -> list:
-            """
-            Replace Main Tab Tokens
-            =======================
-
-            Replace tokens in menu template with values from main tab token dictionary.
-
-            Returns:
-            --------
-                template_lines (list):
-                    menu template lines with tokens replaced
-            """
-
-
-            # Replace tokens in menu template
-            for key, value in main_tab_token_dict.items():
-                for line in template_lines:
-                    if key in line:
-                        line_index = template_lines.index(line)
-                        new_line = re.sub(key, value, line)
-                        template_lines[line_index] = new_line
-
-            return template_lines
-
-        # Replace tokens with values from main tab token dictionary
-        template_lines = replace_main_tab_tokens()
-
-        # Create new export preset menu lines
-        menu_lines = menu_template_preset_lines(tab_options_dict)
-
-        def insert_menu_lines() -> list:
-            """
-            Insert Menu Lines
-            =================
-
-            Insert new preset menu lines into template.
-
-            Returns:
-            --------
-                template_lines (list):
-                    template lines with new preset menu lines inserted
-            """
-
-            # Insert new preset menu lines into template
-            for i in range(len(template_lines)):
-                if template_lines[i] == '    for clip in selection:':
-                    i += 1
-                    for line in menu_lines:
-                        template_lines.insert(i, line)
-                        i += 1
-
-            return template_lines
-
-        template_lines = insert_menu_lines()
-
-        def delete_original_menu_file() -> None:
-            """
-            Delete Original Menu File
-            =========================
-
-            Delete original menu file if tab is 'Edit'.
-            """
-
-            if original_menu_file_path:
-                os.remove(original_menu_file_path)
-                try:
-                    os.remove(original_menu_file_path + 'c')
-                except:
-                    pass
-
-        # Delete original menu file if tab is 'Edit' before saving new menu.
-        delete_original_menu_file()
-
-        def save_export_menu():
-            # Save new menu
-            out_file = open(menu_save_path, 'w')
-            for line in template_lines:
-                print(line, file=out_file)
-            out_file.close()
+        # Menus menu will be saved to and menu being edited
+        menus, _ = self.get_registry_menus(f'{menu_visibility}: {menu_name}')
+        if tab == 'Edit':
+            original_menus, original_menu_name = self.get_registry_menus(self.edit_saved_export_menu_menu.text)
+        else:
+            original_menus, original_menu_name = None, None
 
-        if os.path.isfile(menu_save_path):
+        if menu_name in menus and (menus is not original_menus or menu_name != original_menu_name):
             overwrite = PyFlameMessageWindow(
                 message=f'Export menu already exists.\n\nDo you want to overwrite it?',
                 message_type=MessageType.WARNING,
@@ -2192,8 +2517,13 @@ class ExportMenuSetup:
             if not overwrite:
                 return
 
-        # Save new menu file
-        save_export_menu()
+        # Remove original menu if tab is 'Edit' before saving new menu.
+        if original_menus is not None:
+            original_menus.pop(original_menu_name, None)
+
+        # Save new menu
+        menus[menu_name] = create_menu(tab_options_dict)
+        save_menu_registry(self.menu_registry)
 
         # Save config settings
         save_config()
@@ -2209,6 +2539,26 @@ class ExportMenuSetup:
         self.get_saved_menus()
         self.load_preset(preset_to_load=f'{menu_visibility}: {menu_name}')
 
+#-------------------------------------
+# [Scopes]
+#-------------------------------------
+
+def scope_clip(selection, project: str=None) -> bool:
+    """
+    Scope Clip
+    ==========
+
+    Show export menu if a clip is selected. Project menus are only shown in the project they were created in.
+    """
+
+    if project and project != flame.project.current_project.name:
+        return False
+
+    for item in selection:
+        if isinstance(item, flame.PyClip):
+            return True
+    return False
+
 #-------------------------------------
 # [Flame Menus]
 #-------------------------------------
@@ -2234,3 +2584,35 @@ def get_main_menu_custom_ui_actions():
            ]
         }
     ]
+
+def get_media_panel_custom_ui_actions():
+
+    registry = load_menu_registry()
+
+    def menu_actions(menus: dict, project: str=None) -> list:
+        return [
+            {
+                'name': menu_name,
+                'isVisible': partial(scope_clip, project=project),
+                'execute': partial(export_clips, menu_name=menu_name, menu=menu),
+                'minimumVersion': menu['flame_version'],
+            }
+            for menu_name, menu in sorted(menus.items())
+        ]
+
+    project_actions = []
+    for project, menus in sorted(registry['Project'].items()):
+        project_actions.extend(menu_actions(menus, project))
+
+    menus = [
+        {
+            'name': 'Project Export Presets...',
+            'actions': project_actions,
+        },
+        {
+            'name': 'Shared Export Presets...',
+            'actions': menu_actions(registry['Shared']),
+        }
+    ]
+
+    return [menu for menu in menus if menu['actions']]
@@ -35,6 +35,8 @@ Description:
 
     Custom folder structure templates can be set up in the script setup window.
 
+    Folder names in templates can use <ShotName>, <SeqName> and <SEQNAME> along with the standard PyFlame tokens.
+
 URL:
     https://github.com/logik-portal/python/create_shot_folders
 
@@ -80,6 +82,7 @@ Updates:
 # [Imports]
 #-------------------------------------
 
+import datetime
 import os
 import re
 from functools import partial
@@ -95,6 +98,14 @@ SCRIPT_NAME = 'Create Shot Folders'
 SCRIPT_VERSION = 'v5.4.0'
 SCRIPT_PATH = os.path.abspath(os.path.dirname(__file__))
 
+# Tokens that change from shot to shot. All other tokens are resolved once per template.
+SHOT_TOKEN_PATTERN = re.compile(r'<(ShotName|SeqName|SEQNAME)>')
+
+# Shot number tokens in shot name patterns
+SHOT_NUM_PATTERN = re.compile(r'<ShotNum#*>')
+SHOT_NUM_LIST_PATTERN = re.compile(r'<ShotNum\[([0-9, \-]+)\]>')
+SHOT_NUM_RANGE_PATTERN = re.compile(r'(\d+)(?:-(\d+))?')
+
 #-------------------------------------
 # [Main Script]
 #-------------------------------------
@@ -145,6 +156,282 @@ def load_config() -> PyFlameConfig:
 
     return settings
 
+class FolderTemplate():
+    """
+    Folder Template
+    ===============
+
+    Folder structure template compiled once for all shots.
+
+    Folder names are resolved with pyflame.resolve_tokens when the template is compiled, using one date and time for
+    all folders. Only folders with shot tokens (<ShotName>, <SeqName>, <SEQNAME>) in their name, and the folders
+    above them, are rebuilt for each shot. All other folders are shared by every shot.
+
+    Args
+    ----
+        `folder_structure` (dict):
+            Folder structure template from the config.
+
+        `date` (datetime.datetime, optional):
+            Date and time used to resolve date and time tokens.
+            (Default: `None`)
+    """
+
+    def __init__(self, folder_structure: dict, date: datetime.datetime | None=None) -> None:
+
+        self.date = date or datetime.datetime.now()
+        self.nodes = self.compile(folder_structure)
+        self.varies = any(node['varies'] for node in self.nodes)
+        self.static_structure = None if self.varies else self.build(self.nodes, {})
+
+    def compile(self, folder_structure: dict) -> list[dict]:
+        """
+        Compile
+        =======
+
+        Compile a folder structure into a list of nodes. Static nodes keep their finished sub-structure.
+        """
+
+        nodes = []
+
+        for name, sub_folders in folder_structure.items():
+            if '<' in name:
+                name = pyflame.resolve_tokens(name, date=self.date)
+            children = self.compile(sub_folders)
+            name_varies = bool(SHOT_TOKEN_PATTERN.search(name))
+            node = {
+                'name': name,
+                'name_varies': name_varies,
+                'varies': name_varies or any(child['varies'] for child in children),
+                'children': children,
+                }
+            if not node['varies']:
+                node['structure'] = self.build(children, {})
+            nodes.append(node)
+
+        return nodes
+
+    def build(self, nodes: list[dict], shot_tokens: dict[str, str]) -> dict:
+        """
+        Build
+        =====
+
+        Build the folder structure dict for a list of nodes, reusing static sub-structures.
+        """
+
+        structure = {}
+
+        for node in nodes:
+            if not node['varies']:
+                structure[node['name']] = node['structure']
+                continue
+            name = node['name']
+            if node['name_varies']:
+                name = SHOT_TOKEN_PATTERN.sub(lambda match: shot_tokens[match.group(1)], name)
+            structure[name] = self.build(node['children'], shot_tokens)
+
+        return structure
+
+    def structure(self, shot_name: str) -> dict:
+        """
+        Structure
+        =========
+
+        Get the resolved folder structure for a shot.
+
+        Args
+        ----
+            `shot_name` (str):
+                Name of shot.
+
+        Returns
+        -------
+            dict:
+                Folder structure with all tokens resolved. Shared by every shot if the template has no shot tokens.
+        """
+
+        if not self.varies:
+            return self.static_structure
+
+        seq_name = re.split('[^a-zA-Z]', shot_name)[0]
+
+        return self.build(self.nodes, {'ShotName': shot_name, 'SeqName': seq_name, 'SEQNAME': seq_name.upper()})
+
+class ShotList():
+    """
+    Shot List
+    =========
+
+    Shot name pattern parsed once into shot number ranges. Shot names are generated as the shot list is iterated.
+
+    The number of shots and any shot numbers listed more than once are worked out from the ranges without generating
+    any shot names. Shot numbers listed more than once are only generated once.
+
+    Args
+    ----
+        `shot_name` (str):
+            Shot name pattern. See CreateShotFolders.create_shot_list for supported patterns.
+
+        `number_of_shots` (int):
+            Number of shots to create for <ShotNum###> patterns.
+
+        `starting_shot` (int):
+            First shot number for <ShotNum###> patterns.
+
+        `shot_increments` (int):
+            Step between shot numbers in ranges.
+    """
+
+    def __init__(self, shot_name: str, number_of_shots: int, starting_shot: int, shot_increments: int) -> None:
+
+        self.shot_name = shot_name
+        self.parts = None # Shot name text around shot numbers. None when shot_name has no shot numbers.
+        self.ranges = [] # (shot numbers, padding, range text)
+        self.invalid = []
+
+        list_match = SHOT_NUM_LIST_PATTERN.search(shot_name)
+        shot_num_match = SHOT_NUM_PATTERN.search(shot_name)
+
+        if list_match:
+            self.parts = [shot_name[:list_match.start()], shot_name[list_match.end():]]
+            self.add_ranges(list_match.group(1), shot_increments)
+        elif shot_num_match:
+            self.parts = SHOT_NUM_PATTERN.split(shot_name)
+            padding = shot_num_match.group(0).count('#') or 4
+            numbers = range(starting_shot, starting_shot + number_of_shots * shot_increments, shot_increments)
+            self.ranges.append((numbers, padding, shot_num_match.group(0)))
+        elif '[' in shot_name and ']' in shot_name:
+            self.parts = [shot_name.split('[', 1)[0], '']
+            self.add_ranges(shot_name.split('[', 1)[1].rsplit(']', 1)[0], shot_increments)
+
+        self.overlaps = self.find_overlaps()
+
+    def add_ranges(self, sequence: str, shot_increments: int) -> None:
+        """
+        Add Ranges
+        ==========
+
+        Add ranges from a comma separated list of shot numbers and ranges such as 0010, 0020, 0050-0090.
+        """
+
+        for item in sequence.replace(' ', '').split(','):
+            match = SHOT_NUM_RANGE_PATTERN.fullmatch(item)
+            if not match:
+                if item:
+                    self.invalid.append(item)
+                continue
+            start, end = match.groups()
+            if end:
+                self.ranges.append((range(int(start), int(end) + 1, shot_increments), len(start), item))
+            else:
+                self.ranges.append((range(int(start), int(start) + 1), len(start), item))
+
+    def find_overlaps(self) -> list[tuple[str, str, int]]:
+        """
+        Find Overlaps
+        =============
+
+        Find ranges that share shot numbers.
+
+        Returns
+        -------
+            list[tuple[str, str, int]]:
+                Range text of both ranges and the number of shot numbers they share.
+        """
+
+        def shared_numbers(a: range, b: range) -> int:
+            if len(a) > len(b):
+                a, b = b, a
+            if len(a) > 1 and a.step == b.step:
+                if (a.start - b.start) % a.step:
+                    return 0
+                return len(range(max(a.start, b.start), min(a.stop, b.stop), a.step))
+            return sum(1 for number in a if number in b)
+
+        overlaps = []
+
+        for index, (numbers, padding, text) in enumerate(self.ranges):
+            for other_numbers, other_padding, other_text in self.ranges[index + 1:]:
+                if padding != other_padding:
+                    continue
+                shared = shared_numbers(numbers, other_numbers)
+                if shared:
+                    overlaps.append((text, other_text, shared))
+
+        return overlaps
+
+    @property
+    def count(self) -> int:
+        """
+        Number of unique shots, without generating shot names.
+
+        Ranges with the same padding and step that line up are merged, then single shot numbers not in any range
+        are added.
+        """
+
+        if self.parts is None:
+            return 1
+
+        # Ranges that can share shot numbers: same padding, step, and start number modulo step
+        range_groups = {}
+        single_numbers = set()
+        for numbers, padding, _ in self.ranges:
+            if len(numbers) == 1:
+                single_numbers.add((numbers[0], padding))
+            elif numbers:
+                range_groups.setdefault((padding, numbers.step, numbers.start % numbers.step), []).append(numbers)
+
+        count = 0
+        for (padding, step, _), group in range_groups.items():
+            merged_stop = None
+            for numbers in sorted(group, key=lambda numbers: numbers.start):
+                last = numbers[-1] + step
+                if merged_stop is None or numbers.start >= merged_stop:
+                    count += len(numbers)
+                elif last > merged_stop:
+                    count += (last - merged_stop) // step
+                merged_stop = last if merged_stop is None else max(merged_stop, last)
+
+        for number, padding in single_numbers:
+            if not any(number in numbers for numbers, range_padding, _ in self.ranges if range_padding == padding and len(numbers) > 1):
+                count += 1
+
+        return count
+
+    def report(self) -> None:
+        """
+        Report
+        ======
+
+        Print number of shots, shot numbers listed more than once and invalid shot numbers.
+        """
+
+        pyflame.print(f'Shot Name Pattern: {self.shot_name}', print_to_flame=False)
+        pyflame.print(f'Shots To Create: {self.count}', print_to_flame=False, new_line=False)
+
+        for text, other_text, shared in self.overlaps:
+            pyflame.print(f'Shot numbers in both {text} and {other_text} will only be created once: {shared}', text_color=TextColor.YELLOW, print_to_flame=False, new_line=False)
+
+        for item in self.invalid:
+            pyflame.print(f'Skipping invalid shot number: {item}', text_color=TextColor.YELLOW, print_to_flame=False, new_line=False)
+
+    def __iter__(self):
+
+        if self.parts is None:
+            yield self.shot_name
+            return
+
+        # Only track generated shot numbers when ranges overlap
+        generated = set() if self.overlaps else None
+
+        for numbers, padding, _ in self.ranges:
+            for number in numbers:
+                if generated is not None:
+                    if (number, padding) in generated:
+                        continue
+                    generated.add((number, padding))
+                yield str(number).zfill(padding).join(self.parts)
+
 class CreateShotFolders():
 
     def __init__(self, selection) -> None:
@@ -464,6 +751,9 @@ class CreateShotFolders():
         # Create list of shots to create.
         shot_list = self.create_shot_list()
 
+        # Use the same date and time for every folder created.
+        date = datetime.datetime.now()
+
         # Create Media Panel folders.
         if self.settings.create_folders:
 
@@ -471,11 +761,21 @@ class CreateShotFolders():
             media_panel_dest = flame.projects.current_project.current_workspace.create_library('Shot Folders')
 
             # Create Media Panel shot folders
-            pyflame.create_media_panel_folders(
-                folder_list=shot_list,
-                folder_structure=self.settings.folders,
-                dest=media_panel_dest,
-                )
+            template = FolderTemplate(self.settings.folders, date)
+            if template.varies:
+                for shot_name in shot_list:
+                    pyflame.create_media_panel_folder(
+                        folder_name=shot_name,
+                        folder_structure=template.structure(shot_name),
+                        dest=media_panel_dest,
+                        shot_name_tag=shot_name,
+                        )
+            else:
+                pyflame.create_media_panel_folders(
+                    folder_list=shot_list,
+                    folder_structure=template.static_structure,
+                    dest=media_panel_dest,
+                    )
 
             pyflame.print('Media Panel Shot Folders Created', arrow=True)
 
@@ -507,11 +807,21 @@ class CreateShotFolders():
                 return
 
             # Create file system shot folders
-            pyflame.create_file_system_folders(
-                folder_list=shot_list,
-                folder_structure=self.settings.file_system_folders,
-                dest_path=folder_dest,
-                )
+            template = FolderTemplate(self.settings.file_system_folders, date)
+            if template.varies:
+                folder_plan = []
+                for shot_name in shot_list:
+                    folder_plan += pyflame.plan_file_system_folders([shot_name], template.structure(shot_name), folder_dest)
+            else:
+                folder_plan = pyflame.plan_file_system_folders(shot_list, template.static_structure, folder_dest)
+            created_folders = pyflame.create_file_system_folder_plan(folder_plan)
+
+            if len(created_folders) < len(folder_plan):
+                PyFlameMessageWindow(
+                    message=f'Unable to create {len(folder_plan) - len(created_folders)} file system folder(s).\n\nCheck terminal for details.',
+                    message_type=MessageType.ERROR,
+                    parent=self.window,
+                    )
 
             # Reveal in Finder if enabled
             if self.settings.reveal_in_finder:
@@ -556,6 +866,7 @@ class CreateShotFolders():
             by the length of the numbers within the range or sequence.
             - If neither the <ShotNum> token nor a range in brackets is present, the function will return a single
             shot name as specified in the shot_name.
+            - Shot numbers listed more than once are only created once.
 
         Examples
         --------
@@ -581,69 +892,15 @@ class CreateShotFolders():
 
         pyflame.print('Creating shot list...')
 
-        # Initialize shot name list
-        shot_list = []
-
-        # Extract <ShotNum> token with brackets
-        shot_num_match = re.search(r'<ShotNum\[([0-9, \-]+)\]>', self.settings.shot_name)
-        if shot_num_match:
-            shot_sequence = shot_num_match.group(1).replace(' ', '')
-            shots = shot_sequence.split(',')
-            shot_name_prefix = self.settings.shot_name.split('<ShotNum', 1)[0]
-            shot_name_suffix = self.settings.shot_name.split('>', 1)[1]
-
-            # Generate shot names from sequence
-            for shot in shots:
-                if '-' in shot:
-                    start, end = shot.split('-')
-                    start, end = int(start.lstrip('0')), int(end.lstrip('0'))
-                    padding = len(shot.split('-')[0])
-
-                    for n in range(start, end + 1, self.settings.shot_increments):
-                        shot_name = shot_name_prefix + str(n).zfill(padding) + shot_name_suffix
-                        shot_list.append(shot_name)
-                else:
-                    shot_list.append(shot_name_prefix + shot + shot_name_suffix)
-        else:
-            # Check for <ShotNum> token with or without padding
-            shot_padding_match = re.search(r'<ShotNum#+>|<ShotNum>', self.settings.shot_name)
-            if shot_padding_match:
-                # Set default padding to 4 if only <ShotNum> is used
-                if shot_padding_match.group(0) == '<ShotNum>':
-                    shot_padding = 4
-                else:
-                    shot_padding = shot_padding_match.group(0).count('#')
-
-                # Calculate the total number of folders
-                num_folders = self.settings.number_of_shots * self.settings.shot_increments + self.settings.starting_shot
-
-                # Generate shot names with padding
-                for x in range(self.settings.starting_shot, num_folders, self.settings.shot_increments):
-                    shot_name = re.sub(r'<ShotNum#+>|<ShotNum>', str(x).zfill(shot_padding), self.settings.shot_name)
-                    shot_list.append(shot_name)
-            else:
-                # Check if shot_name contains a sequence in brackets outside of <ShotNum>
-                if '[' in self.settings.shot_name and ']' in self.settings.shot_name:
-                    # Extract prefix and sequence
-                    shot_name_prefix = self.settings.shot_name.split('[', 1)[0]
-                    shot_sequence = self.settings.shot_name.split('[', 1)[1].rsplit(']', 1)[0].replace(' ', '')
-                    shots = shot_sequence.split(',')
-
-                    # Generate shot names from sequence
-                    for shot in shots:
-                        if '-' in shot:
-                            start, end = shot.split('-')
-                            start, end = int(start.lstrip('0')), int(end.lstrip('0'))
-                            padding = len(shot.split('-')[0])
-
-                            for n in range(start, end + 1, self.settings.shot_increments):
-                                shot_name = shot_name_prefix + str(n).zfill(padding)
-                                shot_list.append(shot_name)
-                        else:
-                            shot_list.append(shot_name_prefix + shot)
-                else:
-                    # Single shot name without sequence
-                    shot_list.append(self.settings.shot_name)
+        shot_names = ShotList(
+            shot_name=self.settings.shot_name,
+            number_of_shots=self.settings.number_of_shots,
+            starting_shot=self.settings.starting_shot,
+            shot_increments=self.settings.shot_increments,
+            )
+        shot_names.report()
+
+        shot_list = list(shot_names)
 
         pyflame.print_list(
             list_name='Shots To Create',
@@ -33,6 +33,8 @@ Description:
 
     Delete any empty folders in selected Library or Folder.
 
+    Show Empty Folders lists the empty folders that would be deleted without deleting anything.
+
 URL:
     https://github.com/logik-portal/python/delete_empty_folders
 
@@ -40,6 +42,8 @@ Menu:
 
     Right-click on Folder or Library in Media Panel -> Delete Empty Folders
 
+    Right-click on Folder or Library in Media Panel -> Show Empty Folders
+
 To install:
 
     Copy script folder into /opt/Autodesk/shared/python
@@ -69,6 +73,7 @@ Updates:
 #-------------------------------------
 
 import os
+from functools import partial
 
 import flame
 from lib.pyflame_lib_delete_empty_folders import *
@@ -87,7 +92,7 @@ SCRIPT_PATH = os.path.abspath(os.path.dirname(__file__))
 
 class DeleteEmptyFolders:
 
-    def __init__(self, selection):
+    def __init__(self, selection, dry_run: bool=False):
 
         pyflame.print_title(f'{SCRIPT_NAME} {SCRIPT_VERSION}')
 
@@ -96,6 +101,7 @@ class DeleteEmptyFolders:
             return
 
         self.selection = selection
+        self.dry_run = dry_run
 
         self.delete_empty_folders()
 
@@ -105,45 +111,63 @@ class DeleteEmptyFolders:
         ====================
 
         Loop through selection(Library or Folder) and delete empty folders.
-        """
-
-        def check_folders(root_folder):
 
-            while True:
-                # Find empty folders
-                empty_folders = find_empty_folders(root_folder)
-
-                # If no empty folders, break the loop
-                if not empty_folders:
-                    break
+        Folders are checked in a single pass, deepest folders first. A folder is empty if it only contains empty
+        folders. Only the top folder of each empty branch is deleted, which deletes the empty folders inside it.
+        When dry_run is True, empty folders are only listed.
+        """
 
-                # Delete found empty folders
-                for folder in empty_folders:
-                    pyflame.print(f'Deleting empty folder: {str(folder.name)[1:-1]}')
-                    flame.delete(folder)
+        def find_empty_folders(folder, path, parent=None) -> bool:
+            """
+            Check folder and its sub-folders. Adds the top folder of each empty branch to empty_folders.
+            Returns True if folder only contains empty folders.
+            """
 
-            pyflame.print('All empty folders have been deleted.', text_color=TextColor.GREEN)
+            empty_subfolders = []
+            is_empty = True
 
-        def find_empty_folders(folder, parent=None):
+            # Check sub-folders first so their parents know if they are empty
+            for subfolder in list(folder.folders):
+                subfolder_path = f'{path}/{str(subfolder.name)[1:-1]}'
+                if find_empty_folders(subfolder, subfolder_path, folder):
+                    empty_subfolders.append((subfolder, subfolder_path))
+                else:
+                    is_empty = False
 
-            empty_folders = []
+            # Check the current folder for anything other than folders
+            if is_empty and any(not isinstance(item, flame.PyFolder) for item in folder.children):
+                is_empty = False
 
-            # Iterate through each subfolder
-            for subfolder in list(folder.folders):
-                # Recursively check each subfolder
-                empty_folders.extend(find_empty_folders(subfolder, folder))
+            # Empty branches are deleted from their top folder. Selected folders are never deleted.
+            if not is_empty or parent is None:
+                empty_folders.extend(empty_subfolders)
 
-            # Check if the current folder is empty
-            if not folder.children and not folder.folders and parent is not None:
-                empty_folders.append(folder)
+            return is_empty
 
-            return empty_folders
+        if self.dry_run:
+            pyflame.print('Checking for empty folders...')
+        else:
+            pyflame.print('Checking for and deleting empty folders...')
 
-        pyflame.print('Checking for and deleting empty folders...')
+        empty_folders = []
 
         # Loop through selection and check for empty folders
         for folder in self.selection:
-            check_folders(folder)
+            find_empty_folders(folder, str(folder.name)[1:-1])
+
+        if self.dry_run:
+            pyflame.print_list(
+                list_name='Empty Folders',
+                list_items=[path for _, path in empty_folders],
+                )
+            pyflame.print(f'Empty folders found: {len(empty_folders)}', text_color=TextColor.GREEN)
+            return
+
+        for folder, path in empty_folders:
+            pyflame.print(f'Deleting empty folder: {path}', print_to_flame=False, new_line=False)
+            flame.delete(folder)
+
+        pyflame.print('All empty folders have been deleted.', text_color=TextColor.GREEN)
 
 #-------------------------------------
 # [Scopes]
@@ -169,10 +193,17 @@ def get_media_panel_custom_ui_actions():
                {
                     'name': 'Delete Empty Folders',
                     'order': 1,
-                    'separator': 'below',
                     'execute': DeleteEmptyFolders,
                     'isVisible': scope_library_folder,
                     'minimumVersion': '2023.2'
+               },
+               {
+                    'name': 'Show Empty Folders',
+                    'order': 2,
+                    'separator': 'below',
+                    'execute': partial(DeleteEmptyFolders, dry_run=True),
+                    'isVisible': scope_library_folder,
+                    'minimumVersion': '2023.2'
                }
            ]
         }
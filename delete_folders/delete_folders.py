@@ -33,6 +33,9 @@ Description:
 
     Delete one or more folders along with contents in the MediaHub File Tab view
 
+    Selected folders are first moved into a hidden .pyflame_trash folder next to them, so they are gone from the
+    MediaHub right away. Their contents are then deleted in the background while Flame keeps working.
+
     *** WARNING - THIS WILL DELETE ALL SELECTED FOLDERS/SUBFOLDERS - THIS IS CAN NOT BE UNDONE***
 
 URL:
@@ -88,7 +91,10 @@ Updates:
 #-------------------------------------
 
 import os
-import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import flame
 
 from lib.pyflame_lib_delete_folders import *
@@ -100,11 +106,210 @@ from lib.pyflame_lib_delete_folders import *
 SCRIPT_NAME = 'Delete Folders'
 SCRIPT_VERSION = 'v2.10.0'
 SCRIPT_PATH = os.path.abspath(os.path.dirname(__file__))
+TRASH_FOLDER_NAME = '.pyflame_trash'
+MAX_WORKERS = 8
+
+# Deletions running in the background. Keeps them alive until they are finished.
+active_deletions = set()
 
 #-------------------------------------
 # [Main Script]
 #-------------------------------------
 
+def format_size(size: int) -> str:
+    """
+    Format Size
+    ===========
+
+    Format number of bytes as a readable size, i.e. 1.5 GB.
+    """
+
+    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
+        if size < 1024 or unit == 'TB':
+            break
+        size /= 1024
+
+    return f'{size:.1f} {unit}' if unit != 'B' else f'{size} B'
+
+def move_to_trash(path: str) -> str:
+    """
+    Move To Trash
+    =============
+
+    Move folder into the hidden trash folder in its parent folder. Renaming on the same file system is instant, so the
+    folder disappears from the MediaHub right away.
+
+    Args
+    ----
+        path (str):
+            Folder to move.
+
+    Returns
+    -------
+        str:
+            Path of folder in trash folder.
+    """
+
+    trash_folder = os.path.join(os.path.dirname(path), TRASH_FOLDER_NAME)
+    os.makedirs(trash_folder, exist_ok=True)
+
+    trash_path = os.path.join(trash_folder, f'{os.path.basename(path)}.{time.time_ns()}')
+    os.rename(path, trash_path)
+
+    return trash_path
+
+def remove_tree(path: str) -> tuple[int, list[str]]:
+    """
+    Remove Tree
+    ===========
+
+    Delete file or folder and its contents. Errors are collected instead of stopping the delete.
+
+    Args
+    ----
+        path (str):
+            File or folder to delete.
+
+    Returns
+    -------
+        tuple[int, list[str]]:
+            Bytes deleted and errors.
+    """
+
+    deleted_bytes = 0
+    errors = []
+
+    def remove(path: str, is_dir: bool) -> None:
+        nonlocal deleted_bytes
+        try:
+            if is_dir:
+                with os.scandir(path) as entries:
+                    children = [(entry.path, entry.is_dir(follow_symlinks=False)) for entry in entries]
+                for child_path, child_is_dir in children:
+                    remove(child_path, child_is_dir)
+                os.rmdir(path)
+            else:
+                size = os.lstat(path).st_size
+                os.unlink(path)
+                deleted_bytes += size
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            errors.append(f'{path}: {e}')
+
+    remove(path, os.path.isdir(path) and not os.path.islink(path))
+
+    return deleted_bytes, errors
+
+class FolderDeletion(QtCore.QObject):
+    """
+    Folder Deletion
+    ===============
+
+    Delete folders in a background thread. The contents of each folder are split between worker threads.
+    Progress and results are sent to the main thread with signals, so only the main thread prints to Flame.
+
+    Args
+    ----
+        paths (list[str]):
+            Folders to delete, usually already moved to a trash folder.
+    """
+
+    progress = QtCore.Signal(int, int, object)
+    finished = QtCore.Signal(object, list)
+
+    def __init__(self, paths: list[str]) -> None:
+        super().__init__()
+
+        self.paths = paths
+
+        self.progress.connect(self.show_progress)
+        self.finished.connect(self.show_finished)
+
+    def start(self) -> None:
+
+        active_deletions.add(self)
+
+        thread = threading.Thread(target=self.run, daemon=True)
+        thread.start()
+
+    def run(self) -> None:
+        """
+        Run
+        ===
+
+        Runs in background thread. Delete contents of each folder in parallel, then the folders themselves.
+        """
+
+        errors = []
+        tasks = []
+
+        for path in self.paths:
+            try:
+                with os.scandir(path) as entries:
+                    tasks.extend(entry.path for entry in entries)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                errors.append(f'{path}: {e}')
+
+        deleted_bytes = 0
+        last_progress = 0.0
+
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            for index, (task_bytes, task_errors) in enumerate(executor.map(remove_tree, tasks), 1):
+                deleted_bytes += task_bytes
+                errors.extend(task_errors)
+                if time.monotonic() - last_progress > 1.0 or index == len(tasks):
+                    last_progress = time.monotonic()
+                    self.progress.emit(index, len(tasks), deleted_bytes)
+
+        for path in self.paths:
+            task_bytes, task_errors = remove_tree(path)
+            deleted_bytes += task_bytes
+            errors.extend(task_errors)
+
+            # Remove trash folder once nothing else is using it
+            if os.path.basename(os.path.dirname(path)) == TRASH_FOLDER_NAME:
+                try:
+                    os.rmdir(os.path.dirname(path))
+                except OSError:
+                    pass
+
+        self.finished.emit(deleted_bytes, errors)
+
+    def show_progress(self, deleted: int, total: int, deleted_bytes: int) -> None:
+        """
+        Show Progress
+        =============
+
+        Runs in main thread.
+        """
+
+        pyflame.print(f'Deleting Folders: {deleted} of {total} items - {format_size(deleted_bytes)}', print_to_flame=False, new_line=False)
+
+    def show_finished(self, deleted_bytes: int, errors: list) -> None:
+        """
+        Show Finished
+        =============
+
+        Runs in main thread.
+        """
+
+        active_deletions.discard(self)
+
+        for error in errors:
+            pyflame.print(error, print_type=PrintType.ERROR, print_to_flame=False, new_line=False)
+
+        if errors:
+            PyFlameMessageWindow(
+                message=f'Unable to delete {len(errors)} item(s). See terminal for details.',
+                message_type=MessageType.ERROR,
+                parent=None,
+                )
+
+        pyflame.print(f'Selected Folders Deleted: {format_size(deleted_bytes)}', text_color=TextColor.GREEN)
+
 def delete_folders(selection):
     """
     Delete Folders
@@ -114,6 +319,10 @@ def delete_folders(selection):
     ----------------------
 
     Delete all files and sub-folders in selected folder(s).
+
+    Folders are moved into a hidden trash folder on the same file system, then deleted in the background. Folders
+    left in trash folders by an earlier delete that did not finish are deleted as well. Folders that can't be moved
+    are deleted where they are.
     """
 
     pyflame.print_title(f'{SCRIPT_NAME} {SCRIPT_VERSION}')
@@ -139,17 +348,33 @@ def delete_folders(selection):
             underline=True,
             text_color=TextColor.GREEN,
             )
+
+        paths = []
         for folder in selection:
+            path = folder.path.rstrip('/')
             pyflame.print(
-                text=f'{folder.path[:-1]}',
+                text=path,
                 print_type=PrintType.WARNING,
                 new_line=False,
                 )
-            shutil.rmtree(folder.path)
+            try:
+                paths.append(move_to_trash(path))
+            except OSError as e:
+                pyflame.print(f'Unable to move folder to trash, deleting in place: {e}', print_type=PrintType.WARNING, new_line=False)
+                paths.append(path)
+
+        # Add folders left in trash folders by earlier deletes
+        active_paths = {path for deletion in active_deletions for path in deletion.paths}
+        for trash_folder in {os.path.dirname(path) for path in paths if os.path.basename(os.path.dirname(path)) == TRASH_FOLDER_NAME}:
+            for entry in os.scandir(trash_folder):
+                if entry.path not in paths and entry.path not in active_paths:
+                    paths.append(entry.path)
 
         flame.execute_shortcut("Refresh the MediaHub's Folders and Files")
 
-        pyflame.print('\nSelected Folders Deleted', text_color=TextColor.GREEN)
+        FolderDeletion(paths).start()
+
+        pyflame.print('\nSelected Folders Moved To Trash, Deleting In Background', text_color=TextColor.GREEN)
 
 #-------------------------------------
 # [Scopes]
@@ -144,12 +144,9 @@ class DeleteIterations:
                     }
                 )
 
-            pyflame.print(f'Deleting iterations. Keeping last {self.settings.iterations_to_keep} iterations.', text_color=TextColor.GREEN)
-
-            # Delete iterations
-            self.cleanup()
-
-            pyflame.print('Iterations deleted.', text_color=TextColor.GREEN)
+            # Delete iterations, leave window open if deletion is cancelled
+            if not self.cleanup():
+                return
 
             # Close window
             self.window.close()
@@ -207,106 +204,127 @@ class DeleteIterations:
         self.window.grid_layout.addWidget(self.cancel_button, 2, 0)
         self.window.grid_layout.addWidget(self.delete_button, 2, 1)
 
-    def cleanup(self):
+    def cleanup(self) -> bool:
         """
         Cleanup
         =======
 
-        Delete iterations from selection based on selection type.
-        """
-
-        if isinstance(self.selection[0], flame.PyDesktop):
-            self.clean_desktop()
-        elif isinstance(self.selection[0], flame.PyBatch):
-            self.clean_batch_group()
-        elif isinstance(self.selection[0], flame.PyFolder):
-            self.clean_folder()
-        elif isinstance(self.selection[0], flame.PyLibrary):
-            self.clean_library()
+        Find iterations to delete in selection, confirm, then delete them.
 
-    def delete_iterations(self, batch_group):
+        Returns
+        -------
+            bool: True if iterations were deleted or there was nothing to delete, False if cancelled.
         """
-        Delete Iterations
-        ==================
 
-        Delete iterations from batch group.
+        plan = self.plan_deletions()
 
-        Deletes all iterations if iterations_to_keep is set to 0. Otherwise, keeps the specified number of iterations.
+        iteration_count = sum(len(iterations) for batch_group, iterations, on_desktop in plan)
 
-        Args:
-        -----
-            batch_group (flame.PyBatch): Batch Group to delete iterations from.
-        """
+        if not iteration_count:
+            PyFlameMessageWindow(
+                message='No iterations to delete.',
+                title=f'{SCRIPT_NAME}',
+                parent=self.window,
+                )
+            return True
 
-        if self.settings.iterations_to_keep != 0:
-            for iteration in batch_group.batch_iterations[:-self.settings.iterations_to_keep]:
-                flame.delete(iteration, confirm=False)
-        else:
-            for iteration in batch_group.batch_iterations:
-                flame.delete(iteration, confirm=False)
+        # Confirm deletion
+        if not PyFlameMessageWindow(
+            message=(
+                f'Delete {iteration_count} iterations from {len(plan)} batch groups?\n\n'
+                f'The last {self.settings.iterations_to_keep} iterations of each batch group will be kept.'
+                ),
+            message_type=MessageType.CONFIRM,
+            title=f'{SCRIPT_NAME}: Confirm Operation',
+            parent=self.window,
+            ):
+            return False
 
-    def clean_desktop(self):
-        """
-        Clean Desktop
-        =============
+        pyflame.print(f'Deleting iterations. Keeping last {self.settings.iterations_to_keep} iterations.', text_color=TextColor.GREEN)
 
-        Loop through selection(Desktop) and delete iterations from all batch groups in the desktop.
-        """
+        self.delete_iterations(plan)
+
+        pyflame.print(f'{iteration_count} iterations deleted from {len(plan)} batch groups.', text_color=TextColor.GREEN)
 
-        workspace = flame.projects.current_project.current_workspace
-        for batch_group in workspace.desktop.batch_groups:
-            workspace.desktop.current_batch_group = batch_group
-            self.delete_iterations(batch_group)
+        return True
 
-    def clean_batch_group(self):
+    def find_batch_groups(self) -> list:
         """
-        Clean Batch Group
+        Find Batch Groups
         =================
 
-        Loop through selection(Batch Group) and delete iterations from all batch groups in the selection.
-        """
+        Find all batch groups in selection. Folders and libraries are searched with a stack instead of recursion.
 
-        for batch_group in self.selection:
-            self.delete_iterations(batch_group)
+        Only batch groups on the workspace desktop are marked as on the desktop. Batch groups in desktops saved in a
+        library are handled like any other Media Panel batch group.
 
-    def find_batch_group(self, folder):
+        Returns
+        -------
+            list: List of (batch_group, on_desktop) tuples.
         """
-        Find Batch Group
-        ================
 
-        Recursively find Batch Groups inside folders and libraries and delete all their iterations.
+        batch_groups = []
 
-        Args:
-        -----
-            folder (flame.PyFolder): Folder to search for Batch Groups in.
-        """
+        for item in self.selection:
+            if isinstance(item, flame.PyDesktop):
+                on_desktop = isinstance(item.parent, flame.PyWorkspace)
+                batch_groups.extend((batch_group, on_desktop) for batch_group in item.batch_groups)
+            elif isinstance(item, flame.PyBatch):
+                batch_groups.append((item, False))
+            elif isinstance(item, (flame.PyFolder, flame.PyLibrary)):
+                folders = [item]
+                while folders:
+                    folder = folders.pop()
+                    batch_groups.extend((batch_group, False) for batch_group in folder.batch_groups)
+                    folders.extend(folder.folders)
 
-        for batch_group in folder.batch_groups:
-            self.delete_iterations(batch_group)
-        for folders in folder.folders:
-            self.find_batch_group(folders)
+        return batch_groups
 
-    def clean_library(self):
+    def plan_deletions(self) -> list:
         """
-        Clean Library
-        =============
+        Plan Deletions
+        ==============
 
-        Loop through selection(Library) and delete iterations from all batch groups in the library including in any folders.
+        Get iterations to delete from all batch groups in selection without changing the current batch group.
+
+        Deletes all iterations if iterations_to_keep is set to 0. Otherwise, keeps the specified number of iterations.
+
+        Returns
+        -------
+            list: List of (batch_group, iterations, on_desktop) tuples. Only batch groups with iterations to delete are included.
         """
 
-        for top_library in self.selection:
-            self.find_batch_group(top_library)
+        plan = []
+
+        for batch_group, on_desktop in self.find_batch_groups():
+            iterations = list(batch_group.batch_iterations)
+            if self.settings.iterations_to_keep != 0:
+                iterations = iterations[:-self.settings.iterations_to_keep]
+            if iterations:
+                plan.append((batch_group, iterations, on_desktop))
 
-    def clean_folder(self):
+        return plan
+
+    def delete_iterations(self, plan: list) -> None:
         """
-        Clean Folder
-        =============
+        Delete Iterations
+        =================
+
+        Delete planned iterations, one batch group at a time. Desktop batch groups are made current once before their
+        iterations are deleted.
 
-        Loop through selection(Folder) and delete iterations from all batch groups in the folders.
+        Args:
+        -----
+            plan (list): List of (batch_group, iterations, on_desktop) tuples from plan_deletions.
         """
 
-        for top_folder in self.selection:
-            self.find_batch_group(top_folder)
+        desktop = flame.projects.current_project.current_workspace.desktop
+
+        for batch_group, iterations, on_desktop in plan:
+            if on_desktop:
+                desktop.current_batch_group = batch_group
+            for iteration in iterations:
+                flame.delete(iteration, confirm=False)
 
 #-------------------------------------
 # [Scopes]
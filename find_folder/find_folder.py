@@ -12,6 +12,12 @@ Description:
     navigating a folder that contains many many subfolders with long names but you have
     a search term that would quickly find the folder you need.
 
+    Subdirectories at every depth are searched.  The folder tree is indexed in the
+    background and the index is saved in ~/.find_folder, so searching the same folder
+    again only rescans directories that changed.  Results are ranked with folder names
+    starting with the search term first, then names containing it, then full paths
+    containing it, then close matches.
+
     URL: http://github.com/khanrahan/find-folder
 
 Menus:
@@ -28,7 +34,11 @@ To Install:
 """
 
 
+import hashlib
+import heapq
+import json
 import os
+import threading
 from typing import Optional
 
 import flame
@@ -39,6 +49,8 @@ VERSION_INFO = (3, 0, 0)
 VERSION = '.'.join([str(num) for num in VERSION_INFO])
 TITLE_VERSION = f'{TITLE} v{VERSION}'
 MESSAGE_PREFIX = '[PYTHON]'
+INDEX_DIR = os.path.join(os.path.expanduser('~'), '.find_folder')
+MAX_RESULTS = 500
 
 
 class FlameButton(QtWidgets.QPushButton):
@@ -317,6 +329,187 @@ class FlameMessageBox(QtWidgets.QMessageBox):
                 font: italic}""")
 
 
+def trigrams(text):
+    """Return the set of 3 character substrings in text."""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class FolderIndex(QtCore.QObject):
+    """Recursive index of the subdirectories of a root folder.
+
+    The index is saved per root folder in INDEX_DIR.  Each directory is stored with its
+    mtime and subdirectory names.  Refreshing the index only lists directories whose mtime
+    changed, every other directory costs a single stat.  Hidden directories and symlinks
+    are skipped.
+
+    Refreshing runs in a background thread.  The updated folder list is sent to the main
+    thread with the indexed signal.
+    """
+
+    indexed = QtCore.Signal(list)
+
+    def __init__(self, root):
+        super().__init__()
+
+        self.root = root.rstrip('/') or '/'
+        self.index_path = os.path.join(
+            INDEX_DIR, hashlib.sha1(self.root.encode()).hexdigest() + '.json')
+        self.directories = self.load()
+
+        self.paths = []
+        self.lower_paths = []
+        self.lower_names = []
+        self.trigram_index = {}
+
+        # Without a saved index, show the first level folders until the full scan is done
+        if self.directories:
+            self.set_paths(self.walk_index())
+        else:
+            self.set_paths(self.first_level_folders())
+
+    def first_level_folders(self):
+        """Return sorted subdirectory names of the root folder."""
+        try:
+            with os.scandir(self.root) as entries:
+                return sorted(
+                    entry.name for entry in entries
+                    if entry.name[0] != '.' and entry.is_dir(follow_symlinks=False))
+        except OSError:
+            return []
+
+    def load(self):
+        """Return saved directories for this root, or an empty dict."""
+        try:
+            with open(self.index_path) as index_file:
+                index = json.load(index_file)
+        except (OSError, ValueError):
+            return {}
+
+        if index.get('root') != self.root:
+            return {}
+
+        return index.get('directories', {})
+
+    def save(self, directories):
+        """Save directories for this root."""
+        try:
+            os.makedirs(INDEX_DIR, exist_ok=True)
+            temp_path = self.index_path + '.tmp'
+            with open(temp_path, 'w') as index_file:
+                json.dump({'root': self.root, 'directories': directories}, index_file)
+            os.replace(temp_path, self.index_path)
+        except OSError as error:
+            print(' '.join([MESSAGE_PREFIX, f'Could not save folder index: {error}']))
+
+    def walk_index(self, directories=None):
+        """Return relative paths of all directories in the index, parents first."""
+        directories = self.directories if directories is None else directories
+        paths = []
+        stack = ['']
+
+        while stack:
+            relative_path = stack.pop()
+            for name in directories.get(relative_path, (0, []))[1]:
+                child = os.path.join(relative_path, name)
+                paths.append(child)
+                stack.append(child)
+
+        return paths
+
+    def set_paths(self, paths):
+        """Use paths for searching and build the trigram index."""
+        self.paths = paths
+        self.lower_paths = [path.lower() for path in paths]
+        self.lower_names = [os.path.basename(path) for path in self.lower_paths]
+
+        trigram_index = {}
+        for num, path in enumerate(self.lower_paths):
+            for trigram in trigrams(path):
+                trigram_index.setdefault(trigram, []).append(num)
+        self.trigram_index = trigram_index
+
+    def refresh(self):
+        """Update the index in a background thread."""
+        thread = threading.Thread(target=self.scan, daemon=True)
+        thread.start()
+
+    def scan(self):
+        """Runs in background thread.  Rescan directories whose mtime changed."""
+        cached = self.directories
+        directories = {}
+        stack = ['']
+
+        while stack:
+            relative_path = stack.pop()
+            path = os.path.join(self.root, relative_path)
+
+            try:
+                mtime = os.stat(path).st_mtime
+            except OSError:
+                continue
+
+            if relative_path in cached and cached[relative_path][0] == mtime:
+                names = cached[relative_path][1]
+            else:
+                try:
+                    with os.scandir(path) as entries:
+                        names = sorted(
+                            entry.name for entry in entries
+                            if entry.name[0] != '.' and entry.is_dir(follow_symlinks=False))
+                except OSError:
+                    names = []
+
+            directories[relative_path] = (mtime, names)
+            stack.extend(os.path.join(relative_path, name) for name in names)
+
+        self.save(directories)
+        self.directories = directories
+        self.indexed.emit(self.walk_index(directories))
+
+    def search(self, text, limit=MAX_RESULTS):
+        """Return relative paths matching text, best matches first.
+
+        Folder names starting with text rank first, then folder names containing text,
+        then paths containing text.  Searches of 3 or more characters also return paths
+        sharing at least half of the search's trigrams, ranked by how many they share.
+        """
+        query = text.lower()
+
+        if not query:
+            return [path for path in self.paths if os.sep not in path]
+
+        if len(query) < 3:
+            candidates = range(len(self.paths))
+            query_trigrams = set()
+            counts = {}
+        else:
+            query_trigrams = trigrams(query)
+            counts = {}
+            for trigram in query_trigrams:
+                for num in self.trigram_index.get(trigram, ()):
+                    counts[num] = counts.get(num, 0) + 1
+            needed = max(1, len(query_trigrams) // 2)
+            candidates = [num for num, count in counts.items() if count >= needed]
+
+        results = []
+        for num in candidates:
+            name = self.lower_names[num]
+            path = self.lower_paths[num]
+            if name.startswith(query):
+                score = 0
+            elif query in name:
+                score = 1
+            elif query in path:
+                score = 2
+            elif query_trigrams:
+                score = 4 - counts[num] / len(query_trigrams)
+            else:
+                continue
+            results.append((score, len(path), self.paths[num]))
+
+        return [path for _, _, path in heapq.nsmallest(limit, results)]
+
+
 class FindFolder:
     """Searches for a subdirectory.
 
@@ -334,24 +527,33 @@ class FindFolder:
         self.dest_folder = ''
         self.dest_path = ''
 
+        self.index = FolderIndex(self.src_path)
+        self.index.indexed.connect(self.update_index)
+
         self.main_window()
 
+        self.index.refresh()
+
     @staticmethod
     def message(string):
         """Print message to shell window and append global MESSAGE_PREFIX."""
         print(' '.join([MESSAGE_PREFIX, string]))
 
-    def get_folders(self):
-        """Return all subdirectories in a folder."""
-        walker = os.walk(self.src_path)
-
-        root, dirs, files = next(walker)
-        del root
-        del files
+    def update_index(self, paths):
+        """Search the refreshed index and update the results list."""
+        self.index.set_paths(paths)
+        self.message(f'Indexed {len(paths)} folders in {self.src_path}')
 
-        results = [d for d in dirs if d[0] != '.']  # results unsorted
+        try:
+            self.filter_list()
+            self.status_label.setText(f'{len(paths)} folders')
+        except RuntimeError:
+            pass  # window was closed
 
-        return results
+    def filter_list(self):
+        """Show the best matches for the text in the Find bar."""
+        self.list_scroll.clear()
+        self.list_scroll.addItems(self.index.search(self.find.text()))
 
     def main_window(self):
         """Enter search terms, view results, then confirm the selection."""
@@ -374,14 +576,6 @@ class FindFolder:
             self.window.close()
             self.message('Cancelled!')
 
-        def filter_list():
-            """Updates the results list when anything is typed in the Find bar."""
-            for num in range(self.list_scroll.count()):
-                if self.find.text() in self.list_scroll.item(num).text():
-                    self.list_scroll.item(num).setHidden(False)
-                else:
-                    self.list_scroll.item(num).setHidden(True)
-
         self.window = QtWidgets.QWidget()
 
         self.window.setMinimumSize(600, 600)
@@ -406,13 +600,15 @@ class FindFolder:
 
         # Line Edit
         self.find = FlameLineEdit('')
-        self.find.textChanged.connect(filter_list)
+        self.find.textChanged.connect(self.filter_list)
 
         # List Widget
         self.list_scroll = FlameListWidget(min_width=500)
-        self.list_scroll.addItems(self.get_folders())
-        self.list_scroll.sortItems()
         self.list_scroll.itemDoubleClicked.connect(okay_button)
+        self.filter_list()
+
+        # Status
+        self.status_label = FlameLabel('Indexing folders...', label_width=300)
 
         # Buttons
         self.ok_btn = FlameButton('Ok', okay_button, button_color='blue')
@@ -434,6 +630,7 @@ class FindFolder:
         self.hbox.addStretch(1)
 
         self.hbox2 = QtWidgets.QHBoxLayout()
+        self.hbox2.addWidget(self.status_label)
         self.hbox2.addStretch(1)
         self.hbox2.addWidget(self.cancel_btn)
         self.hbox2.addWidget(self.ok_btn)
@@ -38,6 +38,11 @@ To Install:
 """
 
 
+import os
+import shutil
+import tempfile
+import time
+
 import flame
 from PySide6 import QtCore, QtGui, QtWidgets
 
@@ -47,7 +52,10 @@ VERSION = '.'.join([str(num) for num in VERSION_INFO])
 TITLE_VERSION = f'{TITLE} v{VERSION}'
 MESSAGE_PREFIX = '[PYTHON]'
 
-TEMP_SETUP = '/var/tmp/find_and_replace_in_text_timelinefx_temp'
+# Scratch setups go in a unique folder per run, in RAM when /dev/shm is available
+TEMP_SETUP = 'find_and_replace_in_text_timelinefx_temp'
+TEMP_PREFIX = 'find_and_replace_in_text_timelinefx_'
+PROGRESS_INTERVAL = 0.1  # seconds between progress window updates
 
 
 class FlameButton(QtWidgets.QPushButton):
@@ -486,6 +494,15 @@ class FindReplaceInTextFX:
         """Print to the shell window."""
         print(' '.join([MESSAGE_PREFIX, string]))
 
+    @staticmethod
+    def create_temp_folder():
+        """Create a unique folder for scratch setups and return its path.
+
+        Uses /dev/shm if writable so setup round trips stay in RAM.
+        """
+        temp_root = '/dev/shm' if os.access('/dev/shm', os.W_OK) else None
+        return tempfile.mkdtemp(prefix=TEMP_PREFIX, dir=temp_root)
+
     def filter_segments(self):
         """Needed to filter the selection results of a segment.
 
@@ -535,11 +552,11 @@ class FindReplaceInTextFX:
 
     def process_segment(self, segment, find, replace):
         """Find and replace on a single segment object."""
-        self.save_text_timeline_fx(segment, TEMP_SETUP)
+        self.save_text_timeline_fx(segment, self.temp_setup)
         self.remove_timeline_fx(segment, 'Text')
         self.add_timeline_fx(segment, 'Text')
-        self.find_and_write(TEMP_SETUP, find, replace)
-        self.load_text_timeline_fx(segment, TEMP_SETUP)
+        self.find_and_write(self.temp_setup, find, replace)
+        self.load_text_timeline_fx(segment, self.temp_setup)
 
     def main_window(self):
         """The only popup window."""
@@ -558,19 +575,34 @@ class FindReplaceInTextFX:
 
             self.progress_window = FlameProgressWindow('Progress', len(self.segments))
 
-            for segment in self.segments:
-                if self.progress_window.cancelled:
-                    break
+            temp_folder = self.create_temp_folder()
+            self.temp_setup = os.path.join(temp_folder, TEMP_SETUP)
+
+            try:
+                last_update = 0
+
+                for count, segment in enumerate(self.segments, start=1):
+                    if self.progress_window.cancelled:
+                        break
+
+                    now = time.monotonic()
+                    update_progress = (
+                            now - last_update >= PROGRESS_INTERVAL or
+                            count == len(self.segments))
 
-                self.progress_window.set_text(
-                        f'Replacing {self.find} with {self.replace} ' +
-                        f'on {segment.name.get_value()} in ' +
-                        f'{self.get_parent_sequence(segment).name.get_value()}')
+                    if update_progress:
+                        last_update = now
+                        self.progress_window.set_text(
+                                f'Replacing {self.find} with {self.replace} ' +
+                                f'on {segment.name.get_value()} in ' +
+                                f'{self.get_parent_sequence(segment).name.get_value()}')
 
-                self.process_segment(segment, self.find, self.replace)
+                    self.process_segment(segment, self.find, self.replace)
 
-                self.progress_window.set_progress_value(
-                        self.segments.index(segment) + 1)
+                    if update_progress:
+                        self.progress_window.set_progress_value(count)
+            finally:
+                shutil.rmtree(temp_folder, ignore_errors=True)
 
             self.progress_window.close()
 
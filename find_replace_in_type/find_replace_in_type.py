@@ -35,6 +35,10 @@ To Install:
 """
 
 
+import os
+import shutil
+import tempfile
+import time
 import xml.etree.ElementTree as ETree
 
 import flame
@@ -46,7 +50,10 @@ VERSION = '.'.join([str(num) for num in VERSION_INFO])
 TITLE_VERSION = f'{TITLE} v{VERSION}'
 MESSAGE_PREFIX = '[PYTHON]'
 
-TEMP_SETUP = '/var/tmp/autodesk_flame_find_replace_in_type_temp.type_node'
+# Scratch setups go in a unique folder per run, in RAM when /dev/shm is available
+TEMP_SETUP = 'autodesk_flame_find_replace_in_type_temp.type_node'
+TEMP_PREFIX = 'autodesk_flame_find_replace_in_type_'
+PROGRESS_INTERVAL = 0.1  # seconds between progress window updates
 
 
 class FlameButton(QtWidgets.QPushButton):
@@ -577,6 +584,15 @@ class FindReplaceInTypeFX:
         """Print to the shell window."""
         print(' '.join([MESSAGE_PREFIX, string]))
 
+    @staticmethod
+    def create_temp_folder():
+        """Create a unique folder for scratch setups and return its path.
+
+        Uses /dev/shm if writable so setup round trips stay in RAM.
+        """
+        temp_root = '/dev/shm' if os.access('/dev/shm', os.W_OK) else None
+        return tempfile.mkdtemp(prefix=TEMP_PREFIX, dir=temp_root)
+
     def filter_segments(self):
         """Needed to filter the selection results of a segment.
 
@@ -604,13 +620,13 @@ class FindReplaceInTypeFX:
 
     def process_segment(self, segment, find, replace):
         """Find and replace on a single segment object."""
-        self.save_type_timeline_fx(segment, TEMP_SETUP)
+        self.save_type_timeline_fx(segment, self.temp_setup)
         self.remove_timeline_fx(segment, 'Type')
         self.add_timeline_fx(segment, 'Type')
-        type_setup_obj = FlameTypeNodeSetup(file=TEMP_SETUP)
+        type_setup_obj = FlameTypeNodeSetup(file=self.temp_setup)
         success = type_setup_obj.replace_text(find, replace)
-        type_setup_obj.write_file(TEMP_SETUP)
-        self.load_type_timeline_fx(segment, TEMP_SETUP)
+        type_setup_obj.write_file(self.temp_setup)
+        self.load_type_timeline_fx(segment, self.temp_setup)
         return success
 
     def main_window(self):
@@ -632,22 +648,37 @@ class FindReplaceInTypeFX:
 
             changes_made = 0
 
-            for segment in self.segments:
-                if self.progress_window.cancelled:
-                    break
+            temp_folder = self.create_temp_folder()
+            self.temp_setup = os.path.join(temp_folder, TEMP_SETUP)
+
+            try:
+                last_update = 0
+
+                for count, segment in enumerate(self.segments, start=1):
+                    if self.progress_window.cancelled:
+                        break
+
+                    now = time.monotonic()
+                    update_progress = (
+                            now - last_update >= PROGRESS_INTERVAL or
+                            count == len(self.segments))
 
-                self.progress_window.set_text(
-                        f'Replacing {self.find} with {self.replace} ' +
-                        f'on {segment.name.get_value()} in ' +
-                        f'{self.get_parent_sequence(segment).name.get_value()}')
+                    if update_progress:
+                        last_update = now
+                        self.progress_window.set_text(
+                                f'Replacing {self.find} with {self.replace} ' +
+                                f'on {segment.name.get_value()} in ' +
+                                f'{self.get_parent_sequence(segment).name.get_value()}')
 
-                change = self.process_segment(segment, self.find, self.replace)
+                    change = self.process_segment(segment, self.find, self.replace)
 
-                if change:
-                    changes_made += 1
+                    if change:
+                        changes_made += 1
 
-                self.progress_window.set_progress_value(
-                        self.segments.index(segment) + 1)
+                    if update_progress:
+                        self.progress_window.set_progress_value(count)
+            finally:
+                shutil.rmtree(temp_folder, ignore_errors=True)
 
             self.progress_window.close()
 
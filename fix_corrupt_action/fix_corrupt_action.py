@@ -22,6 +22,8 @@ To install:
 
 import flame
 import os
+import shutil
+import tempfile
 import traceback
 
 FOLDER_NAME = 'UC Timelines'
@@ -44,28 +46,30 @@ class FixCorruptActions():
 
     @catch_exception
     def fix_corrupt_actions(self, selection):
-        project_name = flame.project.current_project.name
-
-        # Setup temporary action path
-        action_path = f"/opt/Autodesk/project/{project_name}/tmp/auto_action_temp.action"
-        if not os.path.exists(os.path.dirname(action_path)):
-            action_path = '/var/tmp/auto_action_temp.action'
-
-        # Process all selected sequences
-        for item in selection:
-            for version in item.versions:
-                for track in version.tracks:
-                    for segment in track.segments:
-                        for tlfx in segment.effects:
-                            if tlfx.type == 'Action':
-                                print(f"Processing Action effect in {item.name}")
-                                # Save the action setup
-                                tlfx.save_setup(action_path)
-                                # Delete and recreate action
-                                flame.delete(tlfx)
-                                action_fx = segment.create_effect('Action')
-                                action_fx.load_setup(action_path)
-                                segment.colour = (50, 50, 50)  # Mark as processed
+        # Setup temporary action path. Unique per run so two Flame sessions can't collide,
+        # and in RAM when /dev/shm is available.
+        temp_root = '/dev/shm' if os.access('/dev/shm', os.W_OK) else None
+        temp_folder = tempfile.mkdtemp(prefix='fix_corrupt_action_', dir=temp_root)
+        action_path = os.path.join(temp_folder, 'auto_action_temp.action')
+
+        try:
+            # Process all selected sequences
+            for item in selection:
+                for version in item.versions:
+                    for track in version.tracks:
+                        for segment in track.segments:
+                            for tlfx in segment.effects:
+                                if tlfx.type == 'Action':
+                                    print(f"Processing Action effect in {item.name}")
+                                    # Save the action setup
+                                    tlfx.save_setup(action_path)
+                                    # Delete and recreate action
+                                    flame.delete(tlfx)
+                                    action_fx = segment.create_effect('Action')
+                                    action_fx.load_setup(action_path)
+                                    segment.colour = (50, 50, 50)  # Mark as processed
+        finally:
+            shutil.rmtree(temp_folder, ignore_errors=True)
 
         print('[=========', f'{SCRIPT_NAME} {SCRIPT_VERSION} - Complete', '=========]\n')
 
@@ -79,15 +79,21 @@ class FixInbetweenFrames():
             first_good_frame = self.first_good_frame_slider.get_value()
             print(f'First good frame: {first_good_frame}')
 
+            # Read existing node names once. New names are added as they are handed out.
+            existing_names = {str(node.name)[1:-1] for node in flame.batch.nodes}
+            name_counters = {}
+
             def get_unique_name(base_name):
                 """Return a unique node name by appending a number if necessary."""
-                existing_names = [node.name for node in flame.batch.nodes]
                 if base_name not in existing_names:
+                    existing_names.add(base_name)
                     return base_name
 
-                i = 1
+                i = name_counters.get(base_name, 1)
                 while f"{base_name}_{i}" in existing_names:
                     i += 1
+                name_counters[base_name] = i + 1
+                existing_names.add(f"{base_name}_{i}")
                 return f"{base_name}_{i}"
 
             for item in self.selection:
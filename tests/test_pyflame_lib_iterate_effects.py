@@ -0,0 +1,137 @@
+"""
+Tests for pyflame.iterate_segments and pyflame.iterate_effects.
+
+Flame and PySide6 are only available inside Flame, so stand-in modules are patched into sys.modules while these
+tests run and removed afterwards. PyFlameLib is loaded from its file under a test-only module name. Every v5.0.0
+script folder has an identical copy, so the add_mux copy is tested.
+
+Run from the repository root:
+
+    python -m pytest -q tests
+"""
+
+import importlib.util
+import os
+import sys
+import types
+import unittest
+from unittest import mock
+
+LIB_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'add_mux', 'lib', 'pyflame_lib_add_mux.py')
+
+pyflame = None
+Segment = None
+_modules_patch = None
+
+#-------------------------------------
+# [Flame/PySide6 Stand-ins]
+#-------------------------------------
+
+class _QtMeta(type):
+    def __getattr__(cls, name):
+        return mock.MagicMock()
+
+class _QtBase(metaclass=_QtMeta):
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def __getattr__(self, name):
+        return mock.MagicMock()
+
+class _QtModule(types.ModuleType):
+    def __getattr__(self, name):
+        if name[0] == 'Q' and name[1:2].isupper():
+            qt_class = type(name, (_QtBase,), {})
+            setattr(self, name, qt_class)
+            return qt_class
+        return mock.MagicMock()
+
+def _stand_in_modules() -> dict:
+    """Return stand-in flame and PySide6 modules keyed by module name."""
+
+    flame = mock.MagicMock()
+    for class_name in ['PySegment', 'PyClip', 'PySequence', 'PyFolder', 'PyLibrary', 'PyDesktop', 'PyBatch', 'PyReel', 'PyNode', 'PyWorkspace']:
+        setattr(flame, class_name, type(class_name, (), {}))
+
+    modules = {
+        'flame': flame,
+        'PySide6': mock.MagicMock(),
+        'shiboken6': mock.MagicMock(),
+        }
+    for module_name in ['QtCore', 'QtGui', 'QtWidgets']:
+        module = _QtModule(f'PySide6.{module_name}')
+        modules[f'PySide6.{module_name}'] = module
+        setattr(modules['PySide6'], module_name, module)
+
+    modules['PySide6.QtCore'].__version_info__ = (6, 5, 0)
+
+    # PyFlameLib reads the screen size when it is imported
+    screen_geometry = types.SimpleNamespace(width=lambda: 3840, height=lambda: 2160)
+    screen = types.SimpleNamespace(screenGeometry=lambda: screen_geometry, availableGeometry=lambda: screen_geometry)
+    modules['PySide6.QtGui'].QGuiApplication.primaryScreen = staticmethod(lambda: screen)
+
+    return modules
+
+def setUpModule():
+    global pyflame, Segment, _modules_patch
+
+    modules = _stand_in_modules()
+    _modules_patch = mock.patch.dict(sys.modules, modules)
+    _modules_patch.start()
+
+    spec = importlib.util.spec_from_file_location('_test_pyflame_lib', LIB_PATH)
+    lib = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(lib)
+    pyflame = lib.pyflame
+
+    class _Segment(modules['flame'].PySegment):
+        def __init__(self, *effect_types):
+            self.type = 'Video Segment'
+            self.hidden = types.SimpleNamespace(get_value=lambda: False)
+            self.record_in = types.SimpleNamespace(frame=0)
+            self.record_out = types.SimpleNamespace(frame=10)
+            self.effects = [types.SimpleNamespace(type=effect_type) for effect_type in effect_types]
+
+    Segment = _Segment
+
+def tearDownModule():
+    _modules_patch.stop()
+
+#-------------------------------------
+# [Tests]
+#-------------------------------------
+
+class TestIterateEffects(unittest.TestCase):
+
+    def test_effect_type_string_is_matched_exactly(self):
+        segment = Segment('Source Colour Mgmt', 'Colour Mgmt')
+
+        effects = [effect.type for _, effect in pyflame.iterate_effects([segment], effect_type='Source Colour Mgmt')]
+
+        self.assertEqual(effects, ['Source Colour Mgmt'])
+
+    def test_effect_type_list_is_matched_exactly(self):
+        segment = Segment('Source Colour Mgmt', 'Colour Mgmt', 'Text')
+
+        effects = [effect.type for _, effect in pyflame.iterate_effects([segment], effect_type=['Colour Mgmt', 'Text'])]
+
+        self.assertEqual(effects, ['Colour Mgmt', 'Text'])
+
+    def test_segment_effect_type_string_is_matched_exactly(self):
+        segment = Segment('Colour Mgmt')
+
+        self.assertEqual(list(pyflame.iterate_segments([segment], effect_type='Source Colour Mgmt')), [])
+
+    def test_invalid_arguments_raise_when_called(self):
+        # No next() call, arguments must be checked before the first segment is read.
+        with self.assertRaises(TypeError):
+            pyflame.iterate_effects(Segment('Text'))
+        with self.assertRaises(ValueError):
+            pyflame.iterate_effects([], track_type='subtitles')
+        with self.assertRaises(TypeError):
+            pyflame.iterate_segments([], record_range=5)
+        with self.assertRaises(TypeError):
+            pyflame.iterate_segments([], effect_type=5)
+
+if __name__ == '__main__':
+    unittest.main()